@@ -0,0 +1,94 @@
+"""
+Benchmark de extremo a extremo de OCCScraper.extract contra el servidor sustituto local
+(benchmarks/occ_standin): login, búsqueda, paginación y enriquecimiento de perfiles
+con un Chromium real, sin tocar OCC.
+Reporta tiempo total, páginas de resultados/s y perfiles/s según los contadores del servidor.
+
+Uso:
+    uv run python -m benchmarks.bench_e2e_extract --limit 500 --latency 0.05
+    uv run python -m benchmarks.bench_e2e_extract --archive data/fixtures/occ.zip --limit 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.occ_standin import StandInServer, SyntheticSite
+
+
+def run(server: StandInServer, keyword: str, location: str | None, limit: int) -> dict:
+    from src.infraestructura.scrapers.occ_scraper import OCCScraper
+
+    scraper = OCCScraper(headless=True, persist_session=False)
+
+    server.reset_stats()
+    start = time.perf_counter()
+    candidates = scraper.extract(keyword, location, limit)
+    elapsed = time.perf_counter() - start
+    stats = server.stats()
+    return {
+        "candidates": len(candidates),
+        "seconds": elapsed,
+        "pages_per_s": stats["result_pages"] / elapsed,
+        "profiles_per_s": stats["profiles"] / elapsed,
+        **stats
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark e2e de la extracción de OCC")
+    parser.add_argument("--keyword", default="Ventas")
+    parser.add_argument("--location", default="CDMX")
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument(
+        "--results", type=int, default=1000, help="Resultados por búsqueda del sitio sintético"
+    )
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument(
+        "--archive", help="Reproducir un archivo grabado en lugar del sitio sintético"
+    )
+    args = parser.parse_args()
+
+    server = StandInServer(
+        site=SyntheticSite(results_per_query=args.results),
+        archive_path=args.archive,
+        latency=args.latency
+    )
+    server.start()
+
+    # Ejecución aislada: salidas, caché, índice de vistos y checkpoints en un directorio temporal;
+    # sin límite de tasa efectivo para medir el motor y no el pacing
+    workdir = tempfile.mkdtemp(prefix="bench-e2e-")
+    os.chdir(workdir)
+    os.environ.update({
+        "OCC_BASE_URL": server.base_url,
+        "OCC_USERNAME": "bench@example.com",
+        "OCC_PASSWORD": "bench",
+        "OCC_PROFILE_CACHE": "false",
+        "OCC_SEEN_INDEX": "false",
+        "OCC_CHECKPOINTS": "false",
+        "OCC_RATE_INITIAL": "1000",
+        "OCC_RATE_MAX": "1000"
+    })
+
+    print(
+        f"Servidor: {server.base_url} (latencia {args.latency * 1000:.0f} ms) | directorio: "
+        f"{workdir}"
+    )
+    print(f"{'cands':>6} {'seg':>8} {'pág':>5} {'pág/s':>7} {'perfiles':>9} {'perf/s':>7}")
+    try:
+        result = run(server, args.keyword, args.location, args.limit)
+        print(
+            f"{result['candidates']:>6} {result['seconds']:>8.2f} {result['result_pages']:>5}"
+            f" {result['pages_per_s']:>7.2f} {result['profiles']:>9} "
+            f"{result['profiles_per_s']:>7.2f}"
+        )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
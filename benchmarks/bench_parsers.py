@@ -0,0 +1,270 @@
+"""
+Micro-benchmarks de las partes CPU del scraper de OCC sobre corpus sintéticos
+(páginas de resultados y perfiles con la estructura de OCC, de 1 a 10k candidatos):
+- `_extract_card_details` (vía `_parse_cards`) y `_extract_candidates` en modos html y evaluate
+- `_parse_candidate_html` por la ruta de __NEXT_DATA__ y por el fallback del DOM
+- `JsonExporter.save` y `Logger._log`
+
+Reporta latencia (mediana) y memoria pico (tracemalloc) por función y tamaño, y compara
+contra la línea base guardada para detectar regresiones al cambiar la lógica de parseo.
+
+Uso:
+    uv run python -m benchmarks.bench_parsers                  # compara con la línea base
+    uv run python -m benchmarks.bench_parsers --save-baseline  # regenera la línea base
+    uv run python -m benchmarks.bench_parsers --sizes 1 10 100 --only cards
+
+La línea base depende de la máquina, por eso no se versiona: generarla en cada equipo
+antes de comparar. Sin línea base (o generada con otro motor) la comparación termina con
+código de salida 2 para que no pase en silencio.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.bench_profile_sections import build_profile_html
+from benchmarks.occ_standin.synthetic import SyntheticSite
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "parsers.json")
+DEFAULT_SIZES = [1, 10, 100, 1000, 10000]
+CARDS_LOCATION = "LOC-21957"
+# El fallback por DOM tarda ~15 ms por perfil: sin --full se mide hasta 1000 perfiles
+SLOW_CASES_MAX_SIZE = {"profile_dom_fallback": 1000}
+
+
+class FakePage:
+    """
+    Página mínima para `_extract_candidates`: HTML serializado y el arreglo JSON
+    que devolvería CARD_EXTRACTION_JS en el navegador
+    """
+
+    def __init__(self, html: str, raw_cards: list[dict]):
+        self.html = html
+        self.raw_cards = raw_cards
+
+    def content(self) -> str:
+        return self.html
+
+    def evaluate(self, script: str, arg=None) -> list[dict]:
+        return self.raw_cards
+
+
+def build_scraper(parser_engine: str):
+    """
+    OCCScraper sin navegador ni logs (la consola no debe contar en la medición)
+    """
+    from src.infraestructura.logging import Logger
+    from src.infraestructura.scrapers.occ_scraper import OCCScraper
+
+    scraper = OCCScraper(parser_engine=parser_engine, persist_session=False)
+    scraper.logger = Logger(handlers=[])
+    return scraper
+
+
+def build_cases(scraper, sizes: list[int], workdir: str) -> dict:
+    """
+    Casos por función: {nombre: {tamaño: (función, n_elementos)}}.
+    Los insumos se generan antes de medir.
+    """
+    from src.infraestructura.logging import ConsoleLogHandler, JsonLogHandler, Logger
+    from src.infraestructura.persistence.json_exporter import JsonExporter
+
+    site = SyntheticSite(results_per_query=max(sizes))
+    cases: dict[str, dict] = {name: {} for name in (
+        "cards", "extract_candidates_html", "extract_candidates_evaluate",
+        "profile_next_data", "profile_dom_fallback", "json_export", "logger"
+    )}
+
+    profile_next_data = site.profile("10000123")
+    profile_dom = build_profile_html(20)
+
+    exporter = JsonExporter()
+    exporter.logger = Logger(handlers=[])
+    sink = io.StringIO()
+    logger = Logger(
+        handlers=[ConsoleLogHandler(), JsonLogHandler(os.path.join(workdir, "bench.jsonl"))]
+    )
+
+    def log_many(n: int) -> None:
+        with contextlib.redirect_stdout(sink):
+            for index in range(n):
+                logger._log(
+                    "INFO", "extract", f"Agregados {index} candidatos nuevos.", {"page": index}
+                )
+        sink.seek(0)
+        sink.truncate()
+
+    for size in sizes:
+        html, _ = site.results("Ventas", CARDS_LOCATION, size, 1)
+        cards = scraper.parser.parse_links(html, scraper.CARD_HREF_FRAGMENT)
+        raw_cards = [scraper._card_to_raw(card) for card in cards]
+        page = FakePage(html, raw_cards)
+        candidates = [
+            scraper._merge_details(card, scraper._parse_candidate_html(profile_next_data))
+            for card in scraper._build_cards(raw_cards)
+        ]
+        output = os.path.join(workdir, f"export_{size}.json")
+
+        cases["cards"][size] = (lambda html=html: scraper._parse_cards(html), size)
+        cases["extract_candidates_html"][size] = (
+            lambda page=page: _with_mode(scraper, "html", page), size
+        )
+        cases["extract_candidates_evaluate"][size] = (
+            lambda page=page: _with_mode(scraper, "evaluate", page), size
+        )
+        cases["profile_next_data"][size] = (
+            lambda n=size: [scraper._parse_candidate_html(profile_next_data) for _ in range(n)],
+            size
+        )
+        cases["profile_dom_fallback"][size] = (
+            lambda n=size: [scraper._parse_candidate_html(profile_dom) for _ in range(n)], size
+        )
+        cases["json_export"][size] = (
+            lambda data=candidates, output=output: exporter.save(data, output), size
+        )
+        cases["logger"][size] = (lambda n=size: log_many(n), size)
+
+    return cases
+
+
+def _with_mode(scraper, mode: str, page: FakePage):
+    scraper.card_extraction_mode = mode
+    return scraper._extract_candidates(page)
+
+
+def measure(func, repeats: int) -> tuple[float, float]:
+    """
+    Mediana de `repeats` ejecuciones (ms) y memoria pico de una ejecución aparte (KB)
+    """
+    if repeats > 1:
+        func()  # calentamiento (imports perezosos, cachés de selectores)
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return statistics.median(timings), peak / 1024
+
+
+def compare(
+    results: dict, baseline: dict, tolerance: float, memory_tolerance: float, floor_ms: float
+) -> list[str]:
+    """
+    Regresiones respecto a la línea base. Las diferencias menores a `floor_ms` se
+    ignoran (ruido de los tamaños pequeños).
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get("results", {}).get(key)
+        if not previous:
+            continue
+        if (
+            current["ms"] > previous["ms"] * (1 + tolerance)
+            and current["ms"] - previous["ms"] > floor_ms
+        ):
+            regressions.append(f"{key}: {previous['ms']:.2f} ms -> {current['ms']:.2f} ms")
+        if (
+            current["peak_kb"] > previous["peak_kb"] * (1 + memory_tolerance)
+            and current["peak_kb"] - previous["peak_kb"] > 64
+        ):
+            regressions.append(
+                f"{key}: {previous['peak_kb']:.0f} KB -> {current['peak_kb']:.0f} KB"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de parseo de OCC")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", help="Ejecutar solo estas funciones")
+    parser.add_argument("--full", action="store_true", help="Medir también los casos lentos a 10k")
+    parser.add_argument(
+        "--parser", default="html.parser", help="Motor de parseo (html.parser o lxml)"
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Guardar los resultados como línea base"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.3, help="Regresión de tiempo tolerada (0.3 = +30%%)"
+    )
+    parser.add_argument("--memory-tolerance", type=float, default=0.2)
+    parser.add_argument("--floor-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    # Ruta absoluta antes de cambiar al directorio temporal
+    args.baseline = os.path.abspath(args.baseline)
+
+    # El scraper se construye sin índices ni cachés en disco, dentro de un directorio temporal
+    workdir = tempfile.mkdtemp(prefix="bench-parsers-")
+    os.chdir(workdir)
+    os.environ.update({"OCC_PROFILE_CACHE": "false", "OCC_SEEN_INDEX": "false"})
+
+    scraper = build_scraper(args.parser)
+    cases = build_cases(scraper, sorted(set(args.sizes)), workdir)
+
+    results = {}
+    print(f"motor: {scraper.parser.engine}")
+    print(f"{'función':<28} {'n':>6} {'mediana ms':>11} {'µs/elem':>9} {'pico KB':>9}")
+    for name, by_size in cases.items():
+        if args.only and name not in args.only:
+            continue
+        for size, (func, items) in by_size.items():
+            if not args.full and size > SLOW_CASES_MAX_SIZE.get(name, size):
+                continue
+            repeats = 5 if size <= 100 else 3 if size <= 1000 else 1
+            median_ms, peak_kb = measure(func, repeats)
+            results[f"{name}@{size}"] = {"ms": round(median_ms, 3), "peak_kb": round(peak_kb, 1)}
+            print(
+                f"{name:<28} {size:>6} {median_ms:>11.2f} {median_ms * 1000 / items:>9.1f} "
+                f"{peak_kb:>9.0f}"
+            )
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        baseline = {
+            "machine": {"python": platform.python_version(), "platform": platform.platform()},
+            "parser_engine": scraper.parser.engine,
+            "results": results
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False)
+        print(f"Línea base guardada en {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"Sin línea base en {args.baseline}; ejecutar con --save-baseline para crearla.")
+        sys.exit(2)
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("parser_engine") != scraper.parser.engine:
+        print(f"La línea base se generó con {baseline.get('parser_engine')}; no se compara.")
+        sys.exit(2)
+
+    regressions = compare(results, baseline, args.tolerance, args.memory_tolerance, args.floor_ms)
+    if regressions:
+        print("Regresiones respecto a la línea base:")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+    print("Sin regresiones respecto a la línea base.")
+
+
+if __name__ == "__main__":
+    main()
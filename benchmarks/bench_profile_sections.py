@@ -0,0 +1,104 @@
+"""
+Benchmark del indexado de secciones del perfil de OCC.
+Compara las búsquedas independientes por campo (una pasada del DOM por encabezado)
+contra ProfileSectionIndex (una sola pasada) sobre perfiles sintéticos grandes.
+
+Uso:
+    uv run python -m benchmarks.bench_profile_sections
+"""
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bs4 import BeautifulSoup
+
+from src.infraestructura.scrapers.profile_sections import ProfileSectionIndex
+
+HEADERS = {
+    "experience": "Experiencia laboral",
+    "salary": "Salario deseado",
+    "skills": "Habilidad",
+    "specialty": "Área de especialidad"
+}
+
+
+def build_profile_html(n_blocks: int) -> str:
+    """
+    Perfil sintético con `n_blocks` bloques de relleno antes de cada sección,
+    reproduciendo la estructura de clases observada en OCC
+    """
+    filler = "".join(
+        f'<div class="c0121"><p>Texto de relleno {i}</p><p>Detalle {i}</p></div>'
+        for i in range(n_blocks)
+    )
+
+    def section(title: str, body: str) -> str:
+        return (
+            f'<div class="c0117 c0126 c011001"><div class="c012217"><p>{title}</p></div></div>'
+            f'<div class="c0117 c0121">{body}</div>'
+        )
+
+    experience = "".join(
+        f"<div><p>Puesto {i} en Empresa {i}</p><p>2020 - 2022</p><p>Descripción {i}</p></div>"
+        for i in range(20)
+    )
+    skills = "".join(f"<label><p>Skill {i}</p></label>" for i in range(30))
+
+    return (
+        "<html><body><h2>Nombre Apellido</h2>"
+        + filler
+        + section("Experiencia laboral", experience)
+        + filler
+        + section("Salario deseado", "<p>$25,000</p>")
+        + filler
+        + section("Habilidad", skills)
+        + section("Área de especialidad", "<label><p>Ventas</p></label>")
+        + filler
+        + "<p>CV: 123456 - Última actividad hace 3 días</p>"
+        + "</body></html>"
+    )
+
+
+def legacy_lookup(soup) -> tuple:
+    """
+    Estrategia anterior: un `soup.find(lambda ...)` por campo más un recorrido de todos los <p>
+    """
+    found = {
+        key: soup.find(lambda tag, text=text: tag.name == "p" and text in tag.get_text())
+        for key, text in HEADERS.items()
+    }
+    activity = None
+    for p in soup.find_all("p"):
+        activity = ProfileSectionIndex._activity_from(p)
+        if activity:
+            break
+    return found, activity
+
+
+def indexed_lookup(soup) -> tuple:
+    """
+    Estrategia actual: un solo recorrido con ProfileSectionIndex
+    """
+    index = ProfileSectionIndex.build(soup, HEADERS, collect_activity=True)
+    return {key: index.header(key) for key in HEADERS}, index.activity_text
+
+
+def main() -> None:
+    print(f"{'bloques':>8} {'<p>':>7} {'legacy ms':>10} {'index ms':>10} {'speedup':>8}")
+    for n_blocks in (100, 1000, 5000):
+        soup = BeautifulSoup(build_profile_html(n_blocks), "html.parser")
+
+        # Ambas estrategias deben encontrar exactamente los mismos nodos
+        assert legacy_lookup(soup) == indexed_lookup(soup)
+
+        runs = 5
+        legacy = timeit.timeit(lambda: legacy_lookup(soup), number=runs) / runs * 1000
+        indexed = timeit.timeit(lambda: indexed_lookup(soup), number=runs) / runs * 1000
+        n_ps = len(soup.find_all("p"))
+        print(f"{n_blocks:>8} {n_ps:>7} {legacy:>10.2f} {indexed:>10.2f} {legacy / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
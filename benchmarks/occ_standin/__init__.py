@@ -0,0 +1,4 @@
+from benchmarks.occ_standin.server import StandInServer
+from benchmarks.occ_standin.synthetic import SyntheticSite
+
+__all__ = ["StandInServer", "SyntheticSite"]
@@ -0,0 +1,41 @@
+r"""
+Graba una extracción real de OCC en un archivo de fixtures para el servidor sustituto.
+Usa las credenciales del .env; el archivo contiene los datos de los candidatos
+extraídos, por lo que no debe versionarse ni compartirse.
+
+Uso:
+    uv run python -m benchmarks.occ_standin.record "Ventas" --location CDMX --limit 50 \
+        --out data/fixtures/occ.zip
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Graba respuestas de OCC para reproducirlas sin conexión"
+    )
+    parser.add_argument("keyword")
+    parser.add_argument("--location")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--out", default="data/fixtures/occ.zip")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    # El scraper lee OCC_RECORD_ARCHIVE al construirse; la caché de perfiles se omite
+    # para que todos los perfiles pasen por la red y queden grabados
+    os.environ["OCC_RECORD_ARCHIVE"] = args.out
+    os.environ["OCC_PROFILE_CACHE"] = "false"
+
+    from src.infraestructura.scrapers.occ_scraper import OCCScraper
+
+    scraper = OCCScraper(headless=True, persist_session=False)
+    candidates = scraper.extract(args.keyword, args.location, args.limit)
+    print(f"{len(candidates)} candidatos extraídos; archivo: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Servidor HTTP local que sustituye a OCC en benchmarks de extremo a extremo.
+- Modo sintético: genera login, búsqueda, resultados y perfiles a cualquier escala.
+- Modo replay: reproduce un archivo grabado con OCC_RECORD_ARCHIVE
+  (las URLs absolutas del origen grabado se reescriben al origen local).
+La latencia por respuesta es configurable para simular la red del portal.
+
+Uso:
+    uv run python -m benchmarks.occ_standin.server --results 2000 --latency 0.05
+    uv run python -m benchmarks.occ_standin.server --archive data/fixtures/occ.zip
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from benchmarks.occ_standin.synthetic import SESSION_COOKIE, SyntheticSite
+from src.infraestructura.browser.recorder import ResponseRecorder
+
+TEXT_TYPES = ("text/", "application/json", "application/javascript")
+
+
+class StandInServer:
+    """
+    Servidor sustituto en un hilo de fondo: `start()` retorna la URL base para OCC_BASE_URL.
+    Los contadores (`stats()`) permiten calcular páginas/s y perfiles/s del flujo completo.
+    """
+
+    def __init__(
+        self,
+        site: SyntheticSite | None = None,
+        archive_path: str | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        self.site = site or SyntheticSite()
+        self.latency = latency
+        self.jitter = jitter
+        self.recorded_origin = None
+        self.entries: dict[str, dict] = {}
+        self._by_path: dict[str, dict] = {}
+        if archive_path:
+            self.recorded_origin, self.entries = ResponseRecorder.load(archive_path)
+            for entry in self.entries.values():
+                self._by_path.setdefault(urlsplit(entry["path"]).path, entry)
+
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "result_pages": 0, "cards": 0, "profiles": 0, "not_found": 0}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def origin(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.origin}/empresas/"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="occ-standin", daemon=True
+        )
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = {key: 0 for key in self._stats}
+
+    def delay(self) -> None:
+        wait = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def replay(self, path: str) -> tuple[int, str, bytes] | None:
+        """
+        Respuesta grabada para la ruta (coincidencia exacta y, si no, solo por path)
+        """
+        entry = self.entries.get(ResponseRecorder.entry_key("GET", path))
+        if entry is None:
+            entry = self._by_path.get(urlsplit(path).path)
+        if entry is None:
+            return None
+
+        body = entry["body"]
+        content_type = entry["content_type"] or "text/html"
+        if content_type.startswith(TEXT_TYPES):
+            body = body.replace(self.recorded_origin.encode("utf-8"), self.origin.encode("utf-8"))
+        return entry["status"], content_type, body
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _logged_in(self) -> bool:
+                return f"{SESSION_COOKIE}=1" in (self.headers.get("Cookie") or "")
+
+            def _send(
+                self,
+                status: int,
+                body: bytes = b"",
+                content_type: str = "text/html; charset=utf-8",
+                headers: dict | None = None
+            ):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _redirect(self, location: str, cookie: str | None = None):
+                headers = {"Location": location}
+                if cookie is not None:
+                    headers["Set-Cookie"] = cookie
+                self._send(303, headers=headers)
+
+            def do_POST(self):
+                server.count("requests")
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                server.delay()
+                # Cualquier formulario (login) abre la sesión y vuelve al home
+                self._redirect("/empresas/", f"{SESSION_COOKIE}=1; Path=/")
+
+            def do_GET(self):
+                server.count("requests")
+                server.delay()
+                if server.entries:
+                    replayed = server.replay(self.path)
+                    if replayed is None:
+                        server.count("not_found")
+                        self._send(404, b"Not found")
+                        return
+                    status, content_type, body = replayed
+                    if "/candidatos/cv/" in self.path:
+                        server.count("profiles")
+                    elif "/candidatos/buscar" in self.path:
+                        server.count("result_pages")
+                    self._send(status, body, content_type)
+                    return
+                self._synthetic()
+
+            def _synthetic(self):
+                site = server.site
+                url = urlsplit(self.path)
+                path = url.path.rstrip("/")
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                logged_in = self._logged_in()
+
+                if path in ("", "/empresas"):
+                    self._send(200, site.home(logged_in).encode("utf-8"))
+                elif path == "/empresas/login":
+                    self._send(200, site.login().encode("utf-8"))
+                elif path == "/empresas/logout":
+                    self._redirect("/empresas/", f"{SESSION_COOKIE}=; Path=/; Max-Age=0")
+                elif not logged_in:
+                    self._redirect("/empresas/")
+                elif path == "/empresas/talento":
+                    self._send(200, site.talent().encode("utf-8"))
+                elif path == "/empresas/candidatos/buscar":
+                    html, cards = site.results(
+                        query.get("q", ""),
+                        query.get("loc", ""),
+                        int(query.get("size") or 20),
+                        int(query.get("page") or 1)
+                    )
+                    server.count("result_pages")
+                    server.count("cards", cards)
+                    self._send(200, html.encode("utf-8"))
+                elif path.startswith("/empresas/candidatos/cv/"):
+                    server.count("profiles")
+                    self._send(200, site.profile(path.rsplit("/", 1)[-1]).encode("utf-8"))
+                else:
+                    server.count("not_found")
+                    self._send(404, b"Not found")
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor local sustituto de OCC")
+    parser.add_argument(
+        "--archive",
+        help="Archivo grabado (.zip) a reproducir; sin él se generan páginas sintéticas"
+    )
+    parser.add_argument(
+        "--results", type=int, default=500, help="Resultados por búsqueda (modo sintético)"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Latencia fija por respuesta en segundos"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Latencia aleatoria adicional máxima en segundos"
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = StandInServer(
+        site=SyntheticSite(results_per_query=args.results),
+        archive_path=args.archive,
+        latency=args.latency,
+        jitter=args.jitter,
+        port=args.port
+    )
+    print(f"OCC_BASE_URL={server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(server.stats())
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
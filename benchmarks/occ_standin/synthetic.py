@@ -0,0 +1,173 @@
+"""
+Páginas sintéticas con la misma estructura que OCC usa el scraper
+(selectores de login, búsqueda, tarjetas de resultados y __NEXT_DATA__ de perfiles).
+Los resultados son deterministas: la misma búsqueda produce siempre los mismos ids.
+"""
+import html
+import json
+import math
+import zlib
+
+SESSION_COOKIE = "standin_session"
+
+LOCATIONS = {
+    "LOC-21957": "Ciudad de México",
+    "LOC-60991": "Estado de México",
+    "LOC-83091": "Nuevo León",
+    "LOC-87725": "Oaxaca",
+    "LOC-99788": "Querétaro"
+}
+
+ROLES = [
+    "Ejecutivo de ventas",
+    "Asesor financiero",
+    "Analista de datos",
+    "Promotor",
+    "Gerente comercial"
+]
+COMPANIES = ["Seguros Atlas", "GNP", "Banorte", "Grupo KC", "Metlife"]
+SKILLS = ["Ventas", "Negociación", "Excel", "Atención al cliente", "CRM", "Prospección"]
+
+
+class SyntheticSite:
+    """
+    Genera el HTML del portal para cualquier volumen de resultados.
+    - `results_per_query`: total de candidatos de cada búsqueda (palabra clave + ubicación).
+    - `experience_items`: experiencias por perfil (controla el tamaño del documento).
+    """
+
+    def __init__(self, results_per_query: int = 500, experience_items: int = 5):
+        self.results_per_query = results_per_query
+        self.experience_items = experience_items
+
+    @staticmethod
+    def _page(title: str, body: str, logged_in: bool) -> str:
+        header = ""
+        if logged_in:
+            # "Talento" va antes que cualquier otro texto que lo contenga ("Buscar talento")
+            header = (
+                '<nav><a href="/empresas/talento">Talento</a>'
+                '<div><button type="button">Sistemas</button>'
+                '<a href="/empresas/logout">Cerrar sesión</a></div></nav>'
+            )
+        return (
+            "<!DOCTYPE html><html lang=\"es\"><head><meta "
+            f"charset=\"utf-8\"><title>{title}</title></head>"
+            f"<body>{header}<main>{body}</main></body></html>"
+        )
+
+    def home(self, logged_in: bool) -> str:
+        body = "<h1>OCC Empresas</h1>"
+        if not logged_in:
+            body += '<a id="homehirers_inicio_signup" href="/empresas/login">Iniciar sesión</a>'
+        return self._page("Empresas", body, logged_in)
+
+    def login(self) -> str:
+        body = (
+            '<form method="post" action="/empresas/login">'
+            '<input name="user" data-testid="login__user">'
+            '<input name="password" type="password" data-testid="login__password">'
+            '<button id="login_creacioncuenta_iniciasesion" type="submit">Iniciar sesión</button>'
+            "</form>"
+        )
+        return self._page("Iniciar sesión", body, logged_in=False)
+
+    def talent(self) -> str:
+        options = '<option value="">Todo México</option>' + "".join(
+            f'<option value="{slug}">{name}</option>' for slug, name in LOCATIONS.items()
+        )
+        body = (
+            '<form method="get" action="/empresas/candidatos/buscar">'
+            f'<select id="Searchpage_Estado" name="loc">{options}</select>'
+            '<input id="Searchpage_Puesto" name="q">'
+            '<input type="hidden" name="size" value="20">'
+            '<button type="submit" data-testid="form__submit">Buscar talento</button>'
+            "</form>"
+        )
+        return self._page("Talento", body, logged_in=True)
+
+    def result_ids(self, keyword: str, location: str) -> list[str]:
+        """
+        Ids de todos los resultados de una búsqueda (deterministas por consulta)
+        """
+        base = zlib.crc32(f"{keyword.lower()}|{location}".encode("utf-8")) % 10_000_000
+        return [str(10_000_000 + base * 1000 + index) for index in range(self.results_per_query)]
+
+    def _card(self, candidate_id: str, location: str) -> str:
+        n = int(candidate_id)
+        role = ROLES[n % len(ROLES)]
+        company = COMPANIES[n % len(COMPANIES)]
+        place = LOCATIONS.get(location) or list(LOCATIONS.values())[n % len(LOCATIONS)]
+        return (
+            f'<a id="cv|{candidate_id}" href="/empresas/candidatos/cv/{candidate_id}"><div>'
+            "<div></div>"
+            "<div>"
+            f"<div><p>{role}</p></div>"
+            f'<div><svg class="atomic__location"></svg><p>{place}</p>'
+            f"<p>Actualizado hace {n % 30 + 1} días</p></div>"
+            f"<div><p>{role} en {company}</p><p>2019 - 2023</p></div>"
+            "<div><p>Licenciatura en Administración</p></div>"
+            "</div>"
+            "</div></a>"
+        )
+
+    def results(self, keyword: str, location: str, size: int, page: int) -> tuple[str, int]:
+        """
+        Página de resultados y número de tarjetas que contiene
+        """
+        ids = self.result_ids(keyword, location)
+        size = max(1, size)
+        pages = max(1, math.ceil(len(ids) / size))
+        chunk = ids[(page - 1) * size: page * size] if 1 <= page <= pages else []
+
+        def link(**overrides) -> str:
+            query = {"q": keyword, "loc": location, "size": size, "page": page} | overrides
+            return "/empresas/candidatos/buscar?" + "&amp;".join(
+                f"{key}={html.escape(str(value))}" for key, value in query.items()
+            )
+
+        body = (
+            f'<a id="Resultpage_Resultados50" href="{link(size=50, page=1)}">50</a>'
+            '<section '
+            f'id="results-page">{"".join(self._card(cid, location) for cid in chunk)}</section>'
+        )
+        if page < pages:
+            body += f'<a id="Resultpage_PaginadorPaginaSiguiente" href="{link(page=page +
+            1)}">Siguiente</a>'
+        return self._page("Resultados", body, logged_in=True), len(chunk)
+
+    def profile(self, candidate_id: str) -> str:
+        n = (
+            int(candidate_id)
+            if candidate_id.isdigit()
+            else zlib.crc32(candidate_id.encode("utf-8"))
+        )
+        resume = {
+            "name": f"Candidato{n % 997}",
+            "surname": f"Apellido{n % 389}",
+            "jobTitle": ROLES[n % len(ROLES)],
+            "salary": f"${10_000 + (n % 40) * 1000:,}",
+            "updatedAt": f"2026-{n % 12 + 1:02d}-{n % 28 + 1:02d}",
+            "abilities": [{"description": SKILLS[(n + i) % len(SKILLS)]} for i in range(4)],
+            "professionalexperiences": [
+                {
+                    "jobTitle": ROLES[(n + i) % len(ROLES)],
+                    "company": COMPANIES[(n + i) % len(COMPANIES)],
+                    "startDate": f"{2010 + i}-01",
+                    "endDate": f"{2011 + i}-12",
+                    "description": "Prospección y seguimiento de cartera de clientes. " * 3
+                }
+                for i in range(self.experience_items)
+            ],
+            "experienceAreas": [{"description": "Ventas"}]
+        }
+        next_data = json.dumps(
+            {"props": {"initialState": {"resume": {"resume": resume}}}}, ensure_ascii=False
+        ).replace("</", "<\\/")
+        body = (
+            f"<h2>{resume['name']} {resume['surname']}</h2>"
+            f'<p data-testid="contact-email__data-cv">candidato{candidate_id}@example.com</p>'
+            f'<p data-testid="contact-phone__data-cv">55{n % 100_000_000:08d}</p>'
+            f'<script id="__NEXT_DATA__" type="application/json">{next_data}</script>'
+        )
+        return self._page("Perfil", body, logged_in=True)
@@ -1,16 +1,60 @@
 import sys
 import os
+import time
 
 # Agregar el directorio raíz del proyecto al sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.application.services import CandidateSearchService
+from src.infraestructura.browser.pool import BrowserPool
+from src.infraestructura.persistence.job_queue import SearchJobQueue
 from src.infraestructura.persistence.json_exporter import JsonExporter
 from src.infraestructura.scrapers.occ_scraper import OCCScraper
 from src.infraestructura.scrapers.pandape_scraper import PandapeScraper
 
+def run_as_job(keyword: str, time_budget: float | None) -> None:
+    """
+    Encola la búsqueda para los procesos worker y muestra su avance hasta que termina.
+    Ctrl+C deja de esperar sin cancelar: el trabajo sigue en la cola.
+    """
+    job_queue = SearchJobQueue()
+    job_id = job_queue.submit(keyword, sources=["occ", "pandape"], time_budget=time_budget)
+    print(f"Búsqueda encolada: {job_id} (ejecutar `python worker.py` si no hay workers activos)")
+
+    last = None
+    try:
+        while True:
+            job = job_queue.get(job_id)
+            line = f"[{job.status}] {job.progress.get('candidates', 0)} candidatos recibidos"
+            if line != last:
+                print(line)
+                last = line
+            if job.finished:
+                break
+            time.sleep(2)
+    except KeyboardInterrupt:
+        print(f"\nLa búsqueda {job_id} sigue en la cola.")
+        return
+
+    if job.error:
+        print(f"❌ {job.error}")
+    if job.total:
+        print(f"\n✅ Se encontraron {job.total} candidatos.")
+        print(f"💾 Datos guardados en: {job.result_file}")
+    else:
+        print("\nNo se encontraron candidatos.")
+    if job.partial:
+        print("⚠️ Resultado parcial (tiempo agotado o cancelación).")
+
 def main():
     print("=== Automatizador de Reclutamiento ===")
+    use_jobs = os.getenv("SEARCH_JOBS", "false").lower() == "true"
+
+    # Los navegadores se lanzan mientras se captura la palabra clave
+    browser_pool = None
+    if not use_jobs and os.getenv("BROWSER_POOL", "true").lower() == "true":
+        browser_pool = BrowserPool.shared()
+        browser_pool.warm()
     
     keyword = input("Ingresa el puesto o palabra clave: ")
     
@@ -18,36 +62,64 @@ def main():
         print("Debes ingresar una palabra clave.")
         return
 
+    budget = input("Tiempo máximo en minutos (Enter para no limitar): ").strip()
+    time_budget = float(budget) * 60 if budget else None
+
+    # Con cola de búsquedas el scraping lo ejecuta un proceso worker
+    if use_jobs:
+        run_as_job(keyword, time_budget)
+        return
+
     exporter = JsonExporter()
     service = CandidateSearchService(exporter)
     
     # Agregar scrapers
-    service.add_scraper(OCCScraper())
-    service.add_scraper(PandapeScraper())
+    service.add_scraper(OCCScraper(browser_pool=browser_pool))
+    service.add_scraper(PandapeScraper(browser_pool=browser_pool))
     
     try:
-        results = service.search_candidates(keyword)
-        
-        if results:
-            print(f"\n✅ Se encontraron {len(results)} candidatos.")
-            
-            # Mostrar resultados
-            for i, candidate in enumerate(results, 1):
-                print(f"\n--- Candidato {i} ---")
-                print(f"Nombre: {candidate.name}")
-                print(f"Email: {candidate.email}")
-                print(f"Teléfono: {candidate.phone}")
-                print(f"Fuente: {candidate.source}")
-                print(f"URL: {candidate.url}")
-                print(f"Fecha de extracción: {candidate.extracted_at}")
-            
-            # Exportar a JSON
-            filename = f"candidatos_{keyword.replace(' ', '_')}.json"
-            exporter.save(results, filename)
-            print(f"\n💾 Datos guardados en: {filename}")
-        else:
-            print("\nNo se encontraron candidatos.")
-            
+        # Los candidatos se imprimen conforme cada portal los entrega
+        shown = 0
+        # Ctrl+C detiene la búsqueda: los scrapers se cancelan y se conserva lo obtenido
+        for event in service.search_candidates_stream(keyword, time_budget=time_budget):
+            if event.kind == "candidates":
+                for candidate in event.candidates:
+                    shown += 1
+                    print(f"\n--- Candidato {shown} ({event.source}) ---")
+                    print(f"Puesto: {candidate.position}")
+                    print(f"Ubicación: {candidate.location}")
+                    print(f"URL: {candidate.url}")
+            elif event.kind == "profile_enriched":
+                for candidate in event.candidates:
+                    print(
+                        f"  ✔ Perfil enriquecido: {candidate.name} | {candidate.email or '-'} | "
+                        f"{candidate.phone or '-'}"
+                    )
+            elif event.kind == "page_done":
+                print(
+                    f"[{event.source}] Página {event.data.get('page')} lista "
+                    f"({event.data.get('total')} candidatos)"
+                )
+            elif event.kind == "scraper_finished":
+                partial = (
+                    f" (parcial: {event.data['stop_reason']})" if event.data.get("partial") else ""
+                )
+                print(f"[{event.source}] Terminado: {event.data.get('total')} candidatos{partial}")
+            elif event.kind == "scraper_error":
+                print(f"[{event.source}] ❌ Error: {event.message}")
+            elif event.kind == "search_finished":
+                if event.data.get("total"):
+                    print(f"\n✅ Se encontraron {event.data['total']} candidatos.")
+                    print(f"💾 Datos guardados en: {event.data['file']}")
+                else:
+                    print("\nNo se encontraron candidatos.")
+                if event.data.get("partial"):
+                    print(
+                        f"⚠️ Resultado parcial, fuentes detenidas: {event.data['partial_sources']}"
+                    )
+
+    except KeyboardInterrupt:
+        print("\n⏹ Búsqueda cancelada.")
     except Exception as e:
         print(f"\n❌ Error: {e}")
 
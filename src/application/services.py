@@ -1,17 +1,53 @@
-from typing import List
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from typing import Callable, Iterator, List
+from src.domain.cancellation import CancellationToken
 from src.domain.interfaces import BaseScraper, DataExporter
-from src.domain.models import CandidateSchema
+from src.domain.models import CandidateSchema, SearchEvent
 from src.infraestructura.logging import Logger, ConsoleLogHandler
+from src.infraestructura.persistence.identity_index import CandidateIdentityIndex, IdentityMerger
+from src.infraestructura.persistence.jsonl_journal_exporter import JsonlJournalExporter
+from src.infraestructura.persistence.search_cache import SearchResultCache
+from src.infraestructura.scrapers.factory import create_scraper
 
 
 class CandidateSearchService:
     """
     Servicio de aplicación que orquesta el proceso de búsqueda de candidatos
     """
-    def __init__(self, exporter: DataExporter):
+    def __init__(
+        self,
+        exporter: DataExporter,
+        identity_index: CandidateIdentityIndex | None = None,
+        search_cache: SearchResultCache | None = None
+    ):
         self.scrapers: List[BaseScraper] = []
         self.exporter = exporter
         self.logger = Logger(handlers=[ConsoleLogHandler()])
+        # Índice de identidades: la misma persona en varias fuentes o búsquedas se exporta una vez
+        if identity_index is None and os.getenv("IDENTITY_INDEX", "true").lower() == "true":
+            identity_index = CandidateIdentityIndex()
+        self.identity_index = identity_index
+        # Caché de resultados: una búsqueda repetida se responde sin abrir el navegador
+        if search_cache is None and os.getenv("SEARCH_CACHE", "true").lower() == "true":
+            search_cache = SearchResultCache()
+        self.search_cache = search_cache
+        # Los scrapers se ejecutan en hilos simultáneos (cada uno con su propio Playwright)
+        self.parallel_scrapers = os.getenv("SERVICE_PARALLEL_SCRAPERS", "true").lower() == "true"
+        # Eventos en tránsito de la búsqueda en streaming (si el consumidor se atrasa, los scrapers
+        # esperan)
+        self.stream_queue_size = max(1, int(os.getenv("SERVICE_STREAM_QUEUE_SIZE", "200")))
+        # Plazo por scraper (segundos, vacío = sin plazo) y margen para que se detenga de forma
+        # cooperativa; pasado el margen se deja de esperar al scraper y el resultado es parcial
+        self.scraper_time_budget = float(os.getenv("SERVICE_SCRAPER_TIME_BUDGET") or 0) or None
+        self.stop_grace_seconds = float(os.getenv("SERVICE_STOP_GRACE_SECONDS", "30"))
+        # Fuentes cuyo resultado fue parcial en la última búsqueda y el motivo ("deadline",
+        # "cancelled")
+        self.partial_sources: dict[str, str] = {}
 
     def add_scraper(self, scraper: BaseScraper):
         """
@@ -23,42 +59,619 @@ class CandidateSearchService:
             f"Scraper registrado: {scraper.__class__.__name__}"
         )
 
-    def search_candidates(self, keyword: str, location: str | None = None, limit: int = 100) -> List[CandidateSchema]:
+    def search_candidates(
+        self,
+        keyword: str,
+        location: str | None = None,
+        limit: int = 100,
+        time_budget: float | None = None,
+        cancel_token: CancellationToken | None = None
+    ) -> List[CandidateSchema]:
         """
         Ejecuta la búsqueda de candidatos en todos los scrapers registrados,
-        agrega los resultados y los mantiene
+        agrega los resultados y los mantiene.
+        Con `time_budget` (segundos para toda la búsqueda) o `cancel_token` los scrapers se
+        detienen de forma cooperativa y se guarda lo obtenido; `partial_sources` indica
+        qué fuentes quedaron incompletas.
         """
         self.logger.info(
             "Service",
             f"Iniciando búsqueda para: '{keyword}' en '{location or 'Todo México'}' con límite {limit}"
         )
         all_candidates: List[CandidateSchema] = []
+        merger = self._new_merger()
+        token = self._search_token(time_budget, cancel_token)
 
+        for scraper, results in self._run_scrapers(
+            lambda scraper: self._cached_extract(scraper, keyword, location, limit, token),
+            token
+        ):
+            self._note_partial(scraper)
+            added = self._collect(merger, all_candidates, scraper, results)
+            self.logger.info(
+                "Service",
+                f"{scraper.__class__.__name__} encontró {len(results)} candidatos ({added} nuevos)."
+            )
+
+        all_candidates = self._merged_results(merger, all_candidates)
+        self._save_results(all_candidates, keyword)
+        return all_candidates
+
+    def search_candidates_stream(
+        self,
+        keyword: str,
+        location: str | None = None,
+        limit: int = 100,
+        time_budget: float | None = None,
+        cancel_token: CancellationToken | None = None,
+        output_file: str | None = None
+    ) -> Iterator[SearchEvent]:
+        """
+        Variante en streaming de `search_candidates`: entrega los candidatos en cuanto cada
+        scraper los produce, junto con los eventos de avance, en un mismo flujo:
+        - "candidates": candidatos nuevos (ya combinados por identidad si el índice está activo)
+        - "profile_enriched": candidatos actualizados con los datos del perfil
+        - "page_done", "scraper_finished", "scraper_error" y, al final, "search_finished"
+        Los resultados se persisten en un diario (append/upsert) que se compacta al terminar,
+        así que el servicio no acumula la lista completa en memoria.
+        Los scrapers que no publican eventos entregan todos sus candidatos al terminar.
+        Con `time_budget` o `cancel_token` la búsqueda se detiene y "search_finished" indica
+        `partial`; si el consumidor deja de iterar, los scrapers se cancelan.
+        `output_file` reemplaza el archivo de resultados por defecto
+        (data/candidates_<keyword>.json).
+        """
+        self.logger.info(
+            "Service",
+            f"Iniciando búsqueda en streaming para: '{keyword}' en '{location or 'Todo México'}' "
+            f"con límite {limit}"
+        )
+        filename = output_file or self._results_filename(keyword)
+        if not self.scrapers:
+            yield SearchEvent(kind="search_finished", data={"total": 0, "file": None})
+            return
+
+        events: queue.Queue = queue.Queue(maxsize=self.stream_queue_size)
+        closed = threading.Event()
+        # Siempre hay token: permite detener los scrapers si el consumidor se va antes de tiempo
+        token = CancellationToken(time_budget=time_budget, parent=cancel_token)
+        self.partial_sources = {}
+        if self.search_cache:
+            self.search_cache.reset_stats()
+
+        def sink(event: SearchEvent) -> None:
+            # Si el consumidor dejó de iterar los eventos se descartan en lugar de bloquear
+            while not closed.is_set():
+                try:
+                    events.put(event, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def run(scraper: BaseScraper) -> None:
+            source = self._source_of(scraper)
+            scraper.event_sink = sink
+            try:
+                self.logger.info("Service", f"Ejecutando: {scraper.__class__.__name__}...")
+                results = self._cached_extract(scraper, keyword, location, limit, token)
+                sink(SearchEvent(
+                    kind="scraper_finished",
+                    source=source,
+                    candidates=[c for c in results if c],
+                    data={"partial": scraper.partial, "stop_reason": scraper.stop_reason}
+                ))
+            except Exception as e:
+                self.logger.error("Service", f"Error en {scraper.__class__.__name__}: {e}")
+                sink(SearchEvent(kind="scraper_error", source=source, message=str(e)))
+            finally:
+                scraper.event_sink = None
+
+        merger = self._new_merger(keep_records=False)
+        journal = JsonlJournalExporter()
+        journal.open(filename, truncate=True)
+        written = 0
+        streamed: set = set()
+        workers = len(self.scrapers) if self.parallel_scrapers else 1
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper")
         for scraper in self.scrapers:
+            executor.submit(run, scraper)
+
+        running = {self._source_of(scraper) for scraper in self.scrapers}
+        try:
+            while running:
+                try:
+                    event = events.get(timeout=0.5)
+                except queue.Empty:
+                    if self._past_grace(token):
+                        # Scrapers que no respondieron al plazo: se abandonan con lo ya publicado
+                        for source in running:
+                            self.partial_sources[source] = "deadline"
+                            self.logger.warning(
+                                "Service", f"{source} no se detuvo a tiempo; resultado parcial."
+                            )
+                        break
+                    continue
+                if event.kind in ("candidates", "profile_enriched"):
+                    streamed.add(event.source)
+                    records, removed = self._persist_stream(
+                        merger, journal, event.source, event.candidates
+                    )
+                    written += len(records)
+                    event = event.model_copy(
+                        update={
+                            "candidates": records,
+                            "data": {**event.data, "removed_identities": removed}
+                            if removed
+                            else event.data
+                        }
+                    )
+
+                elif event.kind == "scraper_finished":
+                    running.discard(event.source)
+                    if event.data.get("partial"):
+                        self.partial_sources[event.source] = event.data.get("stop_reason")
+                    # Reconciliación: el resultado final del scraper sobrescribe lo publicado
+                    records, removed = self._persist_stream(
+                        merger, journal, event.source, event.candidates
+                    )
+                    written += len(records)
+                    if (event.source not in streamed and records) or removed:
+                        yield SearchEvent(
+                            kind="candidates",
+                            source=event.source,
+                            candidates=records if event.source not in streamed else [],
+                            data={"removed_identities": removed} if removed else {}
+                        )
+                    self.logger.info(
+                        "Service", f"{event.source} encontró {len(records)} candidatos."
+                    )
+                    event = event.model_copy(update={
+                        "candidates": [], "data": {**event.data, "total": len(records)}
+                    })
+
+                elif event.kind == "scraper_error":
+                    running.discard(event.source)
+
+                yield event
+
+            total = None
+            if written:
+                total = journal.compact()
+                self.logger.info("Service", f"Resultados guardados exitosamente en: {filename}")
+            yield SearchEvent(
+                kind="search_finished",
+                data={
+                    "total": total or 0,
+                    "file": filename if written else None,
+                    "partial": bool(self.partial_sources),
+                    "partial_sources": dict(self.partial_sources),
+                    **(self.identity_index.stats() if merger else {})
+                }
+            )
+        finally:
+            closed.set()
+            # Si el consumidor se detuvo antes de tiempo se cancelan los scrapers (terminan en
+            # segundo plano)
+            token.cancel()
+            executor.shutdown(wait=False)
+            journal.close()
+            if not written and os.path.exists(journal.journal_path(filename)):
+                os.remove(journal.journal_path(filename))
+
+    def _persist_stream(
+        self,
+        merger: IdentityMerger | None,
+        journal: JsonlJournalExporter,
+        source: str | None,
+        candidates: List[CandidateSchema]
+    ) -> tuple[List[CandidateSchema], List[str]]:
+        """
+        Combina (si hay índice) y registra en el diario un lote del streaming.
+        Retorna los registros tal como quedaron persistidos y las identidades absorbidas.
+        """
+        tagged = [
+            cand if cand.source or not source else cand.model_copy(update={"source": source})
+            for cand in candidates if cand is not None
+        ]
+        records, removed = tagged, []
+        if merger is not None:
             try:
-                self.logger.info(
+                records = [record for record, _ in merger.merge(tagged)]
+                removed = merger.pop_removed()
+            except Exception as e:
+                self.logger.error(
                     "Service",
-                    f"Ejecutando: {scraper.__class__.__name__}..."
+                    f"Error en el índice de identidades, se agregan sin combinar: {e}"
                 )
-                results = scraper.extract(keyword, location, limit)
-                all_candidates.extend(results)
-                self.logger.info(
+        # Una identidad absorbida por otra deja de exportarse por separado
+        journal.remove(
+            [record_id for _, record_id in removed if record_id not in {r.id for r in records}]
+        )
+        journal.upsert(records)
+        return records, [identity_id for identity_id, _ in removed]
+
+    async def search_candidates_async(
+        self,
+        keyword: str,
+        location: str | None = None,
+        limit: int = 100,
+        time_budget: float | None = None,
+        cancel_token: CancellationToken | None = None
+    ) -> List[CandidateSchema]:
+        """
+        Ejecuta todos los scrapers registrados de forma concurrente en un mismo event loop.
+        Cada scraper corre en un hilo a través de la caché de resultados, igual que en
+        `search_candidates`. Un error en un scraper no afecta a los demás.
+        """
+        self.logger.info(
+            "Service",
+            f"Iniciando búsqueda asíncrona para: '{keyword}' en '{location or 'Todo México'}' con "
+            f"límite {limit}"
+        )
+        all_candidates: List[CandidateSchema] = []
+        merger = self._new_merger()
+        token = self._search_token(time_budget, cancel_token)
+
+        results_per_scraper = await asyncio.gather(
+            *[
+                asyncio.to_thread(self._cached_extract, scraper, keyword, location, limit, token)
+                for scraper in self.scrapers
+            ],
+            return_exceptions=True
+        )
+
+        for scraper, results in zip(self.scrapers, results_per_scraper):
+            if isinstance(results, BaseException):
+                self.logger.error(
                     "Service",
-                    f"{scraper.__class__.__name__} encontró {len(results)} candidatos."
+                    f"Error en {scraper.__class__.__name__}: {results}"
                 )
+                continue
+
+            self._note_partial(scraper)
+            added = await asyncio.to_thread(self._collect, merger, all_candidates, scraper, results)
+            self.logger.info(
+                "Service",
+                f"{scraper.__class__.__name__} encontró {len(results)} candidatos ({added} nuevos)."
+            )
+
+        all_candidates = self._merged_results(merger, all_candidates)
+        await asyncio.to_thread(self._save_results, all_candidates, keyword)
+        return all_candidates
+
+    def search_batch(
+        self,
+        keywords: List[str],
+        locations: List[str | None] | None = None,
+        limit: int = 100,
+        time_budget: float | None = None,
+        cancel_token: CancellationToken | None = None
+    ) -> List[CandidateSchema]:
+        """
+        Ejecuta la matriz palabras clave × ubicaciones en todos los scrapers registrados.
+        Cada scraper resuelve su lote con `extract_batch` (OCC: un login y combinaciones
+        concurrentes); los candidatos repetidos entre combinaciones se devuelven una sola vez.
+        `time_budget` y `cancel_token` funcionan como en `search_candidates`.
+        """
+        locations = locations or [None]
+        self.logger.info(
+            "Service",
+            f"Iniciando búsqueda por lotes: {len(keywords)} palabras clave × {len(locations)} "
+            f"ubicaciones con límite {limit}"
+        )
+        all_candidates: List[CandidateSchema] = []
+        merger = self._new_merger()
+        token = self._search_token(time_budget, cancel_token)
+
+        for scraper, results_per_combo in self._run_scrapers(
+            lambda scraper: scraper.extract_batch(
+                keywords, locations, limit, time_budget=self.scraper_time_budget, cancel_token=token
+            ),
+            token
+        ):
+            self._note_partial(scraper)
+            # Un candidato encontrado por varias combinaciones del mismo scraper cuenta una vez
+            unique = {}
+            for results in results_per_combo.values():
+                for candidate in results:
+                    unique.setdefault(candidate.id or candidate.url, candidate)
+            found = self._collect(merger, all_candidates, scraper, list(unique.values()))
+            self.logger.info(
+                "Service",
+                f"{scraper.__class__.__name__} encontró {found} candidatos únicos en "
+                f"{len(results_per_combo)} combinaciones."
+            )
+
+        all_candidates = self._merged_results(merger, all_candidates)
+
+        self._save_results(all_candidates, "lote_" + "_".join(keywords))
+        return all_candidates
+
+    def _new_merger(self, keep_records: bool = True) -> IdentityMerger | None:
+        if not self.identity_index:
+            return None
+        self.identity_index.reset_stats()
+        return IdentityMerger(self.identity_index, keep_records=keep_records)
+
+    @staticmethod
+    def _source_of(scraper: BaseScraper) -> str:
+        return getattr(scraper, "SOURCE", None) or scraper.__class__.__name__.lower()
+
+    def _collect(
+        self,
+        merger: IdentityMerger | None,
+        all_candidates: List[CandidateSchema],
+        scraper: BaseScraper,
+        results: List[CandidateSchema]
+    ) -> int:
+        """
+        Agrega los resultados de un scraper, etiquetados con su fuente, a medida que llegan.
+        Con índice de identidades se combinan con los ya recibidos (y con ejecuciones previas);
+        retorna cuántas identidades nuevas aportó a esta búsqueda.
+        """
+        source = self._source_of(scraper)
+        tagged = [
+            cand if cand.source else cand.model_copy(update={"source": source})
+            for cand in results if cand is not None
+        ]
+        if merger is not None:
+            try:
+                return len(merger.add(tagged))
             except Exception as e:
                 self.logger.error(
                     "Service",
-                    f"Error en {scraper.__class__.__name__}: {e}"
+                    f"Error en el índice de identidades, se agregan sin combinar: {e}"
                 )
+        all_candidates.extend(tagged)
+        return len(tagged)
 
+    def _merged_results(
+        self, merger: IdentityMerger | None, all_candidates: List[CandidateSchema]
+    ) -> List[CandidateSchema]:
+        """
+        Un registro por identidad (más los que no se pudieron combinar)
+        """
+        if merger is None:
+            return all_candidates
+        self.logger.info(
+            "Service",
+            f"Identidades: {len(merger)} únicas",
+            metadata=self.identity_index.stats()
+        )
+        return merger.results() + all_candidates
+
+    def _cached_extract(
+        self,
+        scraper: BaseScraper,
+        keyword: str,
+        location: str | None,
+        limit: int,
+        token: CancellationToken | None
+    ) -> List[CandidateSchema]:
+        """
+        `extract` a través de la caché de resultados:
+        - entrada fresca que cubre el límite: se retorna sin ejecutar el scraper
+        - entrada obsoleta que lo cubre: se retorna y se refresca en segundo plano
+        - entrada fresca con un límite menor: solo se extrae lo que falta
+        Solo se guardan en caché los resultados completos (no parciales ni con error).
+        En modo delta el scraper retorna solo los candidatos nuevos y no usa la caché.
+        """
+        def extract() -> List[CandidateSchema]:
+            return scraper.extract(
+                keyword, location, limit, time_budget=self.scraper_time_budget, cancel_token=token
+            )
+
+        if not self.search_cache or getattr(scraper, "delta_mode", False):
+            return extract()
+
+        source = self._source_of(scraper)
+        try:
+            entry = self.search_cache.get(source, keyword, location, limit)
+        except Exception as e:
+            self.logger.warning("Service", f"No se pudo consultar la caché de búsquedas: {e}")
+            return extract()
+
+        if entry is not None and entry.covers(limit):
+            self.logger.info(
+                "Service",
+                f"{source}: {len(entry.candidates)} candidatos desde caché "
+                f"({'vigente' if entry.fresh else 'obsoleta'}, {entry.age_seconds / 60:.0f} min)."
+            )
+            if not entry.fresh:
+                self._refresh_in_background(scraper, keyword, location, max(entry.limit, limit))
+            results = entry.candidates[:limit]
+            scraper._emit("candidates", results, cached=True)
+            return results
+
+        if entry is not None and entry.fresh:
+            self.logger.info(
+                "Service",
+                f"{source}: {len(entry.candidates)} candidatos desde caché, se extraen solo los "
+                "faltantes."
+            )
+            scraper._emit("candidates", entry.candidates, cached=True)
+            results = entry.candidates + scraper.extract_remainder(
+                keyword, location, limit, entry.candidates,
+                time_budget=self.scraper_time_budget, cancel_token=token
+            )
+        else:
+            results = extract()
+
+        self._store_search(scraper, keyword, location, limit, results)
+        return results
+
+    def _store_search(
+        self,
+        scraper: BaseScraper,
+        keyword: str,
+        location: str | None,
+        limit: int,
+        results: List[CandidateSchema]
+    ) -> None:
+        if scraper.partial or not results or getattr(scraper, "delta_mode", False):
+            return
+        try:
+            self.search_cache.put(
+                self._source_of(scraper),
+                keyword,
+                location,
+                limit,
+                results,
+                exhausted=scraper.exhausted
+            )
+        except Exception as e:
+            self.logger.warning("Service", f"No se pudo guardar la búsqueda en caché: {e}")
+
+    def _refresh_in_background(
+        self, scraper: BaseScraper, keyword: str, location: str | None, limit: int
+    ) -> None:
+        """
+        Vuelve a ejecutar la búsqueda en un hilo y actualiza la entrada de la caché.
+        Corre sobre un scraper nuevo de la misma fuente (mismo pool de navegadores) para
+        no compartir estado de ejecución ni estadísticas con la búsqueda en primer plano.
+        Un solo refresco por búsqueda y como máximo `max_refreshes` a la vez; el hilo es
+        daemon para no retener la salida del proceso.
+        """
+        source = self._source_of(scraper)
+        if not self.search_cache.begin_refresh(source, keyword, location):
+            return
+        try:
+            refresher = create_scraper(source, getattr(scraper, "browser_pool", None))
+        except Exception as e:
+            self.search_cache.end_refresh(source, keyword, location)
+            self.logger.warning(
+                "Service", f"{source}: no se pudo crear el scraper para refrescar la caché: {e}"
+            )
+            return
+
+        def refresh() -> None:
+            try:
+                self.logger.info(
+                    "Service", f"{source}: refrescando en segundo plano '{keyword}'..."
+                )
+                results = refresher.extract(
+                    keyword, location, limit, time_budget=self.scraper_time_budget
+                )
+                self._store_search(refresher, keyword, location, limit, results)
+                self.logger.info(
+                    "Service",
+                    f"{source}: caché de '{keyword}' actualizada ({len(results)} candidatos)."
+                )
+            except Exception as e:
+                self.logger.error("Service", f"Error al refrescar la caché de {source}: {e}")
+            finally:
+                self.search_cache.end_refresh(source, keyword, location)
+
+        threading.Thread(target=refresh, name=f"cache-refresh-{source}", daemon=True).start()
+
+    def _search_token(
+        self, time_budget: float | None, cancel_token: CancellationToken | None
+    ) -> CancellationToken | None:
+        """
+        Token de una búsqueda con su presupuesto de tiempo; reinicia `partial_sources`
+        """
+        self.partial_sources = {}
+        if self.search_cache:
+            self.search_cache.reset_stats()
+        if time_budget is None and cancel_token is None:
+            return None
+        return CancellationToken(time_budget=time_budget, parent=cancel_token)
+
+    def _note_partial(self, scraper: BaseScraper) -> None:
+        if scraper.partial:
+            source = self._source_of(scraper)
+            self.partial_sources[source] = scraper.stop_reason
+            self.logger.warning(
+                "Service", f"{source} se detuvo ({scraper.stop_reason}): resultado parcial."
+            )
+
+    def _past_grace(self, token: CancellationToken | None) -> bool:
+        """
+        True si el plazo de la búsqueda venció hace más del margen de detención
+        """
+        if token is None or token.deadline is None:
+            return False
+        return time.monotonic() > token.deadline + self.stop_grace_seconds
+
+    def _run_scrapers(
+        self,
+        task: Callable[[BaseScraper], object],
+        token: CancellationToken | None = None
+    ) -> Iterator[tuple[BaseScraper, object]]:
+        """
+        Ejecuta `task` en cada scraper registrado y entrega (scraper, resultado) a medida
+        que cada uno termina. Con SERVICE_PARALLEL_SCRAPERS cada scraper corre en su propio
+        hilo, así que habilitar otro portal no suma al tiempo total.
+        Un error en un scraper se registra y no afecta a los demás.
+        Con plazo, un scraper que no se detiene dentro del margen se abandona.
+        """
+        if not self.scrapers:
+            return
+
+        def run(scraper: BaseScraper):
+            self.logger.info(
+                "Service",
+                f"Ejecutando: {scraper.__class__.__name__}..."
+            )
+            return task(scraper)
+
+        if not self.parallel_scrapers or len(self.scrapers) == 1:
+            for scraper in self.scrapers:
+                try:
+                    results = run(scraper)
+                except Exception as e:
+                    self.logger.error(
+                        "Service",
+                        f"Error en {scraper.__class__.__name__}: {e}"
+                    )
+                    continue
+                yield scraper, results
+            return
+
+        executor = ThreadPoolExecutor(max_workers=len(self.scrapers), thread_name_prefix="scraper")
+        futures = {executor.submit(run, scraper): scraper for scraper in self.scrapers}
+        timeout = None
+        if token is not None and token.deadline is not None:
+            timeout = token.remaining() + self.stop_grace_seconds
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                scraper = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    self.logger.error(
+                        "Service",
+                        f"Error en {scraper.__class__.__name__}: {e}"
+                    )
+                    continue
+                yield scraper, results
+        except FuturesTimeout:
+            for future, scraper in futures.items():
+                if not future.done():
+                    source = self._source_of(scraper)
+                    self.partial_sources[source] = "deadline"
+                    self.logger.warning(
+                        "Service", f"{source} no se detuvo a tiempo; resultado parcial."
+                    )
+        finally:
+            if token is not None:
+                token.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _results_filename(keyword: str) -> str:
+        return f"data/candidates_{keyword.replace(' ', '_')}.json"
+
+    def _save_results(self, all_candidates: List[CandidateSchema], keyword: str) -> None:
+        """
+        Persiste los resultados agregados con el exportador configurado
+        """
         self.logger.info(
             "Service",
             f"Total de candidatos encontrados: {len(all_candidates)}"
         )
 
         if all_candidates:
-            filename = f"data/candidates_{keyword.replace(' ', '_')}.json"
+            filename = self._results_filename(keyword)
             try:
                 self.exporter.save(all_candidates, filename)
                 self.logger.info(
@@ -70,5 +683,3 @@ class CandidateSearchService:
                     "Service",
                     f"Fallo al guardar resultados: {e}"
                 )
-            
-        return all_candidates
@@ -0,0 +1,209 @@
+import copy
+import os
+import socket
+import threading
+from typing import Callable
+
+from src.application.services import CandidateSearchService
+from src.domain.cancellation import CancellationToken
+from src.domain.interfaces import BaseScraper, DataExporter
+from src.domain.models import SearchJob
+from src.infraestructura.logging import ConsoleLogHandler, Logger
+from src.infraestructura.persistence.job_queue import SearchJobQueue
+
+
+class SearchWorker:
+    """
+    Worker de la cola de búsquedas: toma trabajos de `SearchJobQueue` y los ejecuta con
+    `CandidateSearchService` fuera del proceso de la UI o del CLI.
+    - Hasta `concurrency` trabajos a la vez en este proceso, cada uno en su propio hilo.
+    - El cupo global (`max_running`, entre todos los workers) y el límite por portal se
+      aplican al tomar el trabajo.
+    - Un hilo de latido por trabajo publica el avance y atiende la cancelación pedida en la cola.
+    """
+
+    def __init__(
+        self,
+        job_queue: SearchJobQueue,
+        scraper_factory: Callable[[str], BaseScraper],
+        exporter: DataExporter,
+        concurrency: int | None = None,
+        max_running: int | None = None,
+        portal_limits: dict[str, int] | None = None
+    ):
+        self.job_queue = job_queue
+        self.scraper_factory = scraper_factory
+        self.exporter = exporter
+        self.logger = Logger(handlers=[ConsoleLogHandler()])
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+
+        self.concurrency = max(1, concurrency or int(os.getenv("JOBS_WORKER_CONCURRENCY", "2")))
+        self.max_running = max(1, max_running or int(os.getenv("JOBS_MAX_RUNNING", "4")))
+        self.portal_limits = (
+            portal_limits
+            if portal_limits is not None
+            else self.parse_portal_limits(os.getenv("JOBS_PORTAL_LIMITS", "occ=2,pandape=2"))
+        )
+        self.poll_seconds = float(os.getenv("JOBS_POLL_SECONDS", "2"))
+        self.heartbeat_seconds = float(os.getenv("JOBS_HEARTBEAT_SECONDS", "5"))
+        # Un trabajo sin latido durante este tiempo se considera huérfano y vuelve a la cola
+        self.stale_seconds = float(os.getenv("JOBS_STALE_SECONDS", "120"))
+
+        self._tokens: dict[str, CancellationToken] = {}
+        self._tokens_lock = threading.Lock()
+
+    @staticmethod
+    def parse_portal_limits(text: str) -> dict[str, int]:
+        """
+        "occ=2,pandape=1" -> {"occ": 2, "pandape": 1}
+        """
+        limits = {}
+        for item in (text or "").split(","):
+            if "=" in item:
+                source, value = item.split("=", 1)
+                limits[source.strip()] = max(1, int(value))
+        return limits
+
+    def run_forever(self, stop: threading.Event | None = None) -> None:
+        """
+        Toma y ejecuta trabajos hasta que se active `stop`. Al detenerse cancela los
+        trabajos en curso (guardan lo obtenido como resultado parcial) y los espera.
+        """
+        stop = stop or threading.Event()
+        threads: list[threading.Thread] = []
+        self.logger.info(
+            "Worker",
+            f"Worker {self.worker_id} iniciado",
+            metadata={
+                "concurrency": self.concurrency,
+                "max_running": self.max_running,
+                "portal_limits": self.portal_limits
+            }
+        )
+
+        try:
+            while not stop.is_set():
+                released = self.job_queue.requeue_stale(self.stale_seconds)
+                if released:
+                    self.logger.warning(
+                        "Worker", f"{released} trabajo(s) sin latido regresaron a la cola."
+                    )
+
+                threads = [thread for thread in threads if thread.is_alive()]
+                job = None
+                if len(threads) < self.concurrency:
+                    job = self.job_queue.claim(self.worker_id, self.max_running, self.portal_limits)
+
+                if job is None:
+                    stop.wait(self.poll_seconds)
+                    continue
+
+                thread = threading.Thread(target=self.run_job, args=(job,), name=f"job-{job.id}")
+                thread.start()
+                threads.append(thread)
+        finally:
+            with self._tokens_lock:
+                for token in self._tokens.values():
+                    token.cancel()
+            for thread in threads:
+                thread.join()
+            self.logger.info("Worker", f"Worker {self.worker_id} detenido.")
+
+    def run_job(self, job: SearchJob) -> None:
+        """
+        Ejecuta un trabajo con la búsqueda en streaming y registra su resultado en la cola
+        """
+        self.logger.info(
+            "Worker",
+            f"Ejecutando trabajo {job.id}: '{job.keyword}' en {', '.join(job.sources)}",
+            metadata={"priority": job.priority}
+        )
+        token = CancellationToken()
+        with self._tokens_lock:
+            self._tokens[job.id] = token
+
+        progress: dict = {"candidates": 0, "sources": {}}
+        progress_lock = threading.Lock()
+        cancel_requested = threading.Event()
+        done = threading.Event()
+
+        def heartbeat() -> None:
+            while not done.wait(self.heartbeat_seconds):
+                try:
+                    with progress_lock:
+                        snapshot = copy.deepcopy(progress)
+                    if self.job_queue.heartbeat(job.id, snapshot):
+                        cancel_requested.set()
+                        token.cancel()
+                except Exception as e:
+                    self.logger.warning(
+                        "Worker", f"No se pudo registrar el latido de {job.id}: {e}"
+                    )
+
+        beat = threading.Thread(target=heartbeat, name=f"job-{job.id}-heartbeat", daemon=True)
+        beat.start()
+
+        errors: list[str] = []
+        finished = None
+        try:
+            service = CandidateSearchService(self.exporter)
+            for source in job.sources:
+                service.add_scraper(self.scraper_factory(source))
+
+            output_file = f"data/jobs/{job.id}_{job.keyword.replace(' ', '_')}.json"
+            for event in service.search_candidates_stream(
+                job.keyword, job.location, job.limit,
+                time_budget=job.time_budget,
+                cancel_token=token,
+                output_file=output_file
+            ):
+                with progress_lock:
+                    source_progress = (
+                        progress["sources"].setdefault(event.source, {}) if event.source else {}
+                    )
+                    if event.kind == "candidates":
+                        progress["candidates"] += len(event.candidates)
+                    elif event.kind == "page_done":
+                        source_progress.update(
+                            page=event.data.get("page"), total=event.data.get("total")
+                        )
+                    elif event.kind == "scraper_finished":
+                        source_progress.update(
+                            finished=True,
+                            total=event.data.get("total"),
+                            partial=event.data.get("partial")
+                        )
+                    elif event.kind == "scraper_error":
+                        source_progress.update(error=event.message)
+                        errors.append(f"{event.source}: {event.message}")
+                if event.kind == "search_finished":
+                    finished = event
+
+            data = finished.data if finished else {}
+            if cancel_requested.is_set():
+                status = "cancelled"
+            elif errors and not data.get("total"):
+                status = "failed"
+            else:
+                status = "done"
+            self.job_queue.heartbeat(job.id, progress)
+            self.job_queue.finish(
+                job.id,
+                status,
+                total=data.get("total"),
+                result_file=data.get("file"),
+                partial=bool(data.get("partial")) or cancel_requested.is_set(),
+                error="; ".join(errors) or None
+            )
+            self.logger.info(
+                "Worker",
+                f"Trabajo {job.id} terminado ({status}): {data.get('total') or 0} candidatos."
+            )
+
+        except Exception as e:
+            self.logger.error("Worker", f"Error en el trabajo {job.id}: {e}")
+            self.job_queue.finish(job.id, "failed", error=str(e))
+        finally:
+            done.set()
+            with self._tokens_lock:
+                self._tokens.pop(job.id, None)
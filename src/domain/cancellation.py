@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Optional
+
+
+class CancellationToken:
+    """
+    Señal de cancelación cooperativa con fecha límite opcional.
+    Los scrapers la consultan entre páginas y perfiles para detenerse de forma limpia;
+    un token hijo se cancela cuando se cancela su padre o vence cualquiera de los dos plazos.
+    """
+
+    def __init__(
+        self,
+        time_budget: Optional[float] = None,
+        deadline: Optional[float] = None,
+        parent: Optional["CancellationToken"] = None
+    ):
+        """
+        :param time_budget: segundos disponibles a partir de ahora
+        :param deadline: instante límite absoluto (`time.time()`)
+        :param parent: token del que se hereda la cancelación y el plazo
+        """
+        self._event = threading.Event()
+        self.parent = parent
+        limits = []
+        if time_budget is not None:
+            limits.append(time.monotonic() + max(0.0, time_budget))
+        if deadline is not None:
+            limits.append(time.monotonic() + max(0.0, deadline - time.time()))
+        self._deadline = min(limits) if limits else None
+
+    def cancel(self) -> None:
+        """
+        Solicita detener la operación (los hijos también quedan cancelados)
+        """
+        self._event.set()
+
+    def child(self, time_budget: Optional[float] = None) -> "CancellationToken":
+        """
+        Token para una sub-operación con su propio presupuesto, limitado por este
+        """
+        return CancellationToken(time_budget=time_budget, parent=self)
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """
+        Plazo efectivo en reloj monotónico (el más cercano entre este token y sus padres)
+        """
+        deadlines = [self._deadline, self.parent.deadline if self.parent else None]
+        deadlines = [d for d in deadlines if d is not None]
+        return min(deadlines) if deadlines else None
+
+    @property
+    def reason(self) -> Optional[str]:
+        """
+        "cancelled" si se pidió la cancelación, "deadline" si venció el plazo, None si sigue vigente
+        """
+        if self._event.is_set():
+            return "cancelled"
+        if self.parent is not None:
+            parent_reason = self.parent.reason
+            if parent_reason:
+                return parent_reason
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return "deadline"
+        return None
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def remaining(self) -> Optional[float]:
+        """
+        Segundos restantes hasta el plazo (0 si ya venció), None si no hay plazo
+        """
+        deadline = self.deadline
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def cap_timeout(self, timeout_ms: Optional[float]) -> Optional[float]:
+        """
+        Acota un timeout de Playwright (ms) al tiempo restante, para que una espera
+        bloqueada no exceda el plazo
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout_ms
+        remaining_ms = max(1.0, remaining * 1000)
+        return remaining_ms if timeout_ms is None else min(timeout_ms, remaining_ms)
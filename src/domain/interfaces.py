@@ -1,6 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
-from .models import CandidateSchema
+from typing import Callable, Optional
+from .cancellation import CancellationToken
+from .models import CandidateSchema, SearchEvent
 
 
 class BaseScraper(ABC):
@@ -9,18 +11,153 @@ class BaseScraper(ABC):
     Define los métodos obligatorios que deben implementar
     La capa de infraestructura implementará estos métodos
     """
+    # Receptor de eventos de progreso; lo asigna el servicio durante una búsqueda en streaming
+    event_sink: Optional[Callable[[SearchEvent], None]] = None
+    # Token de la ejecución en curso y motivo por el que la última terminó antes de tiempo
+    # ("cancelled", "deadline" o "error")
+    cancel_token: Optional[CancellationToken] = None
+    stop_reason: Optional[str] = None
+    # True si la última ejecución llegó al final de los resultados del portal
+    exhausted: bool = False
+
+    @property
+    def partial(self) -> bool:
+        """
+        True si la última ejecución se detuvo por cancelación, plazo o error (resultado parcial)
+        """
+        return self.stop_reason is not None
+
+    def _begin_run(
+        self,
+        time_budget: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> None:
+        """
+        Prepara la cancelación de una ejecución: un token propio con el presupuesto
+        de tiempo, ligado al token del llamador
+        """
+        self.stop_reason = None
+        self.exhausted = False
+        if time_budget is None and cancel_token is None:
+            self.cancel_token = None
+        else:
+            self.cancel_token = CancellationToken(time_budget=time_budget, parent=cancel_token)
+
+    def _should_stop(self) -> bool:
+        """
+        Punto de control cooperativo (entre páginas y perfiles): True si hay que detenerse
+        """
+        if self.cancel_token is None:
+            return False
+        reason = self.cancel_token.reason
+        if reason and self.stop_reason is None:
+            self.stop_reason = reason
+        return reason is not None
+
+    def _emit(self, kind: str, candidates: Optional[list[CandidateSchema]] = None, **data) -> None:
+        """
+        Publica un evento de progreso si hay un receptor asignado.
+        Un receptor que falla nunca interrumpe la extracción.
+        """
+        if self.event_sink is None:
+            return
+        try:
+            self.event_sink(SearchEvent(
+                kind=kind,
+                source=getattr(self, "SOURCE", None) or self.__class__.__name__.lower(),
+                candidates=[cand for cand in candidates or [] if cand is not None],
+                data=data
+            ))
+        except Exception:
+            pass
+
     @abstractmethod
     def extract(
         self, 
         keyword: str,
         location: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        time_budget: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None
     ) -> list[CandidateSchema]:
         """
-        Extrae una lista de candidatos basada en palabras clave
+        Extrae una lista de candidatos basada en palabras clave.
+        Con `time_budget` (segundos) o `cancel_token` la extracción se detiene al vencer
+        el plazo o al cancelarse, conserva lo obtenido y deja `partial` en True.
         """
         pass
 
+    async def extract_async(
+        self,
+        keyword: str,
+        location: Optional[str] = None,
+        limit: int = 100,
+        time_budget: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> list[CandidateSchema]:
+        """
+        Variante asíncrona de `extract`.
+        Por defecto ejecuta `extract` en un hilo para no bloquear el event loop;
+        los scrapers con motor asíncrono nativo la sobreescriben.
+        """
+        return await asyncio.to_thread(
+            self.extract, keyword, location, limit, time_budget, cancel_token
+        )
+
+    def extract_remainder(
+        self,
+        keyword: str,
+        location: Optional[str],
+        limit: int,
+        known: list[CandidateSchema],
+        time_budget: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> list[CandidateSchema]:
+        """
+        Candidatos de la búsqueda que van más allá de `known` (resultado previo de la misma
+        búsqueda con un límite menor), hasta completar `limit`.
+        Por defecto repite la extracción completa y descarta los conocidos; los scrapers que
+        pueden saltar directamente a los resultados faltantes la sobreescriben.
+        """
+        known_ids = {cand.id or cand.url for cand in known}
+        return [
+            cand for cand in self.extract(keyword, location, limit, time_budget, cancel_token)
+            if cand is not None and (cand.id or cand.url) not in known_ids
+        ]
+
+    def extract_batch(
+        self,
+        keywords: list[str],
+        locations: Optional[list[Optional[str]]] = None,
+        limit: int = 100,
+        time_budget: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> dict[tuple[str, Optional[str]], list[CandidateSchema]]:
+        """
+        Ejecuta la matriz palabras clave × ubicaciones y retorna los candidatos por combinación.
+        Por defecto llama a `extract` por cada combinación en secuencia, con un mismo plazo
+        (`time_budget`) para todo el lote; los scrapers que pueden compartir la sesión y
+        paralelizar la sobreescriben.
+        """
+        token = None
+        if time_budget is not None or cancel_token is not None:
+            token = CancellationToken(time_budget=time_budget, parent=cancel_token)
+
+        results = {}
+        stop_reason = None
+        for keyword in keywords:
+            for location in (locations or [None]):
+                if token is not None and token.reason:
+                    results[(keyword, location)] = []
+                    continue
+                results[(keyword, location)] = self.extract(
+                    keyword, location, limit, cancel_token=token
+                )
+                stop_reason = stop_reason or self.stop_reason
+        # `partial` refleja todo el lote, no solo la última combinación
+        self.stop_reason = stop_reason or (token.reason if token is not None else None)
+        return results
+
     @abstractmethod
     def _login(self, page) -> None:
         """
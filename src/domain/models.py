@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, ConfigDict, Field
 
 class Experience(BaseModel):
@@ -26,4 +28,75 @@ class CandidateSchema(BaseModel):
     salary: str | None = Field(default=None, description="Salario deseado (opcional)")
     specialty: str | None = Field(default=None, description="Área de especialización (opcional)")
     last_updated: str | None = Field(default=None, description="Fecha o texto de última actualización del perfil")
-    url: str = Field(..., description="URL del perfil")
\ No newline at end of file
+    url: str = Field(..., description="URL del perfil")
+    source: str | None = Field(default=None, description="Portal de origen (e.g. occ, pandape)")
+    identity_id: str | None = Field(
+        default=None, description="Identidad del candidato entre fuentes (índice de identidades)"
+    )
+    sources: list[str] | None = Field(
+        default=None, description="Referencias fuente:id combinadas en este registro"
+    )
+    provenance: dict[str, str] | None = Field(
+        default=None, description="Referencia fuente:id que aportó cada campo"
+    )
+
+
+class SearchEvent(BaseModel):
+    """
+    Evento de la búsqueda en streaming: candidatos nuevos o actualizados y avances
+    (página terminada, perfil enriquecido, scraper terminado).
+    """
+    model_config = ConfigDict(frozen=True)
+
+    kind: Literal[
+        "candidates", "page_done", "profile_enriched",
+        "scraper_finished", "scraper_error", "search_finished"
+    ] = Field(..., description="Tipo de evento")
+    source: str | None = Field(default=None, description="Portal que originó el evento")
+    candidates: list[CandidateSchema] = Field(
+        default_factory=list, description="Candidatos nuevos o actualizados"
+    )
+    message: str | None = Field(default=None, description="Detalle legible (e.g. error)")
+    data: dict = Field(
+        default_factory=dict, description="Datos del avance (página, totales, archivo)"
+    )
+
+
+class SearchJob(BaseModel):
+    """
+    Búsqueda encolada para ejecutarse en un proceso worker, con su estado y resultado.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    id: str = Field(..., description="Identificador del trabajo")
+    keyword: str = Field(..., description="Puesto o palabra clave")
+    location: str | None = Field(default=None, description="Ubicación (None = todo México)")
+    limit: int = Field(default=100, description="Registros deseados")
+    sources: list[str] = Field(
+        default_factory=list, description="Portales a consultar (e.g. occ, pandape)"
+    )
+    priority: int = Field(default=0, description="Mayor prioridad se ejecuta primero")
+    time_budget: float | None = Field(
+        default=None, description="Tiempo máximo de la búsqueda en segundos"
+    )
+    status: Literal["queued", "running", "done", "failed", "cancelled"] = Field(
+        default="queued", description="Estado del trabajo"
+    )
+    worker: str | None = Field(default=None, description="Worker que lo ejecuta o ejecutó")
+    progress: dict = Field(
+        default_factory=dict, description="Último avance reportado (página, candidatos, fuente)"
+    )
+    total: int | None = Field(default=None, description="Candidatos guardados al terminar")
+    result_file: str | None = Field(default=None, description="Archivo JSON con los resultados")
+    partial: bool = Field(default=False, description="Resultado parcial por plazo o cancelación")
+    error: str | None = Field(default=None, description="Error si el trabajo falló")
+    cancel_requested: bool = Field(
+        default=False, description="Se pidió cancelar el trabajo en ejecución"
+    )
+    created_at: float = Field(..., description="Momento en que se encoló (epoch)")
+    started_at: float | None = Field(default=None, description="Momento en que empezó a ejecutarse")
+    finished_at: float | None = Field(default=None, description="Momento en que terminó")
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed", "cancelled")
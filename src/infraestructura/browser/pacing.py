@@ -0,0 +1,250 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable
+from urllib.parse import urlparse
+
+
+class PacingStats:
+    """
+    Acumula, por ejecución, el tiempo de espera (rate limiter y esperas de
+    disponibilidad) frente al tiempo total, para saber cuánto se trabaja realmente.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started_at = time.perf_counter()
+        self._waits: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+
+    def add_wait(self, kind: str, seconds: float) -> None:
+        """
+        Registra un intervalo de espera de un tipo dado (e.g. 'rate_limit', 'ready')
+        """
+        with self._lock:
+            self._waits[kind] = self._waits.get(kind, 0.0) + seconds
+            self._counts[kind] = self._counts.get(kind, 0) + 1
+
+    @contextmanager
+    def waiting(self, kind: str):
+        """
+        Context manager que mide el bloque como tiempo de espera
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_wait(kind, time.perf_counter() - start)
+
+    def summary(self) -> dict:
+        """
+        Retorna el resumen de la ejecución: total, espera por tipo y trabajo.
+        Con varios workers las esperas se suman entre hilos, por lo que pueden
+        superar al tiempo de reloj.
+        """
+        with self._lock:
+            total = time.perf_counter() - self._started_at
+            waited = sum(self._waits.values())
+            return {
+                "total_s": round(total, 2),
+                "waiting_s": round(waited, 2),
+                "working_s": round(max(total - waited, 0.0), 2),
+                "waits": {k: round(v, 2) for k, v in self._waits.items()},
+                "wait_counts": dict(self._counts)
+            }
+
+
+@dataclass
+class _Bucket:
+    rate: float
+    tokens: float
+    updated_at: float
+    latencies: list[float] = field(default_factory=list)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket por dominio con ajuste adaptativo (AIMD):
+    - Respuestas rápidas y exitosas incrementan la tasa de forma aditiva.
+    - Errores (HTTP 429/5xx, timeouts) o latencias altas la reducen a la mitad.
+    Es thread-safe, los workers de enriquecimiento comparten la misma instancia.
+    `clock` y `sleep` se pueden inyectar para probarlo sin esperas reales.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 1.0,
+        min_rate: float = 0.2,
+        max_rate: float = 4.0,
+        burst: float = 2.0,
+        target_latency: float = 2.0,
+        increase_step: float = 0.1,
+        stats: PacingStats | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.target_latency = target_latency
+        self.increase_step = increase_step
+        self.stats = stats or PacingStats()
+        self.clock = clock
+        self.sleep = sleep
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def domain_of(url: str) -> str:
+        """
+        Obtiene la clave de dominio de una URL (o la retorna tal cual si ya es un dominio)
+        """
+        return urlparse(url).netloc or url
+
+    def _bucket(self, domain: str) -> _Bucket:
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = _Bucket(rate=self.initial_rate, tokens=self.burst, updated_at=self.clock())
+            self._buckets[domain] = bucket
+        return bucket
+
+    def _reserve(self, domain: str) -> float:
+        """
+        Reserva un token y retorna los segundos que se deben esperar para usarlo.
+        Los tokens pueden quedar en negativo: así las reservas concurrentes se encolan.
+        """
+        with self._lock:
+            bucket = self._bucket(domain)
+            now = self.clock()
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated_at) * bucket.rate)
+            bucket.updated_at = now
+            bucket.tokens -= 1.0
+            if bucket.tokens >= 0:
+                return 0.0
+            return -bucket.tokens / bucket.rate
+
+    def acquire(self, url: str) -> float:
+        """
+        Bloquea hasta que haya un token disponible para el dominio de la URL
+        """
+        delay = self._reserve(self.domain_of(url))
+        if delay > 0:
+            self.sleep(delay)
+            self.stats.add_wait("rate_limit", delay)
+        return delay
+
+    def record(self, url: str, latency: float, ok: bool = True) -> None:
+        """
+        Retroalimenta al limitador con la latencia y el resultado de una petición
+        """
+        with self._lock:
+            bucket = self._bucket(self.domain_of(url))
+            bucket.latencies = (bucket.latencies + [latency])[-10:]
+            avg_latency = sum(bucket.latencies) / len(bucket.latencies)
+
+            if not ok or avg_latency > self.target_latency:
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+            else:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase_step)
+
+    def rates(self) -> dict[str, float]:
+        """
+        Tasa actual (peticiones/segundo) por dominio
+        """
+        with self._lock:
+            return {domain: round(b.rate, 2) for domain, b in self._buckets.items()}
+
+
+class Pacer:
+    """
+    Capa de ritmo para los scrapers: combina esperas basadas en eventos
+    (selector, URL, estado de carga) con el rate limiter por dominio,
+    y registra todo en PacingStats.
+    Con `cancel_token` ninguna espera o navegación excede el plazo de la ejecución.
+    """
+
+    def __init__(
+        self, limiter: AdaptiveRateLimiter, default_timeout: int = 10000, cancel_token=None
+    ):
+        self.limiter = limiter
+        self.stats = limiter.stats
+        self.default_timeout = default_timeout
+        self.cancel_token = cancel_token
+
+    def timeout(self, timeout: int | None = None) -> float:
+        """
+        Timeout (ms) de una espera, acotado al tiempo restante del plazo si lo hay
+        """
+        timeout = timeout or self.default_timeout
+        if self.cancel_token is None:
+            return timeout
+        return self.cancel_token.cap_timeout(timeout)
+
+    def _navigation_kwargs(self, kwargs: dict) -> dict:
+        # Playwright usa 30 s por defecto en navegaciones y peticiones
+        if self.cancel_token is not None and self.cancel_token.deadline is not None:
+            kwargs["timeout"] = self.cancel_token.cap_timeout(kwargs.get("timeout", 30000))
+        return kwargs
+
+    def ready(
+        self,
+        page,
+        selector: str | None = None,
+        url: str | None = None,
+        load_state: str | None = None,
+        state: str = "visible",
+        timeout: int | None = None
+    ) -> bool:
+        """
+        Espera a que la página esté lista según un selector, un patrón de URL o un
+        estado de carga. Retorna False en timeout en lugar de lanzar la excepción.
+        """
+        timeout = self.timeout(timeout)
+        with self.stats.waiting("ready"):
+            try:
+                if url:
+                    page.wait_for_url(url, timeout=timeout)
+                if load_state:
+                    page.wait_for_load_state(load_state, timeout=timeout)
+                if selector:
+                    page.wait_for_selector(selector, state=state, timeout=timeout)
+                return True
+            except Exception:
+                return False
+
+    def goto(self, page, url: str, **kwargs):
+        """
+        Navega respetando el rate limiter y retroalimentándolo con latencia y estado
+        """
+        self.limiter.acquire(url)
+        start = self.limiter.clock()
+        ok = True
+        try:
+            response = page.goto(url, **self._navigation_kwargs(kwargs))
+            ok = response is None or response.status < 400
+            return response
+        except Exception:
+            ok = False
+            raise
+        finally:
+            self.limiter.record(url, self.limiter.clock() - start, ok)
+
+    def fetch(self, request_context, url: str, **kwargs):
+        """
+        Petición HTTP con el APIRequestContext del navegador (comparte cookies de la sesión),
+        respetando el rate limiter
+        """
+        self.limiter.acquire(url)
+        start = self.limiter.clock()
+        ok = True
+        try:
+            response = request_context.get(url, **self._navigation_kwargs(kwargs))
+            ok = response.status < 400
+            return response
+        except Exception:
+            ok = False
+            raise
+        finally:
+            self.limiter.record(url, self.limiter.clock() - start, ok)
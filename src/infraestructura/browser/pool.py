@@ -0,0 +1,340 @@
+import atexit
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from playwright.sync_api import sync_playwright
+
+from src.infraestructura.logging import ConsoleLogHandler, Logger
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class PooledBrowser:
+    """
+    Proceso de Chromium lanzado por el pool con el puerto de depuración (CDP) abierto.
+    Los scrapers se conectan con `connect(p)` desde su propia instancia de Playwright,
+    por lo que el mismo navegador se comparte entre hilos y sesiones de Streamlit.
+    """
+
+    def __init__(self, process: subprocess.Popen, endpoint: str, user_data_dir: str):
+        self.process = process
+        self.endpoint = endpoint
+        self.user_data_dir = user_data_dir
+        self.created_at = time.time()
+        self.uses = 0
+        self.active = 0
+        self.retiring = False
+
+    @classmethod
+    def launch(cls, executable_path: str, headless: bool, timeout: float = 30.0) -> "PooledBrowser":
+        """
+        Inicia Chromium con `--remote-debugging-port=0` y lee el puerto asignado
+        del archivo DevToolsActivePort del perfil temporal
+        """
+        user_data_dir = tempfile.mkdtemp(prefix="rpa-browser-")
+        args = [
+            executable_path,
+            "--remote-debugging-port=0",
+            f"--user-data-dir={user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-background-networking"
+        ]
+        if headless:
+            args.append("--headless=new")
+        args.append("about:blank")
+
+        process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        port_file = os.path.join(user_data_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + timeout
+        while True:
+            if os.path.exists(port_file):
+                with open(port_file, "r", encoding="utf-8") as f:
+                    port = f.readline().strip()
+                if port.isdigit():
+                    return cls(process, f"http://127.0.0.1:{port}", user_data_dir)
+
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                shutil.rmtree(user_data_dir, ignore_errors=True)
+                raise RuntimeError("Chromium no expuso el puerto de depuración a tiempo.")
+            time.sleep(0.05)
+
+    def connect(self, p):
+        """
+        Conecta una instancia de Playwright (sync o async) al navegador
+        """
+        return p.chromium.connect_over_cdp(self.endpoint)
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def memory_mb(self) -> float | None:
+        """
+        Memoria residente del navegador y sus procesos hijos (renderers, GPU).
+        Usa psutil si está instalado; en Linux lee /proc. None si no se puede medir.
+        """
+        if PSUTIL_AVAILABLE:
+            try:
+                root = psutil.Process(self.process.pid)
+                processes = [root, *root.children(recursive=True)]
+                return sum(proc.memory_info().rss for proc in processes) / (1024 * 1024)
+            except psutil.Error:
+                return None
+
+        if not sys.platform.startswith("linux"):
+            return None
+
+        # Árbol de procesos a partir de /proc/<pid>/stat (ppid es el cuarto campo)
+        children: dict[int, list[int]] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "r") as f:
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+                children.setdefault(ppid, []).append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+
+        total_kb = 0
+        pending = [self.process.pid]
+        while pending:
+            pid = pending.pop()
+            pending.extend(children.get(pid, []))
+            try:
+                with open(f"/proc/{pid}/status", "r") as f:
+                    for line in f:
+                        if line.startswith("VmRSS:"):
+                            total_kb += int(line.split()[1])
+                            break
+            except (OSError, ValueError):
+                continue
+        return total_kb / 1024
+
+    def terminate(self) -> None:
+        """
+        Cierra el proceso y elimina el perfil temporal
+        """
+        if self.alive():
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+class BrowserPool:
+    """
+    Pool de navegadores Chromium de larga vida, compartido por todo el proceso.
+    - `warm()` lanza los navegadores en segundo plano para que la primera búsqueda
+      no pague el arranque en frío.
+    - `lease()` entrega el navegador con menos contextos activos; cada scraper abre
+      su propio contexto aislado sobre él.
+    - Un navegador se recicla tras `max_uses` préstamos o si supera `max_memory_mb`;
+      el reemplazo se lanza en segundo plano.
+    """
+    _shared: "BrowserPool | None" = None
+    _shared_lock = threading.Lock()
+    _executable_path: str | None = None
+
+    def __init__(
+        self,
+        size: int | None = None,
+        max_uses: int | None = None,
+        max_memory_mb: float | None = None,
+        headless: bool | None = None,
+        executable_path: str | None = None
+    ):
+        self.logger = Logger(handlers=[ConsoleLogHandler()])
+        self.size = max(1, size or int(os.getenv("BROWSER_POOL_SIZE", "2")))
+        self.max_uses = max(1, max_uses or int(os.getenv("BROWSER_POOL_MAX_USES", "50")))
+        self.max_memory_mb = max_memory_mb if max_memory_mb is not None else float(
+            os.getenv("BROWSER_POOL_MAX_MEMORY_MB", "1500")
+        )
+        if headless is None:
+            headless = os.getenv("BROWSER_POOL_HEADLESS", "true").lower() == "true"
+        self.headless = headless
+        self.executable_path = executable_path or os.getenv("CHROMIUM_EXECUTABLE")
+
+        self._browsers: list[PooledBrowser] = []
+        self._launching = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {"launched": 0, "recycled": 0, "leases": 0, "launch_errors": 0}
+        atexit.register(self.close)
+
+    @classmethod
+    def shared(cls) -> "BrowserPool":
+        """
+        Instancia única del proceso (UI y CLI comparten los mismos navegadores)
+        """
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared._closed:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def _resolve_executable(cls) -> str:
+        """
+        Ruta del Chromium instalado por Playwright. Se consulta una sola vez y en un hilo
+        aparte porque la API sync no puede usarse dentro de un event loop activo.
+        """
+        if cls._executable_path is None:
+            def find() -> str:
+                with sync_playwright() as p:
+                    return p.chromium.executable_path
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                cls._executable_path = executor.submit(find).result()
+        return cls._executable_path
+
+    def warm(self, wait: bool = False) -> None:
+        """
+        Lanza en segundo plano los navegadores que falten hasta `size`
+        """
+        with self._cond:
+            if self._closed:
+                return
+            missing = self.size - len(self._browsers) - self._launching
+            self._launching += max(missing, 0)
+
+        threads = [
+            threading.Thread(target=self._launch_into_pool, name="browser-pool-launch", daemon=True)
+            for _ in range(max(missing, 0))
+        ]
+        for thread in threads:
+            thread.start()
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _launch_into_pool(self) -> None:
+        browser = None
+        try:
+            started = time.perf_counter()
+            executable = self.executable_path or self._resolve_executable()
+            browser = PooledBrowser.launch(executable, self.headless)
+            self.logger.info(
+                "browser_pool",
+                f"Navegador listo en {time.perf_counter() - started:.2f}s",
+                metadata={"endpoint": browser.endpoint}
+            )
+        except Exception as e:
+            self.logger.error("browser_pool", f"No se pudo lanzar el navegador: {e}")
+
+        with self._cond:
+            self._launching -= 1
+            if browser is None:
+                self._stats["launch_errors"] += 1
+            elif self._closed:
+                browser.terminate()
+            else:
+                self._browsers.append(browser)
+                self._stats["launched"] += 1
+            self._cond.notify_all()
+
+    def acquire(self, timeout: float | None = None) -> PooledBrowser:
+        """
+        Presta el navegador sano con menos contextos activos.
+        Si no hay ninguno espera al que se está lanzando (o lanza uno).
+        """
+        timeout = timeout if timeout is not None else float(os.getenv("BROWSER_POOL_TIMEOUT", "60"))
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("El pool de navegadores está cerrado.")
+
+                # Navegadores caídos sin préstamos activos se descartan
+                for browser in [b for b in self._browsers if not b.alive() and b.active == 0]:
+                    self._browsers.remove(browser)
+                    browser.terminate()
+
+                healthy = [b for b in self._browsers if not b.retiring and b.alive()]
+                if healthy:
+                    browser = min(healthy, key=lambda b: b.active)
+                    browser.active += 1
+                    browser.uses += 1
+                    self._stats["leases"] += 1
+                    return browser
+
+                if self._launching == 0:
+                    self._launching += 1
+                    threading.Thread(
+                        target=self._launch_into_pool, name="browser-pool-launch", daemon=True
+                    ).start()
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("No hay navegadores disponibles en el pool.")
+                self._cond.wait(remaining)
+
+    def release(self, browser: PooledBrowser) -> None:
+        """
+        Devuelve el navegador; si cumplió su vida útil se retira y se lanza el reemplazo
+        """
+        with self._cond:
+            browser.active = max(0, browser.active - 1)
+            if not browser.retiring and self._should_recycle(browser):
+                browser.retiring = True
+            retire_now = browser.retiring and browser.active == 0 and browser in self._browsers
+            if retire_now:
+                self._browsers.remove(browser)
+                self._stats["recycled"] += 1
+
+        if retire_now:
+            self.logger.info("browser_pool", f"Reciclando navegador tras {browser.uses} usos.")
+            browser.terminate()
+            self.warm()
+
+    def _should_recycle(self, browser: PooledBrowser) -> bool:
+        if not browser.alive() or browser.uses >= self.max_uses:
+            return True
+        memory = browser.memory_mb()
+        return memory is not None and memory > self.max_memory_mb
+
+    @contextmanager
+    def lease(self, timeout: float | None = None):
+        """
+        Préstamo con devolución automática: `with pool.lease() as browser: ...`
+        """
+        browser = self.acquire(timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                **self._stats,
+                "browsers": len(self._browsers),
+                "active_leases": sum(b.active for b in self._browsers)
+            }
+
+    def close(self) -> None:
+        """
+        Termina todos los navegadores del pool
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            browsers, self._browsers = self._browsers, []
+            self._cond.notify_all()
+
+        for browser in browsers:
+            browser.terminate()
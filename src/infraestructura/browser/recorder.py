@@ -0,0 +1,113 @@
+import json
+import threading
+import time
+import zipfile
+from urllib.parse import urlsplit
+
+
+class ResponseRecorder:
+    """
+    Graba las respuestas de un portal (login, resultados, perfiles) en un archivo
+    de fixtures (.zip) que el servidor sustituto de `benchmarks/occ_standin` reproduce.
+    - Solo guarda respuestas GET del origen indicado y de tipo documento, script o XHR.
+    - No guarda cabeceras (cookies, tokens) ni cuerpos de peticiones: únicamente
+      método, ruta, estado, content-type y cuerpo de la respuesta.
+    """
+    RESOURCE_TYPES = {"document", "script", "xhr", "fetch"}
+
+    def __init__(self, archive_path: str, origin: str):
+        self.archive_path = archive_path
+        parts = urlsplit(origin)
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def entry_key(method: str, path: str) -> str:
+        return f"{method.upper()} {path}"
+
+    def _relative(self, url: str) -> str | None:
+        """
+        Ruta + query de la URL si pertenece al origen grabado
+        """
+        parts = urlsplit(url)
+        if f"{parts.scheme}://{parts.netloc}" != self.origin:
+            return None
+        return parts.path + (f"?{parts.query}" if parts.query else "")
+
+    def _store(self, method: str, url: str, status: int, content_type: str, body: bytes) -> None:
+        path = self._relative(url)
+        if path is None or method.upper() != "GET":
+            return
+        with self._lock:
+            # Se conserva la última respuesta de cada ruta (e.g. el home ya autenticado)
+            self._entries[self.entry_key(method, path)] = {
+                "method": method.upper(),
+                "path": path,
+                "status": status,
+                "content_type": content_type,
+                "body": body
+            }
+
+    def _on_response(self, response) -> None:
+        try:
+            request = response.request
+            if request.resource_type not in self.RESOURCE_TYPES:
+                return
+            self._store(
+                request.method,
+                response.url,
+                response.status,
+                response.headers.get("content-type", ""),
+                response.body()
+            )
+        except Exception:
+            # Respuestas sin cuerpo (redirecciones, navegaciones canceladas)
+            pass
+
+    def attach(self, context) -> None:
+        """
+        Graba las respuestas de todas las páginas del contexto
+        """
+        context.on("response", self._on_response)
+
+    def record_api(self, url: str, response, body: bytes) -> None:
+        """
+        Graba una respuesta obtenida con la API de peticiones (no emite eventos de página)
+        """
+        self._store("GET", url, response.status, response.headers.get("content-type", ""), body)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self) -> str:
+        """
+        Escribe el archivo: manifest.json + un cuerpo por respuesta
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+
+        manifest = {"origin": self.origin, "recorded_at": time.time(), "entries": []}
+        with zipfile.ZipFile(self.archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for index, entry in enumerate(entries):
+                body_name = f"bodies/{index:06d}"
+                archive.writestr(body_name, entry["body"])
+                manifest["entries"].append({
+                    key: value for key, value in entry.items() if key != "body"
+                } | {"body": body_name})
+            archive.writestr("manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2))
+        return self.archive_path
+
+    @staticmethod
+    def load(archive_path: str) -> tuple[str, dict[str, dict]]:
+        """
+        Lee un archivo grabado y retorna (origen, entradas por "MÉTODO ruta")
+        """
+        with zipfile.ZipFile(archive_path, "r") as archive:
+            manifest = json.loads(archive.read("manifest.json"))
+            entries = {}
+            for entry in manifest["entries"]:
+                data = dict(entry)
+                data["body"] = archive.read(entry["body"])
+                entries[ResponseRecorder.entry_key(entry["method"], entry["path"])] = data
+        return manifest["origin"], entries
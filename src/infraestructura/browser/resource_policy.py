@@ -0,0 +1,117 @@
+import os
+import threading
+
+
+class ResourceBlockingPolicy:
+    """
+    Política de intercepción de red para los contextos de Playwright.
+    Bloquea recursos que no se parsean (imágenes, fuentes, video, analítica)
+    por tipo de recurso y por lista de URLs denegadas, y lleva la cuenta de
+    peticiones bloqueadas y permitidas por ejecución.
+
+    Nota: Playwright deshabilita la caché HTTP de un contexto con rutas activas, incluso
+    para las peticiones que se dejan pasar; con la política activa los scripts y hojas de
+    estilo del perfil persistente se vuelven a descargar. Por eso es opcional
+    (BLOCK_RESOURCES=true).
+    """
+    DEFAULT_BLOCKED_TYPES = ("image", "media", "font")
+
+    DEFAULT_DENY_LIST = (
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "facebook.net",
+        "connect.facebook.com",
+        "hotjar.com",
+        "clarity.ms",
+        "newrelic.com",
+        "nr-data.net",
+        "taboola.com",
+        "criteo.com",
+    )
+
+    def __init__(
+        self,
+        blocked_types: tuple[str, ...] | list[str] | None = None,
+        deny_list: tuple[str, ...] | list[str] | None = None,
+        enabled: bool = True
+    ):
+        self.blocked_types = set(
+            self.DEFAULT_BLOCKED_TYPES if blocked_types is None else blocked_types
+        )
+        self.deny_list = tuple(self.DEFAULT_DENY_LIST if deny_list is None else deny_list)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @classmethod
+    def from_env(cls) -> "ResourceBlockingPolicy":
+        """
+        Construye la política a partir de las variables de entorno:
+        BLOCK_RESOURCES, BLOCK_RESOURCE_TYPES y BLOCK_URL_PATTERNS (separadas por comas)
+        """
+        def _split(value: str | None) -> list[str] | None:
+            if value is None:
+                return None
+            return [item.strip() for item in value.split(",") if item.strip()]
+
+        return cls(
+            blocked_types=_split(os.getenv("BLOCK_RESOURCE_TYPES")),
+            deny_list=_split(os.getenv("BLOCK_URL_PATTERNS")),
+            enabled=os.getenv("BLOCK_RESOURCES", "false").lower() == "true"
+        )
+
+    def reset_stats(self) -> None:
+        """
+        Reinicia los contadores (al inicio de cada ejecución)
+        """
+        with self._lock:
+            self._blocked_requests = 0
+            self._allowed_requests = 0
+            self._by_reason: dict[str, int] = {}
+
+    def should_block(self, resource_type: str, url: str) -> str | None:
+        """
+        Retorna el motivo de bloqueo ('type:<tipo>' o 'url:<patrón>') o None si se permite
+        """
+        if resource_type in self.blocked_types:
+            return f"type:{resource_type}"
+        for pattern in self.deny_list:
+            if pattern in url:
+                return f"url:{pattern}"
+        return None
+
+    def _register(self, reason: str | None) -> None:
+        with self._lock:
+            if reason is None:
+                self._allowed_requests += 1
+                return
+            self._blocked_requests += 1
+            self._by_reason[reason] = self._by_reason.get(reason, 0) + 1
+
+    def _handle(self, route) -> None:
+        request = route.request
+        reason = self.should_block(request.resource_type, request.url)
+        self._register(reason)
+        if reason:
+            route.abort()
+        else:
+            route.continue_()
+
+    def attach(self, context) -> None:
+        """
+        Instala la intercepción en un BrowserContext
+        """
+        if self.enabled:
+            context.route("**/*", self._handle)
+
+    def stats(self) -> dict:
+        """
+        Resumen de la ejecución: peticiones bloqueadas/permitidas y motivos de bloqueo
+        """
+        with self._lock:
+            return {
+                "blocked_requests": self._blocked_requests,
+                "allowed_requests": self._allowed_requests,
+                "blocked_by": dict(self._by_reason)
+            }
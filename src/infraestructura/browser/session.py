@@ -0,0 +1,109 @@
+import hashlib
+import os
+import shutil
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows: bloqueo de un byte con msvcrt
+    import msvcrt
+    FCNTL_AVAILABLE = False
+
+
+class ProfileLock:
+    """
+    Bloqueo exclusivo (entre hilos y procesos) del perfil de Chromium de una cuenta.
+    Chromium no admite dos instancias sobre el mismo directorio de perfil.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        """
+        Intenta tomar el bloqueo sin esperar; False si otra ejecución tiene el perfil
+        """
+        self._file = open(self.path, "a+")
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            self._file.close()
+            self._file = None
+            return False
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+
+class SessionStore:
+    """
+    Persistencia de sesiones autenticadas por portal y cuenta.
+    Por cada cuenta guarda:
+    - `storage_state.json`: cookies y localStorage exportados por Playwright.
+    - `profile/`: directorio de perfil de Chromium (incluye la caché de disco).
+    """
+
+    def __init__(self, portal: str, base_dir: str | None = None):
+        self.portal = portal
+        self.base_dir = base_dir or os.getenv("SESSIONS_DIR", "data/sessions")
+
+    @staticmethod
+    def account_key(account: str | None) -> str:
+        """
+        Clave de carpeta para la cuenta; se usa un hash para no exponer el usuario en disco
+        """
+        if not account:
+            return "anonimo"
+        return hashlib.sha1(account.strip().lower().encode("utf-8")).hexdigest()[:16]
+
+    def account_dir(self, account: str | None) -> str:
+        path = os.path.join(self.base_dir, self.portal, self.account_key(account))
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def storage_state_path(self, account: str | None) -> str:
+        return os.path.join(self.account_dir(account), "storage_state.json")
+
+    def profile_dir(self, account: str | None) -> str:
+        return os.path.join(self.account_dir(account), "profile")
+
+    def lock_profile(self, account: str | None) -> ProfileLock | None:
+        """
+        Bloqueo del perfil de la cuenta, o None si ya está en uso por otra ejecución
+        """
+        lock = ProfileLock(os.path.join(self.account_dir(account), "profile.lock"))
+        return lock if lock.acquire() else None
+
+    def has_state(self, account: str | None) -> bool:
+        return os.path.exists(self.storage_state_path(account))
+
+    def save(self, context, account: str | None) -> str:
+        """
+        Exporta el storage state del contexto a disco
+        """
+        path = self.storage_state_path(account)
+        context.storage_state(path=path)
+        return path
+
+    def clear(self, account: str | None) -> None:
+        """
+        Elimina la sesión guardada (storage state y perfil) de la cuenta
+        """
+        shutil.rmtree(self.account_dir(account), ignore_errors=True)
@@ -0,0 +1,285 @@
+import json
+import os
+import re
+import threading
+import time
+import uuid
+
+from src.domain.models import CandidateSchema
+
+
+class ExtractionCheckpoint:
+    """
+    Checkpoint durable de una extracción larga, identificado por un token de reanudación.
+    Guarda la última página completada, los ids vistos, los candidatos acumulados y
+    cuáles ya fueron enriquecidos, en dos archivos:
+    - `<token>.json`: instantánea completa, escrita de forma atómica (archivo temporal +
+      `os.replace`) para que una caída a mitad de escritura no corrompa el estado.
+    - `<token>.jsonl`: diario append-only con lo nuevo de cada página y cada perfil
+      enriquecido; el costo de cada registro es proporcional a lo nuevo, no al total.
+    El diario se compacta en la instantánea al cerrar la paginación (`start_enrichment`).
+    """
+    TOKEN_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+    def __init__(
+        self,
+        token: str,
+        params: dict,
+        base_dir: str | None = None,
+        flush_every: int | None = None
+    ):
+        if not self.TOKEN_PATTERN.match(token):
+            raise ValueError(f"Token de reanudación inválido: {token}")
+
+        self.token = token
+        self.params = params
+        self.base_dir = base_dir or os.getenv("CHECKPOINTS_DIR", "data/checkpoints")
+        # Durante el enriquecimiento se sincroniza a disco cada N perfiles, no por cada uno
+        self.flush_every = max(1, flush_every or int(os.getenv("OCC_CHECKPOINT_EVERY", "10")))
+
+        self.status = "paginating"
+        self.page = 0
+        self.seen_ids: set[str] = set()
+        # Tarjetas por id en orden de llegada
+        self.cards: dict[str, CandidateSchema] = {}
+        # Versiones enriquecidas por id: un perfil puede enriquecerse antes de que su
+        # página quede registrada, y no debe perderse al registrarla
+        self.enriched: dict[str, CandidateSchema] = {}
+        # True si el estado se cargó de disco (ejecución reanudada)
+        self.resumed = False
+
+        self._lock = threading.Lock()
+        self._journal = None
+        self._unflushed = 0
+
+    @property
+    def candidates(self) -> list[CandidateSchema]:
+        """
+        Candidatos acumulados, con la versión enriquecida de los que ya la tienen
+        """
+        return [self.enriched.get(key, cand) for key, cand in self.cards.items()]
+
+    @property
+    def enriched_ids(self) -> set[str]:
+        return set(self.enriched)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.base_dir, f"{self.token}.json")
+
+    @property
+    def journal_path(self) -> str:
+        return os.path.join(self.base_dir, f"{self.token}.jsonl")
+
+    @staticmethod
+    def new_token() -> str:
+        return uuid.uuid4().hex[:12]
+
+    @classmethod
+    def load(cls, token: str, base_dir: str | None = None) -> "ExtractionCheckpoint | None":
+        """
+        Carga el checkpoint del token (instantánea + diario), o None si no existe o está dañado.
+        Una línea final incompleta del diario (caída a mitad de escritura) se ignora.
+        """
+        checkpoint = cls(token, params={}, base_dir=base_dir)
+        if not os.path.exists(checkpoint.path):
+            return None
+
+        try:
+            with open(checkpoint.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        checkpoint.params = state.get("params", {})
+        checkpoint.status = state.get("status", "paginating")
+        checkpoint.page = state.get("page", 0)
+        checkpoint.seen_ids = set(state.get("seen_ids", []))
+        enriched_ids = set(state.get("enriched_ids", []))
+        for data in state.get("candidates", []):
+            cand = CandidateSchema(**data)
+            checkpoint._add_card(cand)
+            if cand.id in enriched_ids:
+                checkpoint.enriched[cand.id] = cand
+        # Enriquecidos cuya página no se había registrado todavía
+        for data in state.get("enriched", []):
+            cand = CandidateSchema(**data)
+            checkpoint.enriched.setdefault(cand.id, cand)
+
+        if os.path.exists(checkpoint.journal_path):
+            with open(checkpoint.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    checkpoint._apply(entry)
+
+        checkpoint.resumed = True
+        return checkpoint
+
+    def matches(self, params: dict) -> bool:
+        """
+        True si el checkpoint pertenece a la misma búsqueda
+        """
+        return self.params == params
+
+    def _add_card(self, cand: CandidateSchema, position: int | None = None) -> bool:
+        """
+        Agrega la tarjeta si su id no estaba registrado; retorna True si es nueva
+        """
+        key = cand.id or f"#{len(self.cards) if position is None else position}"
+        if key in self.cards:
+            return False
+        self.cards[key] = cand
+        return True
+
+    def _apply(self, entry: dict) -> None:
+        """
+        Aplica un registro del diario (reaplicarlo es inofensivo)
+        """
+        if entry.get("op") == "page":
+            self.page = entry.get("page", self.page)
+            self.seen_ids.update(entry.get("seen_ids", []))
+            for data in entry.get("candidates", []):
+                self._add_card(CandidateSchema(**data))
+        elif entry.get("op") == "enriched":
+            cand = CandidateSchema(**entry["data"])
+            self.enriched[cand.id] = cand
+
+    def _record_cards(self, seen_ids: set, candidates: list[CandidateSchema]) -> dict:
+        """
+        Registra las tarjetas e ids nuevos y retorna el registro de diario con solo lo nuevo
+        """
+        new_seen = set(seen_ids) - self.seen_ids
+        self.seen_ids.update(new_seen)
+        new_cards = [
+            cand for position, cand in enumerate(candidates)
+            if cand is not None and self._add_card(cand, position)
+        ]
+        return {
+            "op": "page",
+            "page": self.page,
+            "seen_ids": sorted(new_seen),
+            "candidates": [cand.model_dump() for cand in new_cards]
+        }
+
+    def record_page(
+        self, page_index: int, seen_ids: set, candidates: list[CandidateSchema]
+    ) -> None:
+        """
+        Marca la página como completada con el estado acumulado hasta ella
+        (al diario solo se agrega lo nuevo de la página)
+        """
+        with self._lock:
+            self.page = page_index
+            self._append(self._record_cards(seen_ids, candidates), sync=True)
+
+    def start_enrichment(self, candidates: list[CandidateSchema]) -> None:
+        """
+        Cierra la fase de paginación: al reanudar ya no se vuelve a paginar.
+        Compacta el diario en la instantánea.
+        """
+        with self._lock:
+            self.status = "enriching"
+            self._record_cards(self.seen_ids, candidates)
+            self._compact()
+
+    def mark_enriched(self, cand: CandidateSchema) -> None:
+        """
+        Registra un perfil enriquecido (thread-safe, sincronizado cada `flush_every`)
+        """
+        if not cand.id:
+            return
+        with self._lock:
+            self.enriched[cand.id] = cand
+            self._unflushed += 1
+            self._append(
+                {"op": "enriched", "data": cand.model_dump()},
+                sync=self._unflushed >= self.flush_every
+            )
+
+    def is_enriched(self, candidate_id: str | None) -> bool:
+        return bool(candidate_id) and candidate_id in self.enriched
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._journal is None:
+                self._compact()
+            else:
+                self._sync()
+
+    def clear(self) -> None:
+        """
+        Elimina el checkpoint (la extracción terminó)
+        """
+        with self._lock:
+            self._close_journal()
+            for path in (self.path, self.journal_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _append(self, entry: dict, sync: bool) -> None:
+        """
+        Agrega un registro al diario. La primera vez escribe la instantánea base
+        (parámetros de la búsqueda) si aún no existe.
+        """
+        if self._journal is None:
+            if not os.path.exists(self.path):
+                self._write_snapshot()
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+            # Tras una caída la última línea puede estar incompleta: el registro nuevo va aparte
+            if self._journal.tell() > 0 and not self._ends_with_newline():
+                self._journal.write("\n")
+        self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        if sync:
+            self._sync()
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.journal_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _sync(self) -> None:
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._unflushed = 0
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _compact(self) -> None:
+        """
+        Escribe la instantánea completa y elimina el diario (ya quedó incluido en ella)
+        """
+        self._close_journal()
+        self._write_snapshot()
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def _write_snapshot(self) -> None:
+        os.makedirs(self.base_dir, exist_ok=True)
+        state = {
+            "token": self.token,
+            "params": self.params,
+            "status": self.status,
+            "page": self.page,
+            "seen_ids": sorted(self.seen_ids),
+            "candidates": [cand.model_dump() for cand in self.candidates],
+            "enriched_ids": sorted(self.enriched),
+            "enriched": [
+                cand.model_dump()
+                for cand_id, cand in self.enriched.items()
+                if cand_id not in self.cards
+            ],
+            "updated_at": time.time()
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._unflushed = 0
@@ -0,0 +1,488 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import uuid
+
+from src.domain.models import CandidateSchema
+
+# Valores de relleno de las tarjetas que no cuentan como dato real
+PLACEHOLDERS = {"name": {"confidencial"}, "position": {"sin título", "sin titulo"}}
+
+# Campos que se combinan entre fuentes (los de procedencia se calculan aparte)
+MERGE_FIELDS = [
+    "name", "position", "email", "phone", "location", "salary", "specialty",
+    "education", "last_updated", "skills", "experience", "id", "url", "source"
+]
+
+
+def _fold(text: str | None) -> str:
+    """
+    Minúsculas, sin acentos y con espacios colapsados
+    """
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(re.sub(r"[^\w@.+ ]", " ", text.lower()).split())
+
+
+class CandidateIdentityIndex:
+    """
+    Índice persistente (SQLite) de identidades de candidatos entre fuentes y búsquedas.
+    - Claves exactas: email y teléfono normalizados, nombre + ubicación y la referencia
+      de origen (`fuente:id`).
+    - Casi duplicados: MinHash sobre experiencia y habilidades con LSH por bandas; un
+      candidato de la banda se acepta si la similitud estimada supera el umbral y ambos
+      registros tienen un dato de contacto (email o teléfono). Las tarjetas sin perfil
+      (nombre confidencial, sin contacto) solo se combinan por claves exactas.
+    - Cada alta consulta un número fijo de claves y bandas, así que resolver n candidatos
+      es O(n) y se puede hacer a medida que llegan los resultados.
+    El registro combinado guarda la procedencia (`fuente:id`) de cada campo.
+    """
+    NUM_PERM = 64
+    BANDS = 16
+    MIN_SHINGLES = 5
+    _MERSENNE = (1 << 61) - 1
+
+    def __init__(self, path: str | None = None, near_duplicate_threshold: float | None = None):
+        self.path = path or os.getenv("IDENTITY_INDEX_PATH", "data/cache/identity_index.sqlite3")
+        self.threshold = (
+            near_duplicate_threshold
+            if near_duplicate_threshold is not None
+            else float(os.getenv("IDENTITY_NEAR_DUP_THRESHOLD", "0.8"))
+        )
+        self.rows = self.NUM_PERM // self.BANDS
+
+        # Permutaciones (a*x + b) mod p fijas: las firmas deben ser estables entre ejecuciones
+        seeds = [
+            hashlib.blake2b(f"rpa-identity-{i}".encode(), digest_size=16).digest()
+            for i in range(self.NUM_PERM)
+        ]
+        self._perms = [
+            (
+                int.from_bytes(seed[:8], "big") % self._MERSENNE | 1,
+                int.from_bytes(seed[8:], "big") % self._MERSENNE
+            )
+            for seed in seeds
+        ]
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS identities (
+                identity_id TEXT PRIMARY KEY,
+                record TEXT NOT NULL,
+                signature TEXT,
+                enriched INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS identity_keys (
+                key TEXT PRIMARY KEY,
+                identity_id TEXT NOT NULL,
+                fingerprint TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_identity_keys_identity ON identity_keys (identity_id);
+            CREATE TABLE IF NOT EXISTS identity_bands (
+                band TEXT NOT NULL,
+                identity_id TEXT NOT NULL,
+                PRIMARY KEY (band, identity_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_identity_bands_identity ON identity_bands (identity_id);
+            """
+        )
+        self._conn.commit()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self._stats = {"new": 0, "exact": 0, "near_duplicate": 0, "merged_identities": 0}
+
+    def stats(self) -> dict:
+        return dict(self._stats)
+
+    # --- Normalización y claves ---
+
+    @staticmethod
+    def normalize_email(email: str | None) -> str | None:
+        email = (email or "").strip().lower()
+        if "@" not in email:
+            return None
+        local, domain = email.rsplit("@", 1)
+        return f"{local.split('+', 1)[0]}@{domain}"
+
+    @staticmethod
+    def normalize_phone(phone: str | None) -> str | None:
+        """
+        Solo dígitos; los números de México se reducen a sus 10 dígitos (sin 52 / 521)
+        """
+        digits = re.sub(r"\D", "", phone or "")
+        if len(digits) < 8:
+            return None
+        return digits[-10:]
+
+    @staticmethod
+    def _real(field: str, value) -> bool:
+        if value in (None, "", []):
+            return False
+        if isinstance(value, str) and _fold(value) in PLACEHOLDERS.get(field, set()):
+            return False
+        return True
+
+    @staticmethod
+    def source_ref(cand: CandidateSchema) -> str:
+        return f"{cand.source or 'desconocida'}:{cand.id or cand.url}"
+
+    def keys_for(self, cand: CandidateSchema) -> list[str]:
+        """
+        Claves exactas del candidato, de la más a la menos confiable
+        """
+        keys = [f"ref:{self.source_ref(cand)}"]
+        email = self.normalize_email(cand.email)
+        if email:
+            keys.append(f"email:{email}")
+        phone = self.normalize_phone(cand.phone)
+        if phone:
+            keys.append(f"phone:{phone}")
+        name = _fold(cand.name) if self._real("name", cand.name) else ""
+        if len(name.split()) >= 2 and cand.location:
+            keys.append(f"name_loc:{name}|{_fold(cand.location)}")
+        return keys
+
+    # --- MinHash / LSH ---
+
+    @staticmethod
+    def _shingles(cand: CandidateSchema) -> set[str]:
+        """
+        Habilidades como tokens y trigramas de palabras de la experiencia
+        """
+        shingles = {f"skill:{_fold(skill)}" for skill in cand.skills or [] if skill}
+        for exp in cand.experience or []:
+            words = _fold(" ".join(
+                part for part in (exp.position, exp.company, exp.description) if part
+            )).split()
+            shingles.update(
+                f"exp:{' '.join(words[i:i + 3])}" for i in range(max(len(words) - 2, 1)) if words
+            )
+        return shingles
+
+    def signature(self, cand: CandidateSchema) -> list[int] | None:
+        shingles = self._shingles(cand)
+        if len(shingles) < self.MIN_SHINGLES:
+            return None
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+            for s in shingles
+        ]
+        return [min((a * h + b) % self._MERSENNE for h in hashes) for a, b in self._perms]
+
+    def _bands(self, signature: list[int]) -> list[str]:
+        return [
+            f"{band}:" + hashlib.blake2b(
+                json.dumps(signature[band * self.rows:(band + 1) * self.rows]).encode("utf-8"),
+                digest_size=8
+            ).hexdigest()
+            for band in range(self.BANDS)
+        ]
+
+    @staticmethod
+    def similarity(first: list[int], second: list[int]) -> float:
+        return sum(a == b for a, b in zip(first, second)) / len(first)
+
+    # --- Resolución y combinación ---
+
+    def _record(self, identity_id: str) -> tuple[CandidateSchema, list[int] | None, bool] | None:
+        row = self._conn.execute(
+            "SELECT record, signature, enriched FROM identities WHERE identity_id = ?",
+            (identity_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return (
+            CandidateSchema(**json.loads(row[0])),
+            json.loads(row[1]) if row[1] else None,
+            bool(row[2])
+        )
+
+    def _compatible(self, first: CandidateSchema, second: CandidateSchema) -> bool:
+        """
+        Dos registros con emails o nombres reales distintos no son la misma persona
+        """
+        first_email, second_email = (
+            self.normalize_email(first.email),
+            self.normalize_email(second.email)
+        )
+        if first_email and second_email and first_email != second_email:
+            return False
+        if self._real("name", first.name) and self._real("name", second.name):
+            return _fold(first.name) == _fold(second.name)
+        return True
+
+    def _has_strong_key(self, cand: CandidateSchema) -> bool:
+        """
+        True si el registro tiene un dato que identifica a la persona fuera de su fuente
+        (email o teléfono). El id del perfil solo identifica dentro de su fuente y ya
+        es una clave exacta (`ref:`).
+        """
+        return bool(self.normalize_email(cand.email) or self.normalize_phone(cand.phone))
+
+    def _lookup(
+        self, cand: CandidateSchema, keys: list[str], signature: list[int] | None
+    ) -> tuple[list[str], str]:
+        """
+        Identidades existentes que coinciden con el candidato y el tipo de coincidencia
+        """
+        matches: list[str] = []
+        for position, key in enumerate(keys):
+            row = self._conn.execute(
+                "SELECT identity_id FROM identity_keys WHERE key = ?", (key,)
+            ).fetchone()
+            if not row or row[0] in matches:
+                continue
+            # La referencia de origen siempre es la misma persona; las demás claves
+            # (e.g. un teléfono compartido) se descartan si los registros se contradicen
+            if position > 0:
+                stored = self._record(row[0])
+                if stored is None or not self._compatible(stored[0], cand):
+                    continue
+            matches.append(row[0])
+        if matches or signature is None or not self._has_strong_key(cand):
+            return matches, "exact"
+
+        candidates = {
+            row[0]
+            for band in self._bands(signature)
+            for row in self._conn.execute(
+                "SELECT identity_id FROM identity_bands WHERE band = ?", (band,)
+            )
+        }
+        best, best_score = None, self.threshold
+        for identity_id in candidates:
+            stored = self._record(identity_id)
+            if (
+                stored is None or stored[1] is None
+                or not self._has_strong_key(stored[0]) or not self._compatible(stored[0], cand)
+            ):
+                continue
+            score = self.similarity(stored[1], signature)
+            if score >= best_score:
+                best, best_score = identity_id, score
+        return ([best], "near_duplicate") if best else ([], "new")
+
+    def merge(self, current: CandidateSchema, incoming: CandidateSchema) -> CandidateSchema:
+        """
+        Combina campo por campo. Un campo vacío se completa con el entrante y un campo
+        se actualiza si el entrante viene de la misma referencia que lo aportó.
+        Las habilidades se unen. `provenance` registra qué referencia aportó cada campo.
+        """
+        ref = self.source_ref(incoming)
+        provenance = dict(current.provenance or {})
+        update = {}
+        for field in MERGE_FIELDS:
+            old, new = getattr(current, field), getattr(incoming, field)
+            if not self._real(field, new):
+                continue
+            if field == "skills" and self._real(field, old):
+                merged = list(dict.fromkeys([*old, *new]))
+                if merged != old:
+                    update[field] = merged
+                continue
+            if not self._real(field, old) or provenance.get(field) == ref:
+                if new != old:
+                    update[field] = new
+                provenance[field] = ref
+        sources = list(dict.fromkeys([*(current.sources or []), *(incoming.sources or [ref])]))
+        return current.model_copy(update={**update, "provenance": provenance, "sources": sources})
+
+    def _new_record(self, cand: CandidateSchema, identity_id: str) -> CandidateSchema:
+        ref = self.source_ref(cand)
+        provenance = dict(cand.provenance or {}) or {
+            field: ref for field in MERGE_FIELDS if self._real(field, getattr(cand, field))
+        }
+        return cand.model_copy(update={
+            "identity_id": identity_id,
+            "provenance": provenance,
+            "sources": cand.sources or [ref]
+        })
+
+    def _is_enriched(self, cand: CandidateSchema) -> bool:
+        return bool(cand.email or cand.phone or self._real("name", cand.name))
+
+    def _save(self, identity_id: str, record: CandidateSchema, enriched: bool) -> list[int] | None:
+        signature = self.signature(record)
+        self._conn.execute(
+            """
+            INSERT INTO identities (identity_id, record, signature, enriched, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(identity_id) DO UPDATE SET
+                record = excluded.record, signature = excluded.signature,
+                enriched = MAX(identities.enriched, excluded.enriched), updated_at =
+                excluded.updated_at
+            """,
+            (
+                identity_id,
+                json.dumps(record.model_dump(), ensure_ascii=False),
+                json.dumps(signature) if signature else None,
+                int(enriched),
+                time.time()
+            )
+        )
+        if signature:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO identity_bands (band, identity_id) VALUES (?, ?)",
+                [(band, identity_id) for band in self._bands(signature)]
+            )
+        return signature
+
+    def _absorb(self, keep: str, drop: str) -> CandidateSchema | None:
+        """
+        Une dos identidades existentes que resultaron ser la misma persona
+        """
+        kept, dropped = self._record(keep), self._record(drop)
+        if kept is None or dropped is None or not self._compatible(kept[0], dropped[0]):
+            return None
+        merged = self.merge(kept[0], dropped[0])
+        self._conn.execute(
+            "UPDATE identity_keys SET identity_id = ? WHERE identity_id = ?", (keep, drop)
+        )
+        self._conn.execute(
+            "UPDATE OR IGNORE identity_bands SET identity_id = ? WHERE identity_id = ?",
+            (keep, drop)
+        )
+        self._conn.execute("DELETE FROM identity_bands WHERE identity_id = ?", (drop,))
+        self._conn.execute("DELETE FROM identities WHERE identity_id = ?", (drop,))
+        self._save(keep, merged, kept[2] or dropped[2])
+        self._stats["merged_identities"] += 1
+        return merged
+
+    def _add_one(
+        self, cand: CandidateSchema, fingerprint: str | None
+    ) -> tuple[str, CandidateSchema, list[str]]:
+        keys = self.keys_for(cand)
+        signature = self.signature(cand)
+        matches, kind = self._lookup(cand, keys, signature)
+        absorbed = []
+
+        if not matches:
+            identity_id = uuid.uuid4().hex[:12]
+            record = self._new_record(cand, identity_id)
+            self._stats["new"] += 1
+        else:
+            identity_id = matches[0]
+            for other in matches[1:]:
+                if self._absorb(identity_id, other) is not None:
+                    absorbed.append(other)
+            record = self.merge(self._record(identity_id)[0], cand)
+            self._stats[kind] += 1
+
+        self._save(identity_id, record, self._is_enriched(cand))
+        # Las claves que ya pertenecen a otra identidad incompatible se conservan
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO identity_keys (key, identity_id) VALUES (?, ?)",
+            [(key, identity_id) for key in keys]
+        )
+        if fingerprint is not None:
+            self._conn.execute(
+                "UPDATE identity_keys SET fingerprint = ? WHERE key = ?", (fingerprint, keys[0])
+            )
+        return identity_id, record, absorbed
+
+    def add(
+        self, cand: CandidateSchema, fingerprint: str | None = None
+    ) -> tuple[str, CandidateSchema]:
+        """
+        Resuelve el candidato contra el índice, lo combina y retorna (identity_id, registro
+        combinado).
+        `fingerprint` (indicador de actividad de la tarjeta) permite saber después si la
+        referencia cambió desde que se enriqueció.
+        """
+        with self._lock:
+            identity_id, record, _ = self._add_one(cand, fingerprint)
+            self._conn.commit()
+        return identity_id, record
+
+    def resolved(self, cand: CandidateSchema) -> CandidateSchema | None:
+        """
+        Registro combinado si la referencia del candidato ya pertenece a una identidad
+        enriquecida y su huella (actividad) no cambió; None si hay que enriquecerlo.
+        Una referencia registrada sin huella no se puede comprobar y se considera obsoleta.
+        """
+        key = self.keys_for(cand)[0]
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT identity_id, fingerprint FROM identity_keys WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] is None or (cand.last_updated and row[1] != cand.last_updated):
+                return None
+            stored = self._record(row[0])
+        if stored is None or not stored[2]:
+            return None
+        return stored[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class IdentityMerger:
+    """
+    Combinación incremental de los resultados de una ejecución sobre el índice de identidades:
+    `add` se llama a medida que llegan los candidatos y `results()` retorna un registro por
+    identidad, en el orden en que aparecieron.
+    Con `keep_records=False` solo se recuerdan los ids (streaming: los registros los persiste
+    quien consume `merge`, y `pop_removed` indica cuáles quedaron absorbidos por otra identidad).
+    """
+
+    def __init__(self, index: CandidateIdentityIndex, keep_records: bool = True):
+        self.index = index
+        self.keep_records = keep_records
+        self._records: dict[str, CandidateSchema | str | None] = {}
+        self._removed: list[tuple[str, str | None]] = []
+
+    def merge(self, candidates: list[CandidateSchema]) -> list[tuple[CandidateSchema, bool]]:
+        """
+        Combina un lote (una transacción) y retorna por candidato (registro combinado,
+        True si abrió una identidad nueva en esta ejecución)
+        """
+        merged = []
+        with self.index._lock:
+            for cand in candidates:
+                if cand is None:
+                    continue
+                identity_id, record, absorbed = self.index._add_one(cand, None)
+                for other in absorbed:
+                    if other in self._records:
+                        previous = self._records.pop(other)
+                        previous_id = (
+                            previous.id if isinstance(previous, CandidateSchema) else previous
+                        )
+                        self._removed.append((other, previous_id))
+                merged.append((record, identity_id not in self._records))
+                self._records[identity_id] = record if self.keep_records else record.id
+            self.index._conn.commit()
+        return merged
+
+    def add(self, candidates: list[CandidateSchema]) -> list[CandidateSchema]:
+        """
+        Agrega un lote y retorna los candidatos que abrieron una identidad nueva en esta ejecución
+        """
+        return [record for record, created in self.merge(candidates) if created]
+
+    def pop_removed(self) -> list[tuple[str, str | None]]:
+        """
+        (identity_id, id del registro) de las identidades absorbidas desde la última llamada
+        """
+        removed, self._removed = self._removed, []
+        return removed
+
+    def results(self) -> list[CandidateSchema]:
+        return [record for record in self._records.values() if isinstance(record, CandidateSchema)]
+
+    def __len__(self) -> int:
+        return len(self._records)
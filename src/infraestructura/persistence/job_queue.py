@@ -0,0 +1,286 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from src.domain.models import SearchJob
+
+COLUMNS = (
+    "id", "keyword", "location", "result_limit", "sources", "priority", "time_budget", "status",
+    "worker", "progress", "total", "result_file", "partial", "error", "cancel_requested",
+    "created_at", "started_at", "finished_at", "heartbeat_at"
+)
+
+
+class SearchJobQueue:
+    """
+    Cola persistente (SQLite) de búsquedas compartida entre la UI, el CLI y los procesos worker.
+    - `claim` toma el siguiente trabajo por prioridad y antigüedad de forma atómica entre
+      procesos, respetando el máximo global de trabajos en ejecución y el límite por portal.
+    - Los workers reportan avance con `heartbeat`; un trabajo sin latido se re-encola
+      (el worker que lo tenía murió).
+    - La cancelación de un trabajo en ejecución es cooperativa (`cancel_requested`).
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or os.getenv("JOBS_DB_PATH", "data/jobs.sqlite3")
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Varios procesos usan la misma base: WAL para lecturas concurrentes y espera ante bloqueos
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                keyword TEXT NOT NULL,
+                location TEXT,
+                result_limit INTEGER NOT NULL,
+                sources TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                time_budget REAL,
+                status TEXT NOT NULL,
+                worker TEXT,
+                progress TEXT NOT NULL DEFAULT '{}',
+                total INTEGER,
+                result_file TEXT,
+                partial INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                cancel_requested INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                heartbeat_at REAL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs (status, priority, created_at)"
+        )
+
+    @staticmethod
+    def _to_job(row: tuple) -> SearchJob:
+        data = dict(zip(COLUMNS, row))
+        return SearchJob(
+            id=data["id"],
+            keyword=data["keyword"],
+            location=data["location"],
+            limit=data["result_limit"],
+            sources=json.loads(data["sources"]),
+            priority=data["priority"],
+            time_budget=data["time_budget"],
+            status=data["status"],
+            worker=data["worker"],
+            progress=json.loads(data["progress"] or "{}"),
+            total=data["total"],
+            result_file=data["result_file"],
+            partial=bool(data["partial"]),
+            error=data["error"],
+            cancel_requested=bool(data["cancel_requested"]),
+            created_at=data["created_at"],
+            started_at=data["started_at"],
+            finished_at=data["finished_at"]
+        )
+
+    def submit(
+        self,
+        keyword: str,
+        location: str | None = None,
+        limit: int = 100,
+        sources: list[str] | None = None,
+        priority: int = 0,
+        time_budget: float | None = None
+    ) -> str:
+        """
+        Encola una búsqueda y retorna el id del trabajo
+        """
+        job_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO jobs (id, keyword, location, result_limit, sources, priority,
+                time_budget, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'queued', ?)
+                """,
+                (
+                    job_id,
+                    keyword,
+                    location,
+                    limit,
+                    json.dumps(sources or ["occ"]),
+                    priority,
+                    time_budget,
+                    time.time()
+                )
+            )
+        return job_id
+
+    def get(self, job_id: str) -> SearchJob | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def list(self, status: str | None = None, limit: int = 50) -> list[SearchJob]:
+        """
+        Trabajos más recientes primero (opcionalmente de un estado)
+        """
+        query = f"SELECT {', '.join(COLUMNS)} FROM jobs"
+        params: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(query, params + (limit,)).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def claim(
+        self,
+        worker: str,
+        max_running: int,
+        portal_limits: dict[str, int] | None = None
+    ) -> SearchJob | None:
+        """
+        Toma el siguiente trabajo en cola (mayor prioridad, luego el más antiguo) si hay cupo
+        global y en cada uno de sus portales. La transacción IMMEDIATE evita que dos workers
+        excedan los límites, y el trabajo se toma con un solo UPDATE condicionado a que siga
+        en cola: si otro worker ya lo tomó no se modifica ninguna fila y se prueba el siguiente.
+        """
+        portal_limits = portal_limits or {}
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                running = self._conn.execute(
+                    "SELECT sources FROM jobs WHERE status = 'running'"
+                ).fetchall()
+                if len(running) >= max_running:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                per_portal: dict[str, int] = {}
+                for (sources,) in running:
+                    for source in json.loads(sources):
+                        per_portal[source] = per_portal.get(source, 0) + 1
+
+                candidates = self._conn.execute(
+                    f"""
+                    SELECT {', '.join(COLUMNS)} FROM jobs WHERE status = 'queued'
+                    ORDER BY priority DESC, created_at ASC
+                    """
+                ).fetchall()
+                for row in candidates:
+                    job = self._to_job(row)
+                    if all(
+                        per_portal.get(source, 0) < portal_limits[source]
+                        for source in job.sources if source in portal_limits
+                    ):
+                        cursor = self._conn.execute(
+                            """
+                            UPDATE jobs SET status = 'running', worker = ?, started_at = ?,
+                            heartbeat_at = ?
+                            WHERE id = ? AND status = 'queued'
+                            """,
+                            (worker, now, now, job.id)
+                        )
+                        if cursor.rowcount != 1:
+                            continue
+                        self._conn.execute("COMMIT")
+                        return job.model_copy(
+                            update={"status": "running", "worker": worker, "started_at": now}
+                        )
+
+                self._conn.execute("COMMIT")
+                return None
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def heartbeat(self, job_id: str, progress: dict | None = None) -> bool:
+        """
+        Registra el latido (y el avance) de un trabajo en ejecución.
+        Retorna True si se pidió cancelarlo.
+        """
+        with self._lock:
+            if progress is None:
+                self._conn.execute(
+                    "UPDATE jobs SET heartbeat_at = ? WHERE id = ?", (time.time(), job_id)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE jobs SET heartbeat_at = ?, progress = ? WHERE id = ?",
+                    (time.time(), json.dumps(progress, ensure_ascii=False), job_id)
+                )
+            row = self._conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        total: int | None = None,
+        result_file: str | None = None,
+        partial: bool = False,
+        error: str | None = None
+    ) -> None:
+        """
+        Cierra un trabajo con su estado final ("done", "failed" o "cancelled")
+        """
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, total = ?, result_file = ?, partial = ?, error = ?,
+                finished_at = ?
+                WHERE id = ?
+                """,
+                (status, total, result_file, int(partial), error, time.time(), job_id)
+            )
+
+    def cancel(self, job_id: str) -> None:
+        """
+        Un trabajo en cola se cancela de inmediato; uno en ejecución se marca para que
+        su worker lo detenga en el siguiente punto de control (conserva lo obtenido)
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ? AND status = "
+                "'queued'",
+                (time.time(), job_id)
+            )
+            self._conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'",
+                (job_id,)
+            )
+
+    def requeue_stale(self, timeout_seconds: float) -> int:
+        """
+        Re-encola los trabajos en ejecución sin latido reciente (su worker murió);
+        los que tenían cancelación pendiente quedan cancelados. Retorna cuántos se liberaron.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE jobs SET
+                    status = CASE WHEN cancel_requested = 1 THEN 'cancelled' ELSE 'queued' END,
+                    worker = NULL, started_at = NULL, heartbeat_at = NULL
+                WHERE status = 'running' AND heartbeat_at < ?
+                """,
+                (time.time() - timeout_seconds,)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
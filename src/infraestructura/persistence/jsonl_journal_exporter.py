@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from src.domain.interfaces import DataExporter
+from src.domain.models import CandidateSchema
+from src.infraestructura.logging import ConsoleLogHandler, Logger
+
+
+class JsonlJournalExporter(DataExporter):
+    """
+    Exportador en diario append-only (JSON Lines).
+    - `append` escribe solo los candidatos nuevos de cada página: el costo por página
+      es constante en vez de reescribir la lista completa.
+    - `upsert` registra las actualizaciones del enriquecimiento.
+    - `remove` descarta registros (e.g. absorbidos por otra identidad).
+    - `compact` aplica el diario en orden y genera el JSON consolidado final
+      (mismo formato que JsonExporter).
+    Las escrituras se sincronizan a disco (fsync) cada N registros o T segundos.
+    """
+
+    def __init__(self, fsync_every: int | None = None, fsync_interval: float | None = None):
+        self.logger = Logger(handlers=[ConsoleLogHandler()])
+        self.fsync_every = max(1, fsync_every or int(os.getenv("JOURNAL_FSYNC_EVERY", "50")))
+        self.fsync_interval = fsync_interval if fsync_interval is not None else float(
+            os.getenv("JOURNAL_FSYNC_SECONDS", "5")
+        )
+
+        self.filename: str | None = None
+        self._file = None
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @staticmethod
+    def journal_path(filename: str) -> str:
+        """
+        Ruta del diario asociado al JSON final (e.g. candidates.json -> candidates.jsonl)
+        """
+        return f"{os.path.splitext(filename)[0]}.jsonl"
+
+    def open(self, filename: str, truncate: bool = True) -> None:
+        """
+        Abre el diario del archivo final. Con `truncate=False` continúa uno existente (reanudación).
+        """
+        self.close()
+        self.filename = filename
+        path = self.journal_path(filename)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._file = open(path, "w" if truncate else "a", encoding="utf-8")
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def append(self, candidates: list[CandidateSchema]) -> None:
+        """
+        Registra candidatos nuevos (si el id ya existe en el diario se conserva el primero)
+        """
+        self._write("add", candidates)
+
+    def upsert(self, candidates: list[CandidateSchema]) -> None:
+        """
+        Registra versiones actualizadas de candidatos (reemplazan a las anteriores)
+        """
+        self._write("upsert", candidates)
+
+    def remove(self, candidate_ids: list[str]) -> None:
+        """
+        Registra la eliminación de candidatos por id
+        """
+        self._write_entries([{"op": "remove", "data": {"id": cid}} for cid in candidate_ids if cid])
+
+    def _write(self, op: str, candidates: list[CandidateSchema]) -> None:
+        self._write_entries([{"op": op, "data": cand.model_dump()} for cand in candidates])
+
+    def _write_entries(self, entries: list[dict]) -> None:
+        if self._file is None:
+            raise RuntimeError("El diario no está abierto; llamar a open() primero.")
+        if not entries:
+            return
+
+        lines = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        with self._lock:
+            self._file.write(lines)
+            self._unsynced += len(entries)
+            if (
+                self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Sincroniza y cierra el diario (se puede compactar o continuar después)
+        """
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+
+    @staticmethod
+    def record_key(data: dict) -> str:
+        """
+        Clave de un registro del diario: su id, o su URL, o un hash de su contenido,
+        para que repetir un registro sin id no lo duplique
+        """
+        if data.get("id"):
+            return data["id"]
+        if data.get("url"):
+            return f"url:{data['url']}"
+        content = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        return f"sha1:{hashlib.sha1(content.encode('utf-8')).hexdigest()}"
+
+    @classmethod
+    def read_journal(cls, filename: str) -> list[dict]:
+        """
+        Aplica el diario en orden y retorna los registros consolidados.
+        Una línea final incompleta (caída a mitad de escritura) se ignora.
+        """
+        records: dict = {}
+        path = cls.journal_path(filename)
+        if not os.path.exists(path):
+            return []
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                data = entry.get("data") or {}
+                key = cls.record_key(data)
+                if entry.get("op") == "remove":
+                    records.pop(key, None)
+                elif entry.get("op") == "upsert" or key not in records:
+                    records[key] = data
+        return list(records.values())
+
+    def compact(self, filename: str | None = None, remove_journal: bool = True) -> int:
+        """
+        Genera el JSON consolidado final a partir del diario y retorna el número de registros
+        """
+        filename = filename or self.filename
+        if filename is None:
+            raise ValueError("No hay archivo de diario que compactar.")
+        if filename == self.filename:
+            self.close()
+
+        records = self.read_journal(filename)
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{filename}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, filename)
+
+        if remove_journal and os.path.exists(self.journal_path(filename)):
+            os.remove(self.journal_path(filename))
+
+        self.logger.info("save", f"Diario compactado: {len(records)} registros en {filename}.")
+        return len(records)
+
+    def save(self, data: list[CandidateSchema], filename: str) -> None:
+        """
+        Contrato de DataExporter: escribe los datos como un diario nuevo y lo compacta
+        """
+        self.logger.info(
+            "save",
+            f"Guardando {len(data)} registros en {filename}..."
+        )
+        try:
+            self.open(filename, truncate=True)
+            self.append(data)
+            self.compact(filename)
+            self.logger.info(
+                "save",
+                "Guardado exitoso."
+            )
+        except Exception as e:
+            self.logger.error(
+                "save",
+                f"Error al guardar JSON: {e}"
+            )
+            raise
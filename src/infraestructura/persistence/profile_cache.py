@@ -0,0 +1,158 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from src.domain.models import Experience
+
+
+class ProfileCache:
+    """
+    Caché persistente (SQLite) de los detalles parseados de perfiles, por id de candidato.
+    - Expira las entradas por TTL y limita el tamaño con desalojo LRU.
+    - Invalida una entrada si el indicador de actividad de la tarjeta cambió
+      respecto al que se tenía cuando se guardó el perfil.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None
+    ):
+        self.path = path or os.getenv("PROFILE_CACHE_PATH", "data/cache/profiles.sqlite3")
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("PROFILE_CACHE_TTL_HOURS", "72")
+        ) * 3600
+        self.max_entries = max_entries or int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "20000"))
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Una sola conexión compartida entre los workers, protegida con lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS profiles (
+                candidate_id TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                fingerprint TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_profiles_accessed ON profiles (accessed_at)"
+        )
+        self._conn.commit()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """
+        Reinicia los contadores de la ejecución
+        """
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "invalidated": 0, "evicted": 0}
+
+    def stats(self) -> dict:
+        return dict(self._stats)
+
+    @staticmethod
+    def _serialize(details: dict) -> str:
+        data = dict(details)
+        data["experience"] = [
+            exp.model_dump() if isinstance(exp, Experience) else exp
+            for exp in data.get("experience") or []
+        ]
+        return json.dumps(data, ensure_ascii=False)
+
+    @staticmethod
+    def _deserialize(payload: str) -> dict:
+        data = json.loads(payload)
+        data["experience"] = [Experience(**exp) for exp in data.get("experience") or []]
+        return data
+
+    def get(self, candidate_id: str | None, fingerprint: str | None = None) -> dict | None:
+        """
+        Retorna los detalles cacheados o None (miss, expirado o invalidado por actividad)
+        """
+        if not candidate_id:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fingerprint, stored_at FROM profiles WHERE candidate_id = ?",
+                (candidate_id,)
+            ).fetchone()
+
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+
+            payload, stored_fingerprint, stored_at = row
+            reason = None
+            if now - stored_at > self.ttl_seconds:
+                reason = "expired"
+            elif fingerprint and stored_fingerprint and fingerprint != stored_fingerprint:
+                # La tarjeta muestra actividad distinta: el perfil cambió
+                reason = "invalidated"
+
+            if reason:
+                self._conn.execute("DELETE FROM profiles WHERE candidate_id = ?", (candidate_id,))
+                self._conn.commit()
+                self._stats[reason] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE profiles SET accessed_at = ? WHERE candidate_id = ?", (now, candidate_id)
+            )
+            self._conn.commit()
+            self._stats["hits"] += 1
+
+        return self._deserialize(payload)
+
+    def put(self, candidate_id: str | None, details: dict, fingerprint: str | None = None) -> None:
+        """
+        Guarda los detalles del perfil y desaloja las entradas menos usadas si se excede el tamaño
+        """
+        if not candidate_id:
+            return
+
+        now = time.time()
+        payload = self._serialize(details)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO profiles (candidate_id, payload, fingerprint, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(candidate_id) DO UPDATE SET
+                    payload = excluded.payload,
+                    fingerprint = excluded.fingerprint,
+                    stored_at = excluded.stored_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (candidate_id, payload, fingerprint, now, now)
+            )
+
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    """
+                    DELETE FROM profiles WHERE candidate_id IN (
+                        SELECT candidate_id FROM profiles ORDER BY accessed_at ASC LIMIT ?
+                    )
+                    """,
+                    (overflow,)
+                )
+                self._stats["evicted"] += overflow
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,239 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+
+from src.domain.models import CandidateSchema
+
+
+@dataclass
+class CachedSearch:
+    """
+    Resultado cacheado de una búsqueda (fuente, palabra clave, ubicación)
+    """
+    candidates: list[CandidateSchema]
+    limit: int
+    exhausted: bool
+    age_seconds: float
+    fresh: bool
+
+    def covers(self, limit: int) -> bool:
+        """
+        True si basta para `limit`: tiene suficientes candidatos o la fuente ya no tenía más
+        """
+        return self.exhausted or len(self.candidates) >= limit or self.limit >= limit
+
+
+class SearchResultCache:
+    """
+    Caché persistente (SQLite) de resultados de búsqueda por fuente, palabra clave
+    normalizada y ubicación, con el límite con el que se obtuvo.
+    - Dentro del TTL la entrada está fresca; hasta `max_stale_seconds` se sirve como
+      obsoleta mientras se refresca en segundo plano; después se descarta.
+    - Limita el tamaño con desalojo LRU.
+    - Una entrada con un límite menor sirve de prefijo para una búsqueda con límite mayor.
+    """
+
+    # Refrescos en curso en el proceso (compartidos entre instancias)
+    _refreshing: set[str] = set()
+    _refreshing_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_seconds: float | None = None,
+        max_stale_seconds: float | None = None,
+        max_entries: int | None = None,
+        max_refreshes: int | None = None
+    ):
+        self.path = path or os.getenv("SEARCH_CACHE_PATH", "data/cache/search_results.sqlite3")
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("SEARCH_CACHE_TTL_HOURS", "6")
+        ) * 3600
+        self.max_stale_seconds = max_stale_seconds if max_stale_seconds is not None else float(
+            os.getenv("SEARCH_CACHE_MAX_STALE_HOURS", "24")
+        ) * 3600
+        self.max_entries = max_entries or int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "500"))
+        # Refrescos en segundo plano simultáneos en el proceso; el resto se omite y la entrada
+        # obsoleta se vuelve a intentar en la siguiente búsqueda
+        self.max_refreshes = max(
+            1, max_refreshes or int(os.getenv("SEARCH_CACHE_MAX_REFRESHES", "2"))
+        )
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Una sola conexión compartida entre los hilos de scrapers y refrescos, protegida con lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS searches (
+                query_key TEXT PRIMARY KEY,
+                result_limit INTEGER NOT NULL,
+                exhausted INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_searches_accessed ON searches (accessed_at)"
+        )
+        self._conn.commit()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """
+        Reinicia los contadores de la búsqueda
+        """
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "partial_hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "evicted": 0
+        }
+
+    def stats(self) -> dict:
+        return dict(self._stats)
+
+    @staticmethod
+    def normalize(text: str | None) -> str:
+        """
+        Minúsculas, sin acentos y con espacios colapsados ("  Ejecutivo de Ventas " == "ejecutivo de
+        ventas")
+        """
+        text = unicodedata.normalize("NFKD", text or "")
+        text = "".join(char for char in text if not unicodedata.combining(char))
+        return re.sub(r"\s+", " ", text).strip().lower()
+
+    @classmethod
+    def query_key(cls, source: str, keyword: str, location: str | None) -> str:
+        return f"{source}|{cls.normalize(keyword)}|{cls.normalize(location)}"
+
+    def get(
+        self, source: str, keyword: str, location: str | None, limit: int
+    ) -> CachedSearch | None:
+        """
+        Entrada de la búsqueda o None (miss o más antigua que el máximo de obsolescencia).
+        La entrada puede estar obsoleta (`fresh` False) o cubrir un límite menor (`covers`).
+        """
+        key = self.query_key(source, keyword, location)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result_limit, exhausted, payload, stored_at FROM searches WHERE query_key "
+                "= ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+
+            result_limit, exhausted, payload, stored_at = row
+            age = now - stored_at
+            if age > self.ttl_seconds + self.max_stale_seconds:
+                self._conn.execute("DELETE FROM searches WHERE query_key = ?", (key,))
+                self._conn.commit()
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE searches SET accessed_at = ? WHERE query_key = ?", (now, key)
+            )
+            self._conn.commit()
+
+        entry = CachedSearch(
+            candidates=[CandidateSchema(**data) for data in json.loads(payload)],
+            limit=result_limit,
+            exhausted=bool(exhausted),
+            age_seconds=age,
+            fresh=age <= self.ttl_seconds
+        )
+        if not entry.covers(limit):
+            self._stats["partial_hits"] += 1
+        elif entry.fresh:
+            self._stats["hits"] += 1
+        else:
+            self._stats["stale_hits"] += 1
+        return entry
+
+    def put(
+        self,
+        source: str,
+        keyword: str,
+        location: str | None,
+        limit: int,
+        candidates: list[CandidateSchema],
+        exhausted: bool = False
+    ) -> None:
+        """
+        Guarda el resultado completo de una búsqueda y desaloja las entradas menos usadas
+        si se excede el tamaño. `exhausted` indica que el scraper llegó al final de los
+        resultados del portal (la entrada cubre cualquier límite).
+        """
+        key = self.query_key(source, keyword, location)
+        now = time.time()
+        payload = json.dumps(
+            [cand.model_dump(mode="json") for cand in candidates if cand is not None],
+            ensure_ascii=False
+        )
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO searches (query_key, result_limit, exhausted, payload, stored_at,
+                accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(query_key) DO UPDATE SET
+                    result_limit = excluded.result_limit,
+                    exhausted = excluded.exhausted,
+                    payload = excluded.payload,
+                    stored_at = excluded.stored_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (key, limit, int(exhausted), payload, now, now)
+            )
+
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM searches").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    """
+                    DELETE FROM searches WHERE query_key IN (
+                        SELECT query_key FROM searches ORDER BY accessed_at ASC LIMIT ?
+                    )
+                    """,
+                    (overflow,)
+                )
+                self._stats["evicted"] += overflow
+            self._conn.commit()
+
+    def begin_refresh(self, source: str, keyword: str, location: str | None) -> bool:
+        """
+        Reserva el refresco de una búsqueda; False si ya hay uno en curso para ella en el
+        proceso o si ya corren `max_refreshes` refrescos
+        """
+        key = self.query_key(source, keyword, location)
+        with self._refreshing_lock:
+            if key in self._refreshing or len(self._refreshing) >= self.max_refreshes:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, source: str, keyword: str, location: str | None) -> None:
+        with self._refreshing_lock:
+            self._refreshing.discard(self.query_key(source, keyword, location))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
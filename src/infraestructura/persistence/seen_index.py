@@ -0,0 +1,101 @@
+import os
+import sqlite3
+import threading
+import time
+
+
+class SeenIndex:
+    """
+    Índice persistente (SQLite) de los candidatos ya vistos por cada búsqueda
+    (portal, palabra clave, ubicación).
+    Permite las ejecuciones incrementales (modo delta): saber qué ids de una
+    página de resultados ya se habían extraído en ejecuciones anteriores.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or os.getenv("SEEN_INDEX_PATH", "data/cache/seen_index.sqlite3")
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen (
+                query_key TEXT NOT NULL,
+                candidate_id TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (query_key, candidate_id)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def query_key(portal: str, keyword: str, location: str | None = None) -> str:
+        """
+        Clave normalizada de una búsqueda
+        """
+        def normalize(value: str | None) -> str:
+            return " ".join((value or "").lower().split())
+
+        return f"{portal}|{normalize(keyword)}|{normalize(location)}"
+
+    def known(self, query_key: str, candidate_ids: list[str]) -> set[str]:
+        """
+        Retorna el subconjunto de ids que ya estaban registrados para la búsqueda
+        """
+        ids = list({cid for cid in candidate_ids if cid})
+        if not ids:
+            return set()
+
+        placeholders = ",".join("?" for _ in ids)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT candidate_id FROM seen WHERE query_key = ? AND candidate_id IN "
+                f"({placeholders})",
+                (query_key, *ids)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def add(self, query_key: str, candidate_ids: list[str]) -> None:
+        """
+        Registra los ids como vistos (actualiza last_seen si ya existían)
+        """
+        now = time.time()
+        rows = [(query_key, cid, now, now) for cid in {cid for cid in candidate_ids if cid}]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO seen (query_key, candidate_id, first_seen, last_seen)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(query_key, candidate_id) DO UPDATE SET last_seen = excluded.last_seen
+                """,
+                rows
+            )
+            self._conn.commit()
+
+    def count(self, query_key: str) -> int:
+        with self._lock:
+            (total,) = self._conn.execute(
+                "SELECT COUNT(*) FROM seen WHERE query_key = ?", (query_key,)
+            ).fetchone()
+        return total
+
+    def clear(self, query_key: str) -> None:
+        """
+        Olvida los ids de una búsqueda (la siguiente ejecución delta será completa)
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM seen WHERE query_key = ?", (query_key,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1 +1,20 @@
-# ScraperFactory
\ No newline at end of file
+from src.domain.interfaces import BaseScraper
+from src.infraestructura.browser.pool import BrowserPool
+from src.infraestructura.scrapers.occ_scraper import OCCScraper
+from src.infraestructura.scrapers.pandape_scraper import PandapeScraper
+
+# Scrapers disponibles por nombre de fuente (el mismo valor que `SOURCE`)
+SCRAPERS: dict[str, type[BaseScraper]] = {
+    OCCScraper.SOURCE: OCCScraper,
+    PandapeScraper.SOURCE: PandapeScraper,
+}
+
+
+def create_scraper(source: str, browser_pool: BrowserPool | None = None) -> BaseScraper:
+    """
+    Instancia el scraper de una fuente; lanza ValueError si la fuente no existe
+    """
+    scraper_class = SCRAPERS.get(source)
+    if scraper_class is None:
+        raise ValueError(f"Fuente desconocida: {source} (disponibles: {', '.join(SCRAPERS)})")
+    return scraper_class(browser_pool=browser_pool)
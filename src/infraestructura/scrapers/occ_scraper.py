@@ -1,13 +1,28 @@
 import os
 import time
 import math
+import queue
+import threading
+from urllib.parse import parse_qsl, quote_plus, urljoin, urlencode, urlsplit, urlunsplit
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
+from src.domain.cancellation import CancellationToken
 from src.domain.interfaces import BaseScraper
 from src.domain.models import CandidateSchema, Experience
+from src.infraestructura.browser.pacing import AdaptiveRateLimiter, Pacer
+from src.infraestructura.browser.pool import BrowserPool
+from src.infraestructura.browser.recorder import ResponseRecorder
+from src.infraestructura.browser.resource_policy import ResourceBlockingPolicy
+from src.infraestructura.browser.session import SessionStore
 from src.infraestructura.logging import Logger, ConsoleLogHandler
+from src.infraestructura.persistence.checkpoint import ExtractionCheckpoint
+from src.infraestructura.persistence.identity_index import CandidateIdentityIndex
 from src.infraestructura.persistence.json_exporter import JsonExporter
+from src.infraestructura.persistence.jsonl_journal_exporter import JsonlJournalExporter
+from src.infraestructura.persistence.profile_cache import ProfileCache
+from src.infraestructura.persistence.seen_index import SeenIndex
+from src.infraestructura.scrapers.parser_backend import HtmlParserBackend
+from src.infraestructura.scrapers.profile_sections import ProfileSectionIndex
 import json
 
 # Cargar variables de entorno
@@ -31,7 +46,8 @@ class OCCScraper(BaseScraper):
             "keyword_input": '//*[@id="Searchpage_Puesto"]',
             "search_button": 'button[data-testid="form__submit"]',
             "candidate_number_50": '//*[@id="Resultpage_Resultados50"]',
-            "next_page": '//*[@id="Resultpage_PaginadorPaginaSiguiente"]'
+            "next_page": '//*[@id="Resultpage_PaginadorPaginaSiguiente"]',
+            "candidate_card": "a[href*='/empresas/candidatos/cv/']"
         },
         "logout": {
             "menu_usuario": 'text=Sistemas',
@@ -42,8 +58,364 @@ class OCCScraper(BaseScraper):
         }
     }
 
-    def __init__(self):
+    BASE_URL = "https://www.occ.com.mx/empresas/"
+
+    # Nombre del portal en los candidatos (campo `source`) y en el índice de identidades
+    SOURCE = "occ"
+
+    # Patrón de URL de las tarjetas de candidatos en los resultados
+    CARD_HREF_FRAGMENT = "/empresas/candidatos/cv/"
+
+    # Textos de la tarjeta que indican la última actividad del perfil (en minúsculas)
+    ACTIVITY_KEYWORDS = ["actividad", "actualiz"]
+
+    # Extracción de tarjetas dentro del navegador: replica `_card_to_raw` sobre el DOM vivo
+    # y retorna un arreglo JSON compacto. `text()` imita get_text(strip=True) de BeautifulSoup.
+    CARD_EXTRACTION_JS = """
+    ([hrefFragment, activityKeywords]) => {
+        const text = (node) => {
+            const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+            const parts = [];
+            while (walker.nextNode()) {
+                const value = walker.currentNode.nodeValue.trim();
+                if (value) parts.push(value);
+            }
+            return parts.join("");
+        };
+        const cards = Array.from(document.querySelectorAll("a[href]"))
+            .filter((a) => a.getAttribute("href").includes(hrefFragment));
+
+        return cards.map((card) => {
+            const content = card.querySelector("div > div:nth-of-type(2)");
+            if (!content) return null;
+
+            const titleTag = content.querySelector("p");
+
+            let location = null;
+            const locIcon = content.querySelector("svg.atomic__location");
+            if (locIcon) {
+                let sibling = locIcon.nextElementSibling;
+                while (sibling && sibling.localName !== "p") sibling = sibling.nextElementSibling;
+                if (sibling) location = text(sibling);
+            }
+
+            const activityTag = Array.from(content.querySelectorAll("p")).find((p) => {
+                const value = text(p).toLowerCase();
+                return activityKeywords.some((keyword) => value.includes(keyword));
+            });
+
+            const infoBlocks = Array.from(content.children)
+                .filter((child) => child.localName === "div")
+                .slice(2)
+                .map((block) => Array.from(block.querySelectorAll("p")).map(text))
+                .filter((texts) => texts.length >= 1);
+
+            return {
+                id: (card.getAttribute("id") || "").split("|").pop(),
+                href: card.getAttribute("href") || "",
+                title: titleTag ? text(titleTag) : null,
+                location: location,
+                activity: activityTag ? text(activityTag) : null,
+                info_blocks: infoBlocks
+            };
+        });
+    }
+    """
+
+    # data-testid de los datos de contacto del perfil
+    CONTACT_TESTIDS = ["contact-email__data-cv", "contact-phone__data-cv"]
+
+    # Encabezados de sección del perfil usados por los fallbacks por DOM
+    SECTION_HEADERS = {
+        "experience": "Experiencia laboral",
+        "salary": "Salario deseado",
+        "skills": "Habilidad",
+        "specialty": "Área de especialidad"
+    }
+
+    # Slugs de ubicación usados por el filtro de estado de OCC
+    LOCATION_SLUGS = {
+        "CDMX": "LOC-21957",
+        "Edo Mex": "LOC-60991",
+        "Nuevo León": "LOC-83091",
+        "Oaxaca": "LOC-87725",
+        "Querétaro": "LOC-99788"
+    }
+
+    def __init__(
+        self,
+        enrich_workers: int | None = None,
+        headless: bool | None = None,
+        persist_session: bool | None = None,
+        logout_on_exit: bool | None = None,
+        profile_fetch_mode: str | None = None,
+        resource_policy: ResourceBlockingPolicy | None = None,
+        parser_engine: str | None = None,
+        card_extraction_mode: str | None = None,
+        profile_cache: ProfileCache | None = None,
+        delta_mode: bool | None = None,
+        delta_threshold: float | None = None,
+        seen_index: SeenIndex | None = None,
+        identity_index: CandidateIdentityIndex | None = None,
+        browser_pool: BrowserPool | None = None,
+        batch_concurrency: int | None = None
+    ):
         self.logger = Logger(handlers=[ConsoleLogHandler()])
+        # URL base del portal; se puede apuntar a un sustituto local (benchmarks/occ_standin)
+        self.base_url = os.getenv("OCC_BASE_URL") or self.BASE_URL
+        self.site_origin = urljoin(self.base_url, "/").rstrip("/")
+        # Grabación opcional de respuestas para reproducirlas sin conexión
+        record_archive = os.getenv("OCC_RECORD_ARCHIVE")
+        self.recorder = ResponseRecorder(record_archive, self.base_url) if record_archive else None
+        # Número de páginas en paralelo para el enriquecimiento de perfiles
+        self.enrich_workers = max(1, enrich_workers or int(os.getenv("OCC_ENRICH_WORKERS", "4")))
+        if headless is None:
+            headless = os.getenv("OCC_HEADLESS", "false").lower() == "true"
+        self.headless = headless
+        # Pool de navegadores compartido (opcional): evita lanzar Chromium en cada búsqueda
+        self.browser_pool = browser_pool
+        self.pacer = self._new_pacer()
+
+        # Sesión persistente por cuenta (storage state + perfil con caché de disco)
+        if persist_session is None:
+            persist_session = os.getenv("OCC_PERSIST_SESSION", "true").lower() == "true"
+        if logout_on_exit is None:
+            logout_on_exit = os.getenv("OCC_LOGOUT_ON_EXIT", "false").lower() == "true"
+        self.persist_session = persist_session
+        self.logout_on_exit = logout_on_exit
+        self.account = os.getenv("OCC_USERNAME")
+        self.session_store = SessionStore("occ")
+
+        # Modo de obtención de perfiles:
+        # - "request": descarga el documento sin renderizar y lee __NEXT_DATA__
+        # - "render": navega con la página y serializa el DOM completo
+        self.profile_fetch_mode = profile_fetch_mode or os.getenv(
+            "OCC_PROFILE_FETCH_MODE", "request"
+        )
+
+        # Bloqueo de imágenes, fuentes, video y analítica en todos los contextos del scraper
+        self.resource_policy = resource_policy or ResourceBlockingPolicy.from_env()
+
+        # Motor de parseo HTML (html.parser o lxml)
+        self.parser = HtmlParserBackend(
+            parser_engine or os.getenv("OCC_PARSER_ENGINE", "html.parser")
+        )
+        if self.parser.degraded:
+            self.logger.warning(
+                "init",
+                f"Motor '{self.parser.requested_engine}' no disponible, usando "
+                f"'{self.parser.engine}'."
+            )
+
+        # Extracción de tarjetas: "evaluate" (JS en el navegador) o "html" (DOM serializado)
+        self.card_extraction_mode = card_extraction_mode or os.getenv(
+            "OCC_CARD_EXTRACTION", "evaluate"
+        )
+
+        # Caché persistente de perfiles parseados (por id de candidato)
+        if profile_cache is None and os.getenv("OCC_PROFILE_CACHE", "true").lower() == "true":
+            profile_cache = ProfileCache()
+        self.profile_cache = profile_cache
+
+        # Índice persistente de candidatos vistos por búsqueda y modo delta:
+        # solo se exportan/enriquecen los nuevos y la paginación se detiene cuando
+        # una página ya es mayormente conocida
+        if delta_mode is None:
+            delta_mode = os.getenv("OCC_DELTA_MODE", "false").lower() == "true"
+        self.delta_mode = delta_mode
+        self.delta_threshold = delta_threshold if delta_threshold is not None else float(
+            os.getenv("OCC_DELTA_THRESHOLD", "0.8")
+        )
+        if seen_index is None and (
+            self.delta_mode or os.getenv("OCC_SEEN_INDEX", "true").lower() == "true"
+        ):
+            seen_index = SeenIndex()
+        self.seen_index = seen_index
+
+        # Índice de identidades entre fuentes: un perfil ya resuelto a una identidad
+        # enriquecida (y sin actividad nueva) no se vuelve a visitar
+        if identity_index is None and os.getenv("IDENTITY_INDEX", "true").lower() == "true":
+            identity_index = CandidateIdentityIndex()
+        self.identity_index = identity_index
+
+        # Checkpoint de la ejecución en curso y token para reanudarla
+        self.checkpoints_enabled = os.getenv("OCC_CHECKPOINTS", "true").lower() == "true"
+        self._checkpoint: ExtractionCheckpoint | None = None
+        self.last_resume_token: str | None = None
+
+        # Pipeline: los workers enriquecen perfiles mientras el paginador sigue avanzando.
+        # La cola acotada aplica backpressure sobre la paginación.
+        self.pipeline_enabled = os.getenv("OCC_PIPELINE", "true").lower() == "true"
+        self.pipeline_queue_size = max(1, int(os.getenv("OCC_PIPELINE_QUEUE_SIZE", "100")))
+
+        # Exportación: "journal" (diario JSONL append-only + compactación) o "json" (reescritura
+        # completa)
+        self.export_mode = os.getenv("OCC_EXPORT_MODE", "journal")
+        self._journal: JsonlJournalExporter | None = None
+
+        # Paginación por URL directa: varias páginas de resultados en pestañas simultáneas
+        self.direct_pagination = os.getenv("OCC_DIRECT_PAGINATION", "true").lower() == "true"
+        self.page_tabs = max(1, int(os.getenv("OCC_PAGE_TABS", "3")))
+        self.results_url_template = os.getenv("OCC_RESULTS_URL_TEMPLATE") or None
+
+        # Combinaciones palabra clave × ubicación simultáneas en `extract_batch`
+        self.batch_concurrency = max(
+            1, batch_concurrency or int(os.getenv("OCC_BATCH_CONCURRENCY", "3"))
+        )
+
+    def _new_pacer(self) -> Pacer:
+        """
+        Crea la capa de ritmo (rate limiter adaptativo + esperas por eventos) de una ejecución
+        """
+        limiter = AdaptiveRateLimiter(
+            initial_rate=float(os.getenv("OCC_RATE_INITIAL", "1.0")),
+            min_rate=float(os.getenv("OCC_RATE_MIN", "0.2")),
+            max_rate=float(os.getenv("OCC_RATE_MAX", "4.0"))
+        )
+        return Pacer(limiter, cancel_token=self.cancel_token)
+
+    def _launch_browser(self, p):
+        """
+        Lanza una instancia de Chromium con la configuración del scraper
+        """
+        return p.chromium.launch(headless=self.headless)
+
+    def _attach_context(self, context) -> None:
+        """
+        Instala en cada contexto nuevo el bloqueo de recursos y, si está activa, la grabación
+        """
+        self.resource_policy.attach(context)
+        if self.recorder:
+            self.recorder.attach(context)
+
+    def _save_recording(self) -> None:
+        """
+        Escribe el archivo de respuestas grabadas (OCC_RECORD_ARCHIVE)
+        """
+        if not self.recorder:
+            return
+        try:
+            path = self.recorder.save()
+            self.logger.info("extract", f"{len(self.recorder)} respuestas grabadas en {path}")
+        except Exception as e:
+            self.logger.error("extract", f"No se pudo guardar la grabación: {e}")
+
+    def _acquire_browser(self, p):
+        """
+        Retorna (browser, close). Con pool se conecta por CDP a un navegador ya caliente
+        y `close` lo devuelve al pool; si el pool falla se lanza un navegador propio.
+        """
+        if self.browser_pool:
+            lease = None
+            try:
+                lease = self.browser_pool.acquire()
+                browser = lease.connect(p)
+            except Exception as e:
+                if lease:
+                    self.browser_pool.release(lease)
+                self.logger.warning(
+                    "browser", f"Pool de navegadores no disponible, lanzando uno propio: {e}"
+                )
+            else:
+                def close():
+                    try:
+                        # En una conexión CDP solo cierra los contextos propios y desconecta
+                        browser.close()
+                    finally:
+                        self.browser_pool.release(lease)
+                return browser, close
+
+        browser = self._launch_browser(p)
+        return browser, browser.close
+
+    def _session_state(self) -> str | None:
+        """
+        Storage state guardado de la cuenta, si existe y la sesión es persistente
+        """
+        if self.persist_session and self.session_store.has_state(self.account):
+            return self.session_store.storage_state_path(self.account)
+        return None
+
+    def _open_context(self, p):
+        """
+        Abre el contexto principal del navegador y retorna (context, close).
+        Con sesión persistente usa el perfil de la cuenta, que conserva cookies
+        y la caché de recursos estáticos entre ejecuciones.
+        Con pool de navegadores, o si otra ejecución ya tiene abierto el perfil, la sesión
+        se restaura desde el storage state en un contexto aislado.
+        """
+        if self.persist_session and not self.browser_pool:
+            lock = self.session_store.lock_profile(self.account)
+            if lock:
+                try:
+                    context = p.chromium.launch_persistent_context(
+                        self.session_store.profile_dir(self.account),
+                        headless=self.headless
+                    )
+                except Exception:
+                    lock.release()
+                    raise
+                self._attach_context(context)
+
+                def close():
+                    try:
+                        context.close()
+                    finally:
+                        lock.release()
+                return context, close
+
+            self.logger.info(
+                "browser",
+                "Perfil de la cuenta en uso por otra ejecución, se usa un contexto aislado."
+            )
+
+        browser, close = self._acquire_browser(p)
+        context = browser.new_context(storage_state=self._session_state())
+        self._attach_context(context)
+        return context, close
+
+    def _session_is_valid(self, page) -> bool:
+        """
+        Validación barata de la sesión restaurada: el menú de usuario debe estar visible
+        """
+        try:
+            page.wait_for_selector(self.SELECTORS["logout"]["menu_usuario"], timeout=3000)
+            return True
+        except Exception:
+            return False
+
+    def _ensure_session(self, page) -> None:
+        """
+        Reutiliza la sesión guardada si sigue siendo válida; si no, ejecuta `_login`
+        y guarda el nuevo storage state de la cuenta.
+        """
+        if self.persist_session and self._session_is_valid(page):
+            self.logger.info("login", "Sesión guardada válida, se omite el login.")
+            return
+
+        self._login(page)
+
+        if (
+            self.persist_session
+            and page.locator(self.SELECTORS["logout"]["menu_usuario"]).is_visible()
+        ):
+            path = self.session_store.save(page.context, self.account)
+            self.logger.info("login", f"Sesión guardada en {path}")
+
+    def logout(self) -> None:
+        """
+        Cierra explícitamente la sesión en OCC y elimina la sesión guardada de la cuenta
+        """
+        with sync_playwright() as p:
+            context, close = self._open_context(p)
+            page = context.pages[0] if context.pages else context.new_page()
+            try:
+                page.goto(self.base_url)
+                self._logout(page)
+            finally:
+                close()
+        self.session_store.clear(self.account)
+        self.logger.info("logout", "Sesión guardada eliminada.")
 
     def _login(self, page) -> None:
         """
@@ -63,17 +435,15 @@ class OCCScraper(BaseScraper):
             if page.locator(self.SELECTORS["login"]["iniciar_sesion_link"]).is_visible():
                 page.click(self.SELECTORS["login"]["iniciar_sesion_link"])
                 self.logger.info("login", "Click en 'Iniciar sesión'")
-                time.sleep(2)
+                self.pacer.ready(page, self.SELECTORS["login"]["username_input"])
 
-                # Ingresar usuario
+                # Ingresar usuario (fill espera a que el input sea editable)
                 page.fill(self.SELECTORS["login"]["username_input"], username)
                 self.logger.info("login", "Usuario ingresado")
-                time.sleep(2)
                 
                 # Ingresar contraseña
                 page.fill(self.SELECTORS["login"]["password_input"], password)
                 self.logger.info("login", "Contraseña ingresada")
-                time.sleep(2)
 
                 # Click en botón entrar
                 page.click(self.SELECTORS["login"]["login_button"])
@@ -81,7 +451,8 @@ class OCCScraper(BaseScraper):
                 
                 # Esperar navegación o carga post-login
                 # page.wait_for_load_state("networkidle") # Causaba timeout
-                page.wait_for_selector(self.SELECTORS["logout"]["menu_usuario"], timeout=20000)
+                with self.pacer.stats.waiting("ready"):
+                    page.wait_for_selector(self.SELECTORS["logout"]["menu_usuario"], timeout=20000)
                 self.logger.info("login", "Login completado (Menu usuario visible)")
             else:
                  self.logger.warning("login", "Botón de inicio de sesión no encontrado.")
@@ -97,16 +468,17 @@ class OCCScraper(BaseScraper):
             self.logger.info("logout", "Iniciando logout.")
             
             # click en menú de usuario
-            page.wait_for_selector(self.SELECTORS["logout"]["menu_usuario"], timeout=5000)
+            with self.pacer.stats.waiting("ready"):
+                page.wait_for_selector(self.SELECTORS["logout"]["menu_usuario"], timeout=5000)
             page.click(self.SELECTORS["logout"]["menu_usuario"])
             self.logger.info("logout", "Click en menú de usuario")
-            time.sleep(2)
 
             # click en cerrar sesión
-            page.wait_for_selector(self.SELECTORS["logout"]["cerrar_sesion"], timeout=5000)
+            with self.pacer.stats.waiting("ready"):
+                page.wait_for_selector(self.SELECTORS["logout"]["cerrar_sesion"], timeout=5000)
             page.click(self.SELECTORS["logout"]["cerrar_sesion"])
             self.logger.info("logout", "Click en cerrar sesión")
-            time.sleep(2)
+            self.pacer.ready(page, load_state="domcontentloaded", timeout=5000)
 
             self.logger.info("logout", "Logout completado exitosamente")
         except Exception as e:
@@ -117,9 +489,10 @@ class OCCScraper(BaseScraper):
         """
         Navega a la URL de búsqueda y aplica filtros si es necesario
         """
+        self.pacer.limiter.acquire(page.url)
         page.click(self.SELECTORS["search"]["talento_link"])
         self.logger.info("search", "Click en 'Talento'")
-        time.sleep(2)
+        self.pacer.ready(page, self.SELECTORS["search"]["keyword_input"])
 
         # Aplicar filtro de ubicación si es necesario
         if location and location in location_slugs:
@@ -129,7 +502,12 @@ class OCCScraper(BaseScraper):
             if page.locator(selector).is_visible():
                 self.logger.info("search", f"Seleccionando ubicación: {location} ({slug})")
                 page.select_option(selector, value=slug)
-                time.sleep(3)  # Esperar recarga de resultados
+                # Esperar recarga tras aplicar el filtro
+                self.pacer.ready(
+                    page,
+                    self.SELECTORS["search"]["keyword_input"],
+                    load_state="domcontentloaded"
+                )
             else:
                 self.logger.warning("search", "Selector de ubicación no encontrado, confiando en URL.")
 
@@ -138,14 +516,13 @@ class OCCScraper(BaseScraper):
             try:
                 page.fill(self.SELECTORS["search"]["keyword_input"], keyword)
                 self.logger.info("search", f"Palabras clave ingresadas: {keyword}")
-                time.sleep(2)
             except Exception as e:
                 self.logger.error("search", f"Error al ingresar palabras clave: {e}")
 
         try:
+            self.pacer.limiter.acquire(page.url)
             page.click(self.SELECTORS["search"]["search_button"])
             self.logger.info("search", "Click en 'Buscar talento'")
-            time.sleep(2)
         except Exception as e:
             self.logger.error("search", f"Error al buscar talento: {e}")
 
@@ -153,98 +530,173 @@ class OCCScraper(BaseScraper):
 
         try:
             self.logger.info("search", "Cambiando a 50 resultados por página.")
-            page.wait_for_selector(self.SELECTORS["search"]["candidate_number_50"], timeout=10000)
+            with self.pacer.stats.waiting("ready"):
+                page.wait_for_selector(self.SELECTORS["search"]["candidate_number_50"], timeout=10000)
+            self.pacer.limiter.acquire(page.url)
             page.click(self.SELECTORS["search"]["candidate_number_50"])
             self.logger.info("search", "50 resultados por página seleccionados exitosamente.")
-            time.sleep(2)
+            self.pacer.ready(page, self.SELECTORS["search"]["candidate_card"], state="attached")
         except Exception as e:
             self.logger.error("search", f"Error al cargar resultados: {e}")
 
+    def _card_to_raw(self, card) -> dict | None:
+        """
+        Lee los campos crudos de una tarjeta (BeautifulSoup) con selectores robustos
+        basados en la estructura SVG e iconos. Misma forma que retorna CARD_EXTRACTION_JS.
+        """
+        # 1. URL e ID
+        href = card.get("href", "")
+        id = card.get("id", "").split("|")[-1]
+
+        # 2. Contenedor principal de datos (segunda columna)
+        content_col = card.select_one("div > div:nth-of-type(2)")
+        if not content_col:
+            return None
+
+        # 3. Título (Primer párrafo de la columna de contenido)
+        title = None
+        title_tag = content_col.find("p")
+        if title_tag:
+            title = title_tag.get_text(strip=True)
+
+        # 4. Ubicación (Buscar icono #atomic__location)
+        location = None
+        loc_icon = content_col.select_one("svg.atomic__location")
+        if loc_icon:
+            # El <p> hermano del <svg> contenedor
+            loc_node = loc_icon.find_next_sibling("p")
+            if loc_node:
+                location = loc_node.get_text(strip=True)
+
+        # 5. Indicador de actividad ("Última actividad ...", "Actualizado ...")
+        activity = None
+        for p in content_col.find_all("p"):
+            text = p.get_text(strip=True)
+            if any(keyword in text.lower() for keyword in self.ACTIVITY_KEYWORDS):
+                activity = text
+                break
+
+        # 6. Bloques de información (experiencia y educación)
+        # Saltamos los primeros divs (header y metadata) y buscamos los siguientes
+        info_blocks = []
+        for block in content_col.find_all("div", recursive=False)[2:]:
+            ps = block.find_all("p")
+            if len(ps) >= 1:
+                info_blocks.append([p.get_text(strip=True) for p in ps])
+
+        return {
+            "id": id,
+            "href": href,
+            "title": title,
+            "location": location,
+            "activity": activity,
+            "info_blocks": info_blocks
+        }
+
+    def _build_card_candidate(self, raw: dict | None) -> CandidateSchema | None:
+        """
+        Construye el CandidateSchema de una tarjeta a partir de sus campos crudos
+        """
+        if raw is None:
+            return None
+
+        href = raw.get("href") or ""
+        full_url = f"{self.site_origin}{href}" if href.startswith("/") else href
+
+        # Estrategia: cada bloque tiene uno o más <p> (rol, fecha, ...)
+        # Como es tarjeta, ponemos todo en position
+        experience = [
+            Experience(position=" - ".join(texts))
+            for texts in raw.get("info_blocks", [])
+        ]
+
+        education = None
+        if experience:
+            education_obj = experience.pop()
+            education = education_obj.position if education_obj else None
+
+        # 7. Salario (Opcional, basado en icono #atomic__cash)
+        # salary = ... (Podemos añadirlo si se requiere)
+
+        return CandidateSchema(
+            id=raw.get("id"),
+            name="Confidencial", # El nombre suele estar oculto en la vista de lista
+            position=raw["title"] if raw.get("title") is not None else "Sin título",
+            url=full_url,
+            location=raw.get("location"),
+            company=None,
+            skills=[], # No visibles en el snippet
+            experience=experience,
+            education=education,
+            last_updated=raw.get("activity"),
+            source=self.SOURCE
+        )
+
     def _extract_card_details(self, card) -> CandidateSchema:
         """
         Extrae los detalles de una tarjeta de candidato usando selectores robustos
         basados en la estructura SVG e iconos.
         """
         try:
-            # 1. URL e ID
-            href = card.get("href", "")
-            full_url = f"https://www.occ.com.mx{href}" if href.startswith("/") else href
-
-            id = card.get("id", "").split("|")[-1]
-            
-            # 2. Contenedor principal de datos (segunda columna)
-            content_col = card.select_one("div > div:nth-of-type(2)")
-            if not content_col:
-                return None
-
-            # 3. Título (Primer párrafo de la columna de contenido)
-            title = "Sin título"
-            title_tag = content_col.find("p")
-            if title_tag:
-                title = title_tag.get_text(strip=True)
-
-            # 4. Ubicación (Buscar icono #atomic__location)
-            location = None
-            loc_icon = content_col.select_one("svg.atomic__location")
-            if loc_icon:
-                # El <p> hermano del <svg> contenedor
-                loc_node = loc_icon.find_next_sibling("p")
-                if loc_node:
-                    location = loc_node.get_text(strip=True)
-
-            # 5. Experiencia y Educación
-            # Estrategia: Buscar divs que contengan dos <p>, uno para rol y otro para fecha
-            experience = []
-            # Saltamos los primeros divs (header y metadata) y buscamos los siguientes
-            info_blocks = content_col.find_all("div", recursive=False)[2:] 
-            for block in info_blocks:
-                ps = block.find_all("p")
-                if len(ps) >= 1:
-                    text = " - ".join([p.get_text(strip=True) for p in ps])
-                    # Como es tarjeta, ponemos todo en position o description
-                    experience.append(Experience(position=text))
-            
-            education = None
-            if experience:
-                education_obj = experience.pop()
-                education = education_obj.position if education_obj else None
-
-            # 6. Salario (Opcional, basado en icono #atomic__cash)
-            # salary = ... (Podemos añadirlo si se requiere)
-
-            return CandidateSchema(
-                id=id,
-                name="Confidencial", # El nombre suele estar oculto en la vista de lista
-                position=title,
-                url=full_url,
-                location=location,
-                company=None, 
-                skills=[], # No visibles en el snippet
-                experience=experience,
-                education=education
-            )
+            return self._build_card_candidate(self._card_to_raw(card))
 
         except Exception as e:
             self.logger.error("extract", f"Error al extraer detalles de tarjeta: {e}")
             return None
 
-    def _extract_candidates(self, page):
+    def _parse_cards(self, html: str) -> list[CandidateSchema]:
         """
-        Extrae los candidatos de la página actual
+        Construye los candidatos a partir del HTML de una página de resultados
         """
-        try:
-            candidates = []
-            html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+        candidates = []
 
-            # Encontrar links de candidatos según patrón de URL visto en screenshot
-            cards = soup.select("a[href*='/empresas/candidatos/cv/']")
-            self.logger.info("extract", f"Se encontraron {len(cards)} tarjetas en esta página.")
+        # Encontrar links de candidatos según patrón de URL visto en screenshot.
+        # Solo se construyen los nodos de las tarjetas, no el documento completo.
+        cards = self.parser.parse_links(html, self.CARD_HREF_FRAGMENT)
+        self.logger.info("extract", f"Se encontraron {len(cards)} tarjetas en esta página.")
+
+        for card in cards:
+            candidato = self._extract_card_details(card)
+            candidates.append(candidato)
+
+        return candidates
+
+    def _build_cards(self, raw_cards: list[dict | None]) -> list[CandidateSchema]:
+        """
+        Construye los candidatos a partir del arreglo JSON devuelto por CARD_EXTRACTION_JS
+        """
+        self.logger.info("extract", f"Se encontraron {len(raw_cards)} tarjetas en esta página.")
+
+        candidates = []
+        for raw in raw_cards:
+            try:
+                candidates.append(self._build_card_candidate(raw))
+            except Exception as e:
+                self.logger.error("extract", f"Error al extraer detalles de tarjeta: {e}")
+                candidates.append(None)
+        return candidates
 
-            for card in cards:
-                candidato = self._extract_card_details(card)
-                candidates.append(candidato)
+    def _extract_candidates(self, page):
+        """
+        Extrae los candidatos de la página actual.
+        En modo "evaluate" las tarjetas se leen dentro del navegador y solo viaja un JSON compacto;
+        en modo "html" (o si la evaluación falla) se serializa el DOM y se parsea en Python.
+        """
+        candidates = []
+        try:
+            if self.card_extraction_mode == "evaluate":
+                try:
+                    raw_cards = page.evaluate(
+                        self.CARD_EXTRACTION_JS, [self.CARD_HREF_FRAGMENT, self.ACTIVITY_KEYWORDS]
+                    )
+                    return self._build_cards(raw_cards)
+                except Exception as e:
+                    self.logger.warning(
+                        "extract", f"Fallo la extracción en el navegador, usando HTML: {e}"
+                    )
 
+            html = page.content()
+            candidates = self._parse_cards(html)
         except Exception as e:
             self.logger.error("extract", f"Error al extraer candidatos: {e}")
 
@@ -269,16 +721,12 @@ class OCCScraper(BaseScraper):
         }
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Estrategia 1: __NEXT_DATA__ json
-            next_data_script = soup.find("script", {"id": "__NEXT_DATA__"})
-            if next_data_script:
+            # Estrategia 1: __NEXT_DATA__ json (se lee del texto, sin construir el DOM)
+            next_data_text = self.parser.next_data_text(html_content)
+            if next_data_text is not None:
                 try:
-                    data = json.loads(next_data_script.string)
-                    # resume suele estar en props -> initialState -> resume -> resume
-                    initial_state = data.get("props", {}).get("initialState", {})
-                    resume_data = initial_state.get("resume", {}).get("resume", {})
+                    data = json.loads(next_data_text)
+                    resume_data = self._resume_from_next_data(data)
                     
                     if resume_data:
                         # Extraer Datos Básicos
@@ -287,7 +735,6 @@ class OCCScraper(BaseScraper):
                         if first_name or last_name:
                             extracted_data["name"] = f"{first_name} {last_name}".strip()
                         
-                        extracted_data["position"] = resume_data.get("jobTitle")
                         extracted_data["position"] = resume_data.get("jobTitle")
                         extracted_data["salary"] = resume_data.get("salary") # A veces es un objeto o string
                         extracted_data["last_updated"] = resume_data.get("videoCvUpdateDate") or resume_data.get("updatedAt")
@@ -327,13 +774,30 @@ class OCCScraper(BaseScraper):
 
                 except Exception as e:
                     self.logger.warning("extract_detail", f"Error parseando __NEXT_DATA__: {e}")
-            
-            # ... (código existente de nombre, email, telefono, salario) ...
+
+            # El árbol completo solo se construye si algún campo necesita el fallback por DOM;
+            # si el JSON vino completo basta con los nodos de contacto
+            dom_fields = ("name", "experience", "salary", "skills", "specialty", "last_updated")
+            if all(extracted_data[field] for field in dom_fields):
+                soup = self.parser.parse_by_testid(html_content, self.CONTACT_TESTIDS)
+            else:
+                soup = self.parser.parse(html_content)
+
+            # Un solo recorrido del DOM indexa los encabezados de los campos que faltan
+            sections = ProfileSectionIndex.build(
+                soup,
+                {
+                    key: text
+                    for key, text in self.SECTION_HEADERS.items()
+                    if not extracted_data[key]
+                },
+                collect_activity=not extracted_data["last_updated"]
+            )
 
             # DOM Fallback para Experience
             if not extracted_data["experience"]:
                  # Buscar header "Experiencia laboral"
-                 exp_header = soup.find(lambda tag: tag.name == "p" and "Experiencia laboral" in tag.get_text())
+                 exp_header = sections.header("experience")
                  if exp_header:
                      # El contenedor está típicamente en un div hermano del padre o abuelo del header
                      # Basado en lo visto: header en div.c012217 -> div.c0117.c0126.c011001
@@ -406,7 +870,7 @@ class OCCScraper(BaseScraper):
             # Salario si no vino en JSON (buscar texto "$")
             if not extracted_data["salary"]:
                  # Buscar el texto "Salario deseado"
-                 salary_header = soup.find(lambda tag: tag.name == "p" and "Salario deseado" in tag.get_text())
+                 salary_header = sections.header("salary")
                  if salary_header:
                      # Estructura: <div class="c0117..."><p>Salario deseado</p></div><div><p>$11,000</p></div>
                      # El header debe tener un padre que es hermano del div que contiene el valor
@@ -425,7 +889,7 @@ class OCCScraper(BaseScraper):
             # Si el JSON falló o vino vacío, buscamos por texto en el HTML
             if not extracted_data["skills"]:
                 # Buscar el texto "Habilidad"
-                habilidad_header = soup.find(lambda tag: tag.name == "p" and "Habilidad" in tag.get_text())
+                habilidad_header = sections.header("skills")
                 if habilidad_header:
                     # El contenedor de etiquetas suele estar en un div hermano o cercano
                     # Subimos al contenedor de la sección y buscamos el siguiente contenedor
@@ -443,7 +907,7 @@ class OCCScraper(BaseScraper):
 
             if not extracted_data["specialty"]:
                 # Buscar el texto "Área de especialidad"
-                specialty_header = soup.find(lambda tag: tag.name == "p" and "Área de especialidad" in tag.get_text())
+                specialty_header = sections.header("specialty")
                 if specialty_header:
                      section_container = specialty_header.find_parent("div", class_=lambda x: x and "c0117" in x)
                      if section_container:
@@ -455,106 +919,417 @@ class OCCScraper(BaseScraper):
                             if specs:
                                 extracted_data["specialty"] = ", ".join(specs)
 
-            if not extracted_data["last_updated"]:
-                # Buscar texto "CV: ... - Última actividad ..." o "Actualizado ..."
-                # Iteramos sobre todos los P para mayor seguridad (evitar problemas de 'string=' exacto)
-                all_ps = soup.find_all("p")
-                for p in all_ps:
-                    # Normalizamos el texto (reemplazar saltos de línea por espacios y quitar espacios extra)
-                    raw_text = p.get_text(" ", strip=True) 
-                    clean_text = " ".join(raw_text.split())
-                    
-                    if "CV:" in clean_text and "-" in clean_text:
-                        # La estructura es "CV: XXXXX - Texto de fecha"
-                        parts = clean_text.split("-")
-                        # Tomamos la última parte
-                        candidate_last_part = parts[-1].strip()
-                        # Validamos que parezca una fecha o texto de actividad
-                        if len(candidate_last_part) > 2: # Mínimo algo de texto
-                             extracted_data["last_updated"] = candidate_last_part
-                             self.logger.info("extract_detail", f"Fecha última actividad extraída (DOM): {candidate_last_part}")
-                             break
+            if not extracted_data["last_updated"] and sections.activity_text:
+                # Línea "CV: XXXXX - Texto de fecha" localizada durante el indexado
+                extracted_data["last_updated"] = sections.activity_text
+                self.logger.info(
+                    "extract_detail",
+                    f"Fecha última actividad extraída (DOM): {sections.activity_text}"
+                )
 
         except Exception as e:
             self.logger.error("extract_detail", f"Error general parseando HTML: {e}")
             
         return extracted_data
 
+    @staticmethod
+    def _has_profile_data(details: dict) -> bool:
+        """
+        True si el parseo obtuvo datos reales del perfil. Un muro de login, una página
+        bloqueada o un documento sin __NEXT_DATA__ ni data-testid no traen ninguno y
+        no deben cachearse como perfil válido.
+        """
+        return any(details.get(field) for field in ("name", "email", "phone", "experience"))
+
+    def _merge_details(self, cand: CandidateSchema, details: dict) -> CandidateSchema:
+        """
+        Combina los datos de la tarjeta con los detalles obtenidos del perfil.
+        """
+        # Lógica de actualización:
+        # - Si encontramos nombre real, reemplazamos (incluso si no era confidencial, mejor el del perfil)
+        new_name = details.get("name")
+        if not new_name:
+             new_name = cand.name
+
+        # - Email, Phone, Salary, Specialty
+        # - Skills y Experience (merge o replace? Replace con la data detallada es mejor)
+        return cand.model_copy(update={
+            "name": new_name,
+            "position": details.get("position") or cand.position,
+            "salary": details.get("salary") or cand.salary,
+            "specialty": details.get("specialty") or cand.specialty,
+            "email": details.get("email") or cand.email,
+            "phone": details.get("phone") or cand.phone,
+            "skills": details.get("skills") or cand.skills,
+            "experience": details.get("experience") or cand.experience,
+            "last_updated": details.get("last_updated") or cand.last_updated
+        })
+
+    def _enrich_one(self, page, cand: CandidateSchema) -> CandidateSchema:
+        """
+        Visita el perfil de un candidato y retorna la versión enriquecida.
+        Si algo falla se conserva la información de la tarjeta.
+        """
+        try:
+            html = self._get_candidate_html(page, cand.url)
+            if html:
+                details = self._parse_candidate_html(html)
+                if self.profile_cache and self._has_profile_data(details):
+                    # La huella es el indicador de actividad de la tarjeta al momento de visitar
+                    self.profile_cache.put(cand.id, details, cand.last_updated)
+                updated_cand = self._merge_details(cand, details)
+                self._register_identity(updated_cand, cand.last_updated)
+                if self._checkpoint:
+                    self._checkpoint.mark_enriched(updated_cand)
+                if self._journal:
+                    self._journal.upsert([updated_cand])
+                self._emit("profile_enriched", [updated_cand])
+                self.logger.info("enrich", f"Datos enriquecidos para {updated_cand.name}")
+            else:
+                updated_cand = cand
+
+            return updated_cand
+
+        except Exception as e:
+            self.logger.error("enrich", f"Error procesando {cand.id}: {e}")
+            return cand
+
+    def _resolve_cached(
+        self, candidates: list[CandidateSchema]
+    ) -> tuple[list[CandidateSchema], list[int]]:
+        """
+        Aplica el índice de identidades y la caché de perfiles: retorna la lista con los aciertos ya
+        enriquecidos
+        y los índices que sí requieren visitar el perfil
+        """
+        results = list(candidates)
+        pending = []
+        resolved = 0
+        for index, cand in enumerate(candidates):
+            # Ya enriquecido en la ejecución que se está reanudando
+            if self._checkpoint and self._checkpoint.is_enriched(cand.id):
+                continue
+            identity = self._resolved_identity(cand)
+            if identity is not None:
+                results[index] = identity
+                resolved += 1
+            else:
+                details = (
+                    self.profile_cache.get(cand.id, cand.last_updated)
+                    if self.profile_cache
+                    else None
+                )
+                if details is None:
+                    pending.append(index)
+                    continue
+                results[index] = self._merge_details(cand, details)
+            if self._journal:
+                self._journal.upsert([results[index]])
+            self._emit("profile_enriched", [results[index]])
+
+        if resolved:
+            self.logger.info(
+                "enrich", f"Índice de identidades: {resolved} perfiles ya resueltos, no se visitan."
+            )
+        if self.profile_cache:
+            self.logger.info(
+                "enrich",
+                f"Caché de perfiles: {len(candidates) - len(pending)} aciertos, {len(pending)} por "
+                "visitar."
+            )
+        return results, pending
+
+    def _resolved_identity(self, cand: CandidateSchema) -> CandidateSchema | None:
+        """
+        Registro combinado de la identidad a la que ya pertenece la tarjeta (enriquecida
+        y sin actividad nueva), con el id y la URL de esta fuente; None si hay que visitarla
+        """
+        if not self.identity_index:
+            return None
+        try:
+            record = self.identity_index.resolved(cand)
+        except Exception as e:
+            self.logger.warning("enrich", f"No se pudo consultar el índice de identidades: {e}")
+            return None
+        if record is None:
+            return None
+        return record.model_copy(update={
+            "id": cand.id,
+            "url": cand.url,
+            "source": cand.source,
+            "last_updated": cand.last_updated or record.last_updated
+        })
+
+    def _register_identity(self, cand: CandidateSchema, fingerprint: str | None) -> None:
+        """
+        Registra el perfil enriquecido en el índice de identidades (un fallo no descarta el perfil)
+        """
+        if not self.identity_index:
+            return
+        try:
+            self.identity_index.add(cand, fingerprint=fingerprint)
+        except Exception as e:
+            self.logger.warning("enrich", f"No se pudo registrar la identidad de {cand.id}: {e}")
+
+    def _enrich_worker(
+        self,
+        worker_id: int,
+        storage_state: dict,
+        jobs: queue.Queue,
+        results: list[CandidateSchema] | dict[int, CandidateSchema],
+        total: int | None = None
+    ) -> None:
+        """
+        Worker de enriquecimiento: abre su propio navegador con la sesión autenticada
+        y procesa trabajos `(índice, candidato)` de la cola compartida hasta recibir None.
+        Playwright (sync) no es thread-safe, por eso cada hilo tiene su propia instancia.
+        """
+        try:
+            with sync_playwright() as p:
+                browser, close_browser = self._acquire_browser(p)
+                try:
+                    context = browser.new_context(storage_state=storage_state)
+                    self._attach_context(context)
+                    page = context.new_page()
+
+                    while True:
+                        job = jobs.get()
+                        if job is None:
+                            break
+
+                        index, cand = job
+                        # Tras cancelar o vencer el plazo se vacía la cola sin navegar (quedan con
+                        # datos de tarjeta)
+                        if self._should_stop():
+                            continue
+                        self.logger.info(
+                            "enrich",
+                            f"Procesando {index + 1}/{total}: {cand.name}"
+                            if total
+                            else f"Procesando #{index + 1}: {cand.name}",
+                            metadata={"worker": worker_id}
+                        )
+                        results[index] = self._enrich_one(page, cand)
+                finally:
+                    close_browser()
+        except Exception as e:
+            # Los índices no procesados conservan los datos de la tarjeta
+            self.logger.error("enrich", f"Error en worker {worker_id}: {e}")
+
+    def _start_enrich_workers(
+        self,
+        workers: int,
+        storage_state: dict,
+        jobs: queue.Queue,
+        results: list[CandidateSchema] | dict[int, CandidateSchema],
+        total: int | None = None
+    ) -> list[threading.Thread]:
+        """
+        Lanza los hilos de enriquecimiento que consumen la cola compartida
+        """
+        threads = [
+            threading.Thread(
+                target=self._enrich_worker,
+                args=(worker_id, storage_state, jobs, results, total),
+                name=f"occ-enrich-{worker_id}",
+                daemon=True
+            )
+            for worker_id in range(1, workers + 1)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    @staticmethod
+    def _submit_job(jobs: queue.Queue, job, threads: list[threading.Thread]) -> bool:
+        """
+        Encola un trabajo esperando si la cola está llena (backpressure).
+        Retorna False si ya no queda ningún worker vivo que pueda consumirlo.
+        """
+        while True:
+            try:
+                jobs.put(job, timeout=1)
+                return True
+            except queue.Full:
+                if not any(thread.is_alive() for thread in threads):
+                    return False
+
+    def _stop_enrich_workers(
+        self,
+        jobs: queue.Queue,
+        threads: list[threading.Thread],
+        cancel: bool = False
+    ) -> None:
+        """
+        Señala el fin de la cola y espera a los workers.
+        Con `cancel` descarta antes los trabajos pendientes (conservan los datos de tarjeta).
+        """
+        if cancel:
+            while True:
+                try:
+                    jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+        for _ in threads:
+            if not self._submit_job(jobs, None, threads):
+                break
+        for thread in threads:
+            thread.join()
+
+    def _enqueue_for_enrichment(
+        self,
+        jobs: queue.Queue,
+        threads: list[threading.Thread],
+        results: dict[int, CandidateSchema],
+        candidates: list[CandidateSchema],
+        offset: int
+    ) -> None:
+        """
+        Envía al pipeline los candidatos nuevos de una página (`offset` es su posición
+        en la lista acumulada). Los aciertos de caché se resuelven sin pasar por la cola.
+        """
+        resolved, pending = self._resolve_cached(candidates)
+        pending_set = set(pending)
+        for i, cand in enumerate(resolved):
+            if i not in pending_set:
+                results[offset + i] = cand
+
+        for i in pending:
+            if self._should_stop():
+                break
+            if not self._submit_job(jobs, (offset + i, candidates[i]), threads):
+                self.logger.warning(
+                    "enrich",
+                    "No quedan workers de enriquecimiento activos; se conservan los datos de "
+                    "tarjeta."
+                )
+                break
+
     def enrich_candidates(self, page, candidates: list[CandidateSchema]) -> list[CandidateSchema]:
         """
         Recibe una lista de candidatos, navega a sus URLs y completa la información.
-        Usa la página (sesión) ya abierta.
+        Con un solo worker usa la página (sesión) ya abierta; con varios, reparte los
+        perfiles entre un pool de navegadores que comparten la sesión de `_login`.
+        El orden de la lista original se conserva.
         """
-        enriched_list = []
-        
+        total = len(candidates)
+
         try:
-            total = len(candidates)
-            self.logger.info("enrich", f"Iniciando enriquecimiento de {total} candidatos...")
+            # Los aciertos de caché no navegan al perfil; se inicializa con los datos de la
+            # tarjeta para conservar el orden y como fallback si algún worker falla
+            results, pending = self._resolve_cached(candidates)
+            workers = min(self.enrich_workers, len(pending))
+
+            self.logger.info(
+                "enrich",
+                f"Iniciando enriquecimiento de {len(pending)} candidatos con {max(workers, 1)} "
+                "worker(s)..."
+            )
+
+            if workers <= 1:
+                for i in pending:
+                    if self._should_stop():
+                        self.logger.warning(
+                            "enrich",
+                            f"Enriquecimiento detenido ({self.stop_reason}); el resto conserva los "
+                            "datos de tarjeta."
+                        )
+                        break
+                    cand = candidates[i]
+                    self.logger.info("enrich", f"Procesando {i+1}/{total}: {cand.name}")
+                    results[i] = self._enrich_one(page, cand)
+                return results
+
+            # Compartir la sesión autenticada (cookies + localStorage) con los workers
+            storage_state = page.context.storage_state()
+
+            jobs: queue.Queue = queue.Queue()
+            for index in pending:
+                jobs.put((index, candidates[index]))
+
+            threads = self._start_enrich_workers(workers, storage_state, jobs, results, total)
+            self._stop_enrich_workers(jobs, threads)
+
+            return results
 
-            for i, cand in enumerate(candidates):
-                self.logger.info("enrich", f"Procesando {i+1}/{total}: {cand.name}")
-                
-                try:
-                    html = self._get_candidate_html(page, cand.url)
-                    if html:
-                        details = self._parse_candidate_html(html)
-                        
-                        # Lógica de actualización:
-                        # - Si encontramos nombre real, reemplazamos (incluso si no era confidencial, mejor el del perfil)
-                        new_name = details.get("name")
-                        if not new_name:
-                             new_name = cand.name
-                        
-                        # - Email, Phone, Salary, Specialty
-                        # - Skills y Experience (merge o replace? Replace con la data detallada es mejor)
-                        
-                        updated_cand = cand.model_copy(update={
-                            "name": new_name,
-                            "position": details.get("position") or cand.position,
-                            "salary": details.get("salary") or cand.salary,
-                            "specialty": details.get("specialty") or cand.specialty,
-                            "email": details.get("email") or cand.email,
-                            "phone": details.get("phone") or cand.phone,
-                            "skills": details.get("skills") or cand.skills,
-                            "experience": details.get("experience") or cand.experience,
-                            "last_updated": details.get("last_updated") or cand.last_updated
-                        })
-                        enriched_list.append(updated_cand)
-                        self.logger.info("enrich", f"Datos enriquecidos para {new_name}")
-                    else:
-                        enriched_list.append(cand) 
-                        
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    self.logger.error("enrich", f"Error procesando {cand.id}: {e}")
-                    enriched_list.append(cand)
-                    
         except Exception as e:
             self.logger.error("enrich", f"Error global en enriquecimiento: {e}")
-            return candidates 
-            
-        return enriched_list
-    
+            return candidates
+
+    @staticmethod
+    def _resume_from_next_data(data: dict) -> dict:
+        """
+        resume suele estar en props -> initialState -> resume -> resume
+        """
+        initial_state = data.get("props", {}).get("initialState", {})
+        return initial_state.get("resume", {}).get("resume", {})
+
+    def _fetch_candidate_document(self, page, url: str) -> str | None:
+        """
+        Descarga el documento del perfil con la API de peticiones del contexto autenticado
+        (sin renderizar ni cargar recursos). Retorna None si el __NEXT_DATA__ no trae `resume`.
+        """
+        response = self.pacer.fetch(page.context.request, url)
+        if not response.ok:
+            self.logger.warning(
+                "extract_detail", f"Respuesta {response.status} al descargar el perfil."
+            )
+            return None
+
+        html_content = response.text()
+        if self.recorder:
+            self.recorder.record_api(url, response, response.body())
+        next_data = self.parser.next_data(html_content)
+        if not next_data or not self._resume_from_next_data(next_data):
+            return None
+
+        return html_content
+
+    def _render_candidate_html(self, page, url: str) -> str:
+        """
+        Navega a la URL del candidato y obtiene el HTML renderizado de la página.
+        """
+        self.pacer.goto(page, url, wait_until="domcontentloaded")
+
+        # El perfil viene renderizado en servidor: basta con que exista __NEXT_DATA__.
+        # Si no aparece, se espera a networkidle para el fallback por DOM.
+        if not self.pacer.ready(page, "script#__NEXT_DATA__", state="attached", timeout=5000):
+            if not self.pacer.ready(page, load_state="networkidle", timeout=10000):
+                self.logger.warning("extract_detail", "Timeout esperando networkidle, intentando extraer HTML de todos modos.")
+
+        return page.content()
+
     def _get_candidate_html(self, page, url: str) -> str | None:
         """
-        Navega a la URL del candidato y obtiene el HTML completo de la página.
+        Obtiene el HTML del perfil del candidato.
+        En modo "request" intenta primero el documento crudo y solo renderiza la página
+        si el JSON de __NEXT_DATA__ no trae datos de `resume`.
         """
         try:
             if not url:
                 self.logger.warning("extract_detail", "URL de candidato inválida o vacía.")
                 return None
 
-            self.logger.info("extract_detail", f"Navegando al perfil: {url}")
-            page.goto(url)
-            
-            # Esperar a que cargue el contenido principal
-            try:
-                page.wait_for_load_state("networkidle", timeout=10000)
-            except Exception:
-                self.logger.warning("extract_detail", "Timeout esperando networkidle, intentando extraer HTML de todos modos.")
+            if self.profile_fetch_mode == "request":
+                try:
+                    self.logger.info("extract_detail", f"Descargando perfil: {url}")
+                    html_content = self._fetch_candidate_document(page, url)
+                    if html_content:
+                        self.logger.info(
+                            "extract_detail", "Documento del perfil obtenido sin renderizar."
+                        )
+                        return html_content
+                    self.logger.info(
+                        "extract_detail", "__NEXT_DATA__ sin resume, renderizando la página."
+                    )
+                except Exception as e:
+                    self.logger.warning(
+                        "extract_detail", f"Fallo la descarga directa, renderizando la página: {e}"
+                    )
 
-            html_content = page.content()
+            self.logger.info("extract_detail", f"Navegando al perfil: {url}")
+            html_content = self._render_candidate_html(page, url)
             self.logger.info("extract_detail", "HTML del perfil obtenido exitosamente.")
             
             return html_content
@@ -563,14 +1338,382 @@ class OCCScraper(BaseScraper):
             self.logger.error("extract_detail", f"Error al obtener HTML del candidato: {e}")
             return None
     
+    def _open_checkpoint(
+        self,
+        resume_token: str | None,
+        keyword: str,
+        location: str | None,
+        limit: int
+    ) -> ExtractionCheckpoint | None:
+        """
+        Carga el checkpoint del token de reanudación, o crea uno nuevo para la ejecución.
+        Un token que no existe (o de otra búsqueda) inicia una extracción desde cero con ese token.
+        """
+        if not resume_token and not self.checkpoints_enabled:
+            return None
+
+        params = {
+            "portal": "occ",
+            "keyword": keyword,
+            "location": location,
+            "limit": limit,
+            "delta_mode": self.delta_mode
+        }
+        token = resume_token or ExtractionCheckpoint.new_token()
+        self.last_resume_token = token
+
+        checkpoint = ExtractionCheckpoint.load(token) if resume_token else None
+        if checkpoint and checkpoint.matches(params):
+            self.logger.info(
+                "extract",
+                f"Reanudando extracción {token}: página {checkpoint.page}, "
+                f"{len(checkpoint.candidates)} candidatos, "
+                f"{len(checkpoint.enriched_ids)} enriquecidos."
+            )
+            return checkpoint
+
+        if checkpoint:
+            self.logger.warning(
+                "extract", f"El checkpoint {token} pertenece a otra búsqueda, se inicia desde cero."
+            )
+
+        self.logger.info(
+            "extract", f"Checkpoint de la ejecución: {token} (usar resume_token para reanudar)."
+        )
+        return ExtractionCheckpoint(token, params)
+
+    @staticmethod
+    def _resume_start(checkpoint: ExtractionCheckpoint | None, max_pages: int) -> int:
+        """
+        Primera página por extraer; `max_pages + 1` si la paginación ya había terminado
+        """
+        if checkpoint is None:
+            return 1
+        if checkpoint.status != "paginating":
+            return max_pages + 1
+        return min(checkpoint.page + 1, max_pages + 1)
+
+    def _close_checkpoint(self, completed: bool) -> None:
+        """
+        Elimina el checkpoint si la extracción terminó; si no, persiste el último progreso
+        """
+        checkpoint, self._checkpoint = self._checkpoint, None
+        if checkpoint is None:
+            return
+        try:
+            if completed:
+                checkpoint.clear()
+            else:
+                checkpoint.flush()
+                self.logger.warning(
+                    "extract",
+                    f"Extracción incompleta, reanudar con resume_token='{checkpoint.token}'."
+                )
+        except Exception as e:
+            self.logger.error("extract", f"No se pudo actualizar el checkpoint: {e}")
+
+    def _open_journal(
+        self,
+        file_name: str,
+        checkpoint: ExtractionCheckpoint | None,
+        known: list[CandidateSchema] | None = None
+    ) -> JsonlJournalExporter | None:
+        """
+        Abre el diario JSONL de la ejecución (None en modo "json").
+        Al reanudar se continúa el diario y se registran los candidatos del checkpoint.
+        Los candidatos `known` se registran primero para que el archivo compactado tenga
+        la búsqueda completa y no solo las páginas que faltaban.
+        """
+        if self.export_mode != "journal":
+            return None
+
+        resumed = bool(checkpoint and checkpoint.resumed)
+        journal = JsonlJournalExporter()
+        journal.open(file_name, truncate=not resumed)
+        if known:
+            journal.append(known)
+        if resumed:
+            journal.upsert(checkpoint.candidates)
+        self._journal = journal
+        return journal
+
+    def _close_journal(self) -> None:
+        """
+        Sincroniza el diario si la ejecución no llegó a compactarlo
+        """
+        journal, self._journal = self._journal, None
+        if journal is None:
+            return
+        try:
+            journal.close()
+        except Exception as e:
+            self.logger.error("extract", f"No se pudo cerrar el diario: {e}")
+
+    def _reset_run_stats(self) -> None:
+        """
+        Nueva capa de ritmo y contadores en cero para una ejecución
+        """
+        self.pacer = self._new_pacer()
+        self.resource_policy.reset_stats()
+        if self.profile_cache:
+            self.profile_cache.reset_stats()
+
+    def _log_run_summary(self) -> None:
+        """
+        Resúmenes de la ejecución: ritmo, recursos bloqueados y caché de perfiles
+        """
+        self.logger.info(
+            "extract",
+            "Resumen de ritmo (espera vs trabajo)",
+            metadata={**self.pacer.stats.summary(), "rates": self.pacer.limiter.rates()}
+        )
+        self.logger.info(
+            "extract",
+            "Resumen de recursos bloqueados",
+            metadata=self.resource_policy.stats()
+        )
+        if self.profile_cache:
+            self.logger.info(
+                "extract",
+                "Resumen de caché de perfiles",
+                metadata=self.profile_cache.stats()
+            )
+
+    @staticmethod
+    def _known_start(known: list[CandidateSchema] | None) -> int:
+        """
+        Primera página (de 50) que no está completa en los resultados ya conocidos
+        """
+        return len(known or []) // 50 + 1
+
+    def extract_remainder(
+        self,
+        keyword: str,
+        location: str | None,
+        limit: int,
+        known: list[CandidateSchema],
+        time_budget: float | None = None,
+        cancel_token: CancellationToken | None = None
+    ) -> list[CandidateSchema]:
+        """
+        Solo las páginas que faltan después de `known`: las conocidas no se vuelven a parsear
+        ni a enriquecer
+        """
+        return self.extract(keyword, location, limit, time_budget, cancel_token, known=known)
+
+    def _log_partial(self, candidates: list[CandidateSchema]) -> None:
+        """
+        Aviso de resultado parcial cuando la ejecución se detuvo por cancelación o plazo
+        """
+        if self.partial:
+            self.logger.warning(
+                "extract",
+                f"Ejecución detenida ({self.stop_reason}): resultado "
+                f"parcial con {len(candidates)} candidatos."
+            )
+
+    def _output_file(self, keyword: str, location: str | None) -> str:
+        """
+        Archivo de salida de la búsqueda; en modo delta solo contiene los candidatos nuevos
+        """
+        loc_str = location.replace(' ', '_') if location else "Todo_Mexico"
+        suffix = "_delta" if self.delta_mode else ""
+        return f"data/candidates_occ_{keyword.replace(' ', '_')}_{loc_str}{suffix}.json"
+
+    def _filter_page(
+        self,
+        candidates: list[CandidateSchema],
+        seen_ids: set,
+        query_key: str
+    ) -> tuple[list[CandidateSchema], bool]:
+        """
+        Deduplica los candidatos de una página de resultados.
+        En modo delta descarta además los ya registrados en el índice de vistos y
+        retorna True como segundo valor si la proporción de conocidos alcanza el umbral
+        (la paginación debe detenerse).
+        """
+        page_ids = {cand.id for cand in candidates if cand and cand.id}
+        known = set()
+        if self.delta_mode and self.seen_index:
+            known = self.seen_index.known(query_key, list(page_ids))
+
+        new_candidates = []
+        for cand in candidates:
+            if cand and cand.id and cand.id not in seen_ids:
+                seen_ids.add(cand.id)
+                if cand.id not in known:
+                    new_candidates.append(cand)
+
+        stop = False
+        if self.delta_mode and page_ids:
+            known_share = len(known) / len(page_ids)
+            if known_share >= self.delta_threshold:
+                self.logger.info(
+                    "extract",
+                    f"Modo delta: {known_share:.0%} de la página "
+                    "ya es conocido, se detiene la paginación."
+                )
+                stop = True
+
+        return new_candidates, stop
+
+    def _record_seen(self, query_key: str, candidates: list[CandidateSchema]) -> None:
+        """
+        Registra en el índice los candidatos extraídos en la ejecución
+        """
+        if not self.seen_index or not candidates:
+            return
+        try:
+            self.seen_index.add(query_key, [cand.id for cand in candidates])
+            self.logger.info(
+                "extract",
+                "Índice de vistos actualizado: "
+                f"{self.seen_index.count(query_key)} candidatos conocidos."
+            )
+        except Exception as e:
+            self.logger.error("extract", f"No se pudo actualizar el índice de vistos: {e}")
+
+    def _results_url_for(self, keyword: str, location: str | None) -> str | None:
+        """
+        Plantilla de URL de resultados configurada (`OCC_RESULTS_URL_TEMPLATE`) con la
+        palabra clave, el slug de ubicación y 50 resultados por página ya sustituidos.
+        Conserva el marcador `{page}` para el número de página.
+        """
+        if not self.direct_pagination or not self.results_url_template:
+            return None
+
+        return (
+            self.results_url_template
+            .replace("{keyword}", quote_plus(keyword))
+            .replace("{location}", self.LOCATION_SLUGS.get(location, "") if location else "")
+            .replace("{page_size}", "50")
+        )
+
+    def _learn_results_url(
+        self, previous_url: str, current_url: str, page_number: int
+    ) -> str | None:
+        """
+        Deriva la plantilla de URL de resultados comparando la URL antes y después de
+        pasar a `page_number` con el botón "siguiente": el parámetro (o segmento de ruta)
+        que tomó el valor del número de página se sustituye por `{page}`.
+        Si no se puede derivar lo advierte, porque el resto de la búsqueda se paginará
+        en serie con el botón.
+        """
+        if not self.direct_pagination:
+            return None
+        if not previous_url or previous_url == current_url:
+            self.logger.warning(
+                "extract",
+                "La URL no cambió al pasar de página; se pagina con el botón. "
+                "Define OCC_RESULTS_URL_TEMPLATE para cargar las páginas por URL directa."
+            )
+            return None
+
+        before, after = urlsplit(previous_url), urlsplit(current_url)
+        marker = str(page_number)
+        previous_query = dict(parse_qsl(before.query, keep_blank_values=True))
+        query = parse_qsl(after.query, keep_blank_values=True)
+
+        for key, value in query:
+            if value == marker and previous_query.get(key) != marker:
+                template_query = urlencode(
+                    [(k, "__PAGE__" if k == key else v) for k, v in query]
+                ).replace("__PAGE__", "{page}")
+                template = urlunsplit((after.scheme, after.netloc, after.path, template_query, ""))
+                self.logger.info(
+                    "extract",
+                    "Paginación directa por URL habilitada.",
+                    metadata={"template": template}
+                )
+                return template
+
+        before_segments, after_segments = before.path.split("/"), after.path.split("/")
+        if len(before_segments) == len(after_segments):
+            for index, (old, new) in enumerate(zip(before_segments, after_segments)):
+                if new == marker and old != marker:
+                    after_segments[index] = "{page}"
+                    template = urlunsplit(
+                        (after.scheme, after.netloc, "/".join(after_segments), after.query, "")
+                    )
+                    self.logger.info(
+                        "extract",
+                        "Paginación directa por URL habilitada.",
+                        metadata={"template": template}
+                    )
+                    return template
+
+        self.logger.warning(
+            "extract",
+            "No se pudo derivar la URL de resultados; se pagina con el botón. "
+            "Define OCC_RESULTS_URL_TEMPLATE para cargar las páginas por URL directa.",
+            metadata={"before": previous_url, "after": current_url}
+        )
+        return None
+
+    def _fetch_result_pages(
+        self, context, tabs: list, template: str, page_numbers: list[int]
+    ) -> list:
+        """
+        Carga varias páginas de resultados por URL directa en pestañas separadas.
+        Todas las navegaciones se inician antes de esperar a ninguna (el navegador las
+        descarga en paralelo) y los candidatos se leen en el orden de las páginas.
+        Una página que cargó sin tarjetas retorna lista vacía; una que no se pudo abrir
+        o leer retorna None para que se reintente.
+        """
+        while len(tabs) < len(page_numbers):
+            tabs.append(context.new_page())
+
+        started = []
+        for tab, number in zip(tabs, page_numbers):
+            url = template.replace("{page}", str(number))
+            try:
+                self.pacer.goto(tab, url, wait_until="commit")
+                started.append(True)
+            except Exception as e:
+                self.logger.error("extract", f"Error al abrir la página {number}: {e}")
+                started.append(False)
+
+        results = []
+        card_selector = self.SELECTORS["search"]["candidate_card"]
+        for tab, number, ok in zip(tabs, page_numbers, started):
+            if not ok:
+                results.append(None)
+                continue
+            try:
+                if not self.pacer.ready(tab, card_selector, state="attached"):
+                    results.append([])
+                    continue
+                results.append(self._extract_candidates(tab))
+            except Exception as e:
+                self.logger.error("extract", f"Error al leer la página {number}: {e}")
+                results.append(None)
+        return results
+
     def _change_page(self, page) -> bool:
         """
         Cambia a la siguiente página. Retorna True si tuvo éxito, False si no hay más páginas.
+        Espera a que la primera tarjeta cambie en lugar de una pausa fija.
         """
         try:
             next_button = page.locator(self.SELECTORS["search"]["next_page"])
             if next_button.is_visible(timeout=5000):
+                card_selector = self.SELECTORS["search"]["candidate_card"]
+                first_card = page.locator(card_selector).first
+                previous_id = first_card.get_attribute("id") if first_card.count() else None
+
+                self.pacer.limiter.acquire(page.url)
+                start = time.perf_counter()
                 next_button.click()
+                with self.pacer.stats.waiting("ready"):
+                    page.wait_for_function(
+                        """([selector, previous]) => {
+                            const card = document.querySelector(selector);
+                            return card !== null && card.id !== previous;
+                        }""",
+                        arg=[card_selector, previous_id],
+                        timeout=self.pacer.timeout()
+                    )
+                self.pacer.limiter.record(page.url, time.perf_counter() - start)
                 self.logger.info("extract", "Página siguiente.")
                 return True
             else:
@@ -584,22 +1727,21 @@ class OCCScraper(BaseScraper):
         self, 
         keyword: str,
         location: str | None = None,
-        limit: int = 100
+        limit: int = 100,
+        time_budget: float | None = None,
+        cancel_token: CancellationToken | None = None,
+        resume_token: str | None = None,
+        known: list[CandidateSchema] | None = None
     ) -> list[CandidateSchema]:
         """
         Abre el navegador, navega a la búsqueda y cierra.
-        Retorna una lista vacía por ahora
+        Con `resume_token` continúa una extracción interrumpida desde su checkpoint.
+        Con `time_budget` (segundos) o `cancel_token` se detiene entre páginas y perfiles,
+        guarda lo obtenido y conserva el checkpoint para reanudar (`partial` queda en True).
+        Con `known` (resultado previo de la misma búsqueda) empieza en la primera página que
+        no cubre y solo retorna y enriquece los candidatos que no estaban en él.
         """
-        fromated_keyword = keyword.replace(" ","%20")
-        url = "https://www.occ.com.mx/empresas/"
-
-        location_slugs = {
-            "CDMX": "LOC-21957",
-            "Edo Mex": "LOC-60991", 
-            "Nuevo León": "LOC-83091",
-            "Oaxaca": "LOC-87725",
-            "Querétaro": "LOC-99788"
-        }
+        url = self.base_url
 
         self.logger.info(
             "extract", 
@@ -608,85 +1750,435 @@ class OCCScraper(BaseScraper):
         )
 
         extracted_data = []
+        completed = False
+        self._begin_run(time_budget, cancel_token)
+        self._reset_run_stats()
+
+        checkpoint = self._open_checkpoint(resume_token, keyword, location, limit)
+        self._checkpoint = checkpoint
+        if checkpoint:
+            extracted_data = list(checkpoint.candidates)
+
+        # Estado del pipeline de enriquecimiento (si está activo)
+        jobs: queue.Queue = queue.Queue(maxsize=self.pipeline_queue_size)
+        threads: list[threading.Thread] = []
+        enriched: dict[int, CandidateSchema] = {}
 
         with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            page = browser.new_page()
+            context, close = self._open_context(p)
+            page = context.pages[0] if context.pages else context.new_page()
             
             try:
                 self.logger.info("extract", "Navegador iniciado, accediendo a URL base...")
                 # Primero vamos a la home o url base para loguearnos si es necesario
                 page.goto(url)
                 
-                # Ejecutar Login
-                self._login(page)
+                # Ejecutar Login (o reutilizar la sesión guardada)
+                self._ensure_session(page)
                 
                 # Ejecutar Búsqueda y Filtros
-                self._search(page, keyword, location, location_slugs)
-
-                time.sleep(2)
+                self._search(page, keyword, location, self.LOCATION_SLUGS)
 
-                seen_ids = set()
+                seen_ids = set(checkpoint.seen_ids) if checkpoint else set()
+                seen_ids.update(cand.id for cand in known or [] if cand.id)
+                query_key = SeenIndex.query_key("occ", keyword, location)
                 
                 # Calcular páginas necesarias (50 por página)
                 max_pages = math.ceil(limit / 50)
                 self.logger.info("extract", f"Se extraerán hasta {limit} registros (aprox. {max_pages} páginas).")
 
                 # Definir nombre de archivo único
-                loc_str = location.replace(' ', '_') if location else "Todo_Mexico"
-                file_name = f"data/candidates_occ_{keyword.replace(' ', '_')}_{loc_str}.json"
+                file_name = self._output_file(keyword, location)
                 exporter = JsonExporter()
+                journal = self._open_journal(file_name, checkpoint, known)
+
+                # Al reanudar (o con resultados ya conocidos) se avanza hasta la primera página
+                # pendiente sin volver a parsear; con plantilla de URL se carga directamente
+                start_page = max(
+                    self._resume_start(checkpoint, max_pages), self._known_start(known)
+                )
+                template = self._results_url_for(keyword, location)
+                main_index = start_page  # página que muestra la pestaña principal
+                if template and start_page > 1:
+                    main_index = 1
+                else:
+                    for _ in range(start_page - 1 if start_page <= max_pages else 0):
+                        if not self._change_page(page):
+                            start_page = max_pages + 1
+                            self.exhausted = True
+                            break
 
-                for i in range(1, max_pages + 1):
-                    try:
-                        self.logger.info("extract", f"Extrayendo página {i} de {max_pages}")
-                        time.sleep(2)
-                        
-                        candidates = self._extract_candidates(page)
-                        
-                        # Filtrar duplicados
-                        new_candidates = []
-                        for cand in candidates:
-                            if cand.id and cand.id not in seen_ids:
-                                seen_ids.add(cand.id)
-                                new_candidates.append(cand)
-
-                        if new_candidates:
-                            extracted_data.extend(new_candidates)
-                            self.logger.info("extract", f"Agregados {len(new_candidates)} candidatos nuevos. Total: {len(extracted_data)}")
-                            
-                            # Guardado parcial
-                            exporter.save(extracted_data, file_name)
+                if self.pipeline_enabled:
+                    # Los workers comparten la sesión autenticada y consumen mientras se pagina
+                    self.logger.info(
+                        "extract",
+                        f"Pipeline de enriquecimiento activo con {self.enrich_workers} worker(s)."
+                    )
+                    threads = self._start_enrich_workers(
+                        self.enrich_workers, context.storage_state(), jobs, enriched
+                    )
+                    # Candidatos de un checkpoint que quedaron sin enriquecer
+                    if extracted_data:
+                        self._enqueue_for_enrichment(
+                            jobs, threads, enriched, list(extracted_data), 0
+                        )
+
+                def consume(page_index: int, candidates: list) -> bool:
+                    """
+                    Procesa en orden los candidatos de una página. Retorna True si
+                    hay que detenerse.
+                    """
+                    # Filtrar duplicados (y en modo delta, los ya conocidos)
+                    new_candidates, stop = self._filter_page(candidates, seen_ids, query_key)
+
+                    if new_candidates:
+                        extracted_data.extend(new_candidates)
+                        self.logger.info("extract", f"Agregados {len(new_candidates)} candidatos nuevos. Total: {len(extracted_data)}")
+
+                        # Guardado parcial: solo los nuevos en el diario (costo
+                        # constante por página)
+                        if journal:
+                            journal.append(new_candidates)
                         else:
-                             self.logger.info("extract", "No se encontraron candidatos nuevos en esta página.")
+                            exporter.save(list(known or []) + extracted_data, file_name)
+                    else:
+                         self.logger.info("extract", "No se encontraron candidatos nuevos en esta página.")
+
+                    # La página se registra antes de encolar sus perfiles para que el checkpoint
+                    # ya tenga las tarjetas cuando los workers marquen los enriquecidos
+                    if checkpoint:
+                        checkpoint.record_page(page_index, seen_ids, extracted_data)
+
+                    if new_candidates and threads:
+                        self._enqueue_for_enrichment(
+                            jobs, threads, enriched, new_candidates,
+                            len(extracted_data) - len(new_candidates)
+                        )
+                    self._emit("candidates", new_candidates)
+                    self._emit("page_done", page=page_index, total=len(extracted_data))
+                    return stop
+
+                # Con plantilla de URL las páginas siguientes se cargan en pestañas simultáneas;
+                # sin ella se pagina con el botón y se intenta derivar la plantilla del primer clic
+                tabs: list = []
+                i = start_page
+                while i <= max_pages:
+                    if self._should_stop():
+                        self.logger.warning(
+                            "extract", f"Paginación detenida en la página {i} ({self.stop_reason})."
+                        )
+                        break
+                    direct = bool(template) and i != main_index
+                    try:
+                        if direct:
+                            window = list(range(i, min(i + self.page_tabs, max_pages + 1)))
+                            self.logger.info(
+                                "extract",
+                                f"Extrayendo páginas {window[0]}-{window[-1]} "
+                                f"de {max_pages} por URL directa"
+                            )
+                            finished = False
+                            for number, candidates in zip(
+                                window, self._fetch_result_pages(context, tabs, template, window)
+                            ):
+                                if candidates is None:
+                                    # Una página que falló se reintenta una vez sola
+                                    # antes de omitirla
+                                    candidates = self._fetch_result_pages(
+                                        context, tabs, template, [number]
+                                    )[0]
+                                if candidates is None:
+                                    self.logger.error(
+                                        "extract",
+                                        f"Página {number} omitida: falló tras reintentar."
+                                    )
+                                    i = number + 1
+                                    continue
+                                ids = {cand.id for cand in candidates if cand and cand.id}
+                                # Página vacía o repetida: se pasó del final de los resultados
+                                if not ids or ids <= seen_ids:
+                                    self.logger.info(
+                                        "extract",
+                                        f"Página {number} sin candidatos "
+                                        "nuevos. Fin de la paginación."
+                                    )
+                                    self.exhausted = True
+                                    finished = True
+                                    break
+                                if consume(number, candidates):
+                                    finished = True
+                                    break
+                                i = number + 1
+                            if finished:
+                                break
+                            continue
 
+                        self.logger.info("extract", f"Extrayendo página {i} de {max_pages}")
+                        self.pacer.ready(
+                            page, self.SELECTORS["search"]["candidate_card"], state="attached"
+                        )
 
-                        time.sleep(2)
-                        
-                        if not self._change_page(page):
+                        candidates = self._extract_candidates(page)
+                        if consume(i, candidates) or i == max_pages:
                             break
 
+                        if not template:
+                            previous_url = page.url
+                            if not self._change_page(page):
+                                self.exhausted = True
+                                break
+                            template = self._learn_results_url(previous_url, page.url, i + 1)
+                            main_index = i + 1
+                        i += 1
+
                     except Exception as e:
-                        self.logger.error("extract", f"Error al extraer candidatos: {e}")
+                        self.logger.error(
+                            "extract", f"Error al extraer candidatos de la página {i}: {e}"
+                        )
+                        # Solo se salta la página que falló; las ya procesadas de la ventana
+                        # avanzaron `i` y las restantes se cargan en la siguiente vuelta
+                        if direct:
+                            i += 1
+                        else:
+                            if not template:
+                                main_index = i + 1
+                            i += 1
 
             # --- Enriquecimiento al finalizar la paginación ---
+                if checkpoint:
+                    checkpoint.start_enrichment(extracted_data)
+
+                if threads:
+                    self.logger.info(
+                        "extract",
+                        "Paginación terminada, esperando a los workers de enriquecimiento..."
+                    )
+                    self._stop_enrich_workers(jobs, threads, cancel=self._should_stop())
+                    threads = []
+                    for index, cand in enriched.items():
+                        extracted_data[index] = cand
+
                 if extracted_data:
-                    self.logger.info("extract", "Iniciando fase de enriquecimiento de perfiles...")
-                    extracted_data = self.enrich_candidates(page, extracted_data)
+                    if not self.pipeline_enabled:
+                        self.logger.info("extract", "Iniciando fase de enriquecimiento de perfiles...")
+                        extracted_data = self.enrich_candidates(page, extracted_data)
                     
                     # Guardado final (Sobreescribe con datos enriquecidos)
-                    exporter.save(extracted_data, file_name)
+                    if journal:
+                        journal.compact()
+                    else:
+                        exporter.save(list(known or []) + extracted_data, file_name)
                     self.logger.info("extract", "Enriquecimiento completado y guardado.")
-                
-                
+                    # Un resultado parcial no se marca como visto: se completa
+                    # reanudando el checkpoint
+                    if not self.partial:
+                        self._record_seen(query_key, extracted_data)
+
+                completed = not self.partial
+                self._log_partial(extracted_data)
+
 
             except Exception as e:
                 self.logger.error("extract", f"Error durante la navegación: {e}")
+                # Lo obtenido hasta el error es un resultado parcial (no se cachea ni se
+                # marca como visto)
+                self.stop_reason = self.stop_reason or "error"
             finally:
-                self._logout(page) # Cierra sesión sin importar si hubo errores
-                time.sleep(2)
-                browser.close()
+                # Ante un error se descartan los trabajos pendientes (quedan en el checkpoint)
+                if threads:
+                    self._stop_enrich_workers(jobs, threads, cancel=True)
+                # La sesión se conserva para la siguiente ejecución salvo que se pida el logout
+                if self.logout_on_exit:
+                    self._logout(page)
+                close()
+                if self.logout_on_exit:
+                    self.session_store.clear(self.account)
                 self.logger.info("extract", "Navegador cerrado.")
+                self._close_journal()
+                self._close_checkpoint(completed)
+                self._log_run_summary()
+                self._save_recording()
 
         return extracted_data
-        
\ No newline at end of file
+
+    def _collect_cards(
+        self, page, keyword: str, location: str | None, limit: int
+    ) -> list[CandidateSchema]:
+        """
+        Ejecuta una búsqueda en la página dada y pagina sus resultados sin enriquecer
+        (deduplicados y, en modo delta, solo los nuevos)
+        """
+        self._search(page, keyword, location, self.LOCATION_SLUGS)
+
+        seen_ids = set()
+        query_key = SeenIndex.query_key("occ", keyword, location)
+        collected: list[CandidateSchema] = []
+        max_pages = math.ceil(limit / 50)
+        for i in range(1, max_pages + 1):
+            if self._should_stop():
+                self.logger.warning(
+                    "batch",
+                    f"[{keyword} | {location or 'Todo México'}] paginación detenida en la página "
+                    f"{i} ({self.stop_reason})."
+                )
+                break
+            self.pacer.ready(page, self.SELECTORS["search"]["candidate_card"], state="attached")
+            new_candidates, stop = self._filter_page(
+                self._extract_candidates(page), seen_ids, query_key
+            )
+            collected.extend(new_candidates)
+            self.logger.info(
+                "batch",
+                f"[{keyword} | {location or 'Todo México'}] página {i}: {len(new_candidates)} "
+                f"nuevos, total {len(collected)}"
+            )
+            if stop or i == max_pages or not self._change_page(page):
+                break
+
+        return collected
+
+    def _batch_worker(
+        self,
+        worker_id: int,
+        storage_state: dict,
+        jobs: queue.Queue,
+        limit: int,
+        results: dict
+    ) -> None:
+        """
+        Worker de búsqueda: contexto propio con la sesión autenticada compartida,
+        procesa combinaciones (palabra clave, ubicación) de la cola hasta recibir None
+        """
+        try:
+            with sync_playwright() as p:
+                browser, close_browser = self._acquire_browser(p)
+                try:
+                    context = browser.new_context(storage_state=storage_state)
+                    self._attach_context(context)
+                    page = context.new_page()
+
+                    while True:
+                        combo = jobs.get()
+                        if combo is None:
+                            break
+
+                        keyword, location = combo
+                        # Tras cancelar o vencer el plazo se vacía la cola sin buscar
+                        if self._should_stop():
+                            continue
+                        try:
+                            self.pacer.goto(page, self.base_url)
+                            results[combo] = self._collect_cards(page, keyword, location, limit)
+                        except Exception as e:
+                            self.logger.error(
+                                "batch",
+                                f"Error en la búsqueda '{keyword}' / "
+                                f"'{location or 'Todo México'}': {e}",
+                                metadata={"worker": worker_id}
+                            )
+                finally:
+                    close_browser()
+        except Exception as e:
+            self.logger.error("batch", f"Error en worker de búsqueda {worker_id}: {e}")
+
+    def extract_batch(
+        self,
+        keywords: list[str],
+        locations: list[str | None] | None = None,
+        limit: int = 100,
+        time_budget: float | None = None,
+        cancel_token: CancellationToken | None = None
+    ) -> dict[tuple[str, str | None], list[CandidateSchema]]:
+        """
+        Ejecuta la matriz palabras clave × ubicaciones con un solo login.
+        Las combinaciones corren en contextos separados (hasta `batch_concurrency` a la vez)
+        que comparten la sesión; los candidatos repetidos entre combinaciones se enriquecen
+        una sola vez. Retorna los candidatos por combinación.
+        Con `time_budget` (segundos) o `cancel_token` se detiene entre combinaciones, páginas
+        y perfiles y retorna lo obtenido (`partial` queda en True).
+        """
+        combos = list(dict.fromkeys(
+            (keyword, location) for keyword in keywords for location in (locations or [None])
+        ))
+        self.logger.info("batch", f"Iniciando búsqueda por lotes: {len(combos)} combinaciones.")
+
+        per_combo: dict[tuple[str, str | None], list[CandidateSchema]] = {}
+        results: dict[tuple[str, str | None], list[CandidateSchema]] = {
+            combo: [] for combo in combos
+        }
+        self._begin_run(time_budget, cancel_token)
+        self._reset_run_stats()
+
+        with sync_playwright() as p:
+            context, close = self._open_context(p)
+            page = context.pages[0] if context.pages else context.new_page()
+
+            try:
+                page.goto(self.base_url)
+                # Un solo login para todas las combinaciones
+                self._ensure_session(page)
+                storage_state = context.storage_state()
+
+                jobs: queue.Queue = queue.Queue()
+                for combo in combos:
+                    jobs.put(combo)
+
+                workers = min(self.batch_concurrency, len(combos))
+                threads = [
+                    threading.Thread(
+                        target=self._batch_worker,
+                        args=(worker_id, storage_state, jobs, limit, per_combo),
+                        name=f"occ-batch-{worker_id}",
+                        daemon=True
+                    )
+                    for worker_id in range(1, workers + 1)
+                ]
+                for thread in threads:
+                    thread.start()
+                for _ in threads:
+                    jobs.put(None)
+                for thread in threads:
+                    thread.join()
+
+                # Deduplicación entre combinaciones: cada candidato se enriquece una vez
+                unique: dict[str, CandidateSchema] = {}
+                for combo in combos:
+                    for cand in per_combo.get(combo, []):
+                        unique.setdefault(cand.id, cand)
+                total_cards = sum(len(cands) for cands in per_combo.values())
+                self.logger.info(
+                    "batch",
+                    f"{total_cards} tarjetas en {len(per_combo)} "
+                    f"combinaciones, {len(unique)} candidatos únicos."
+                )
+
+                if unique:
+                    enriched = {
+                        cand.id: cand
+                        for cand in self.enrich_candidates(page, list(unique.values()))
+                    }
+                    for combo in combos:
+                        results[combo] = [enriched[cand.id] for cand in per_combo.get(combo, [])]
+                        # Un resultado parcial no se marca como visto
+                        if not self.partial:
+                            self._record_seen(SeenIndex.query_key("occ", *combo), results[combo])
+
+                    file_name = f"data/candidates_occ_batch_{time.strftime('%Y%m%d_%H%M%S')}.json"
+                    JsonExporter().save(list(enriched.values()), file_name)
+
+                self._log_partial(list(unique.values()))
+
+            except Exception as e:
+                self.logger.error("batch", f"Error durante la búsqueda por lotes: {e}")
+                self.stop_reason = self.stop_reason or "error"
+            finally:
+                if self.logout_on_exit:
+                    self._logout(page)
+                close()
+                if self.logout_on_exit:
+                    self.session_store.clear(self.account)
+                self.logger.info("batch", "Navegador cerrado.")
+                self._log_run_summary()
+                self._save_recording()
+
+        return results
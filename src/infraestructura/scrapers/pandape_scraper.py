@@ -1,13 +1,18 @@
 import time
 from playwright.sync_api import sync_playwright
+from src.domain.cancellation import CancellationToken
 from src.domain.interfaces import BaseScraper
 from src.domain.models import CandidateSchema
+from src.infraestructura.browser.pool import BrowserPool
+from src.infraestructura.browser.resource_policy import ResourceBlockingPolicy
 from src.infraestructura.logging import Logger, ConsoleLogHandler
 
 class PandapeScraper(BaseScraper):
     """
     Implementación concreta del scraper para OCC usando Playwright
     """
+    SOURCE = "pandape"
+
     SELECTORS = {
         "login": {
             "username": "",
@@ -16,8 +21,14 @@ class PandapeScraper(BaseScraper):
         },
     }
     
-    def __init__(self):
+    def __init__(
+        self,
+        resource_policy: ResourceBlockingPolicy | None = None,
+        browser_pool: BrowserPool | None = None
+    ):
         self.logger = Logger(handlers=[ConsoleLogHandler()])
+        self.resource_policy = resource_policy or ResourceBlockingPolicy.from_env()
+        self.browser_pool = browser_pool
 
     def _login(self, page) -> None:
         """
@@ -25,11 +36,19 @@ class PandapeScraper(BaseScraper):
         """
         pass # TODO: Implementar login
 
+    def _logout(self, page) -> None:
+        """
+        Cierra la sesión en Pandape
+        """
+        pass # TODO: Implementar logout
+
     def extract(
         self, 
         keyword: str,
         location: str | None = None,
-        limit: int = 100
+        limit: int = 100,
+        time_budget: float | None = None,
+        cancel_token: CancellationToken | None = None
     ) -> list[CandidateSchema]:
         formatted_keyword = keyword.replace(" ", "%20")
         url = "https://ats.pandape.com/Company/Dashboard"
@@ -40,9 +59,22 @@ class PandapeScraper(BaseScraper):
         )
 
         extracted_data = [] # TODO: Implementar extracción de datos
+        self._begin_run(time_budget, cancel_token)
+        if self._should_stop():
+            return extracted_data
+        self.resource_policy.reset_stats()
         with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            page = browser.new_page()
+            # Con pool se reutiliza un navegador caliente en lugar de lanzar uno nuevo
+            lease = self.browser_pool.acquire() if self.browser_pool else None
+            try:
+                browser = lease.connect(p) if lease else p.chromium.launch(headless=False)
+            except Exception:
+                if lease:
+                    self.browser_pool.release(lease)
+                raise
+            context = browser.new_context()
+            self.resource_policy.attach(context)
+            page = context.new_page()
             try:
                 page.goto(url)
                 time.sleep(5)
@@ -54,11 +86,19 @@ class PandapeScraper(BaseScraper):
                 self.logger.error(
                     "extract", f"Error: {e}"
                 )
+                self.stop_reason = self.stop_reason or "error"
             finally:
                 browser.close()
+                if lease:
+                    self.browser_pool.release(lease)
                 self.logger.info(
                     "extract", 
                     "Navegador cerrado."
                 )
+                self.logger.info(
+                    "extract",
+                    "Resumen de recursos bloqueados",
+                    metadata=self.resource_policy.stats()
+                )
 
         return extracted_data
@@ -0,0 +1,83 @@
+import json
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+class HtmlParserBackend:
+    """
+    Backend de parseo HTML para los scrapers.
+    - Motor seleccionable por ejecución: 'html.parser' (puro Python, por defecto)
+      o 'lxml' (en C, mucho más rápido; requiere `uv add lxml`).
+    - Parseo parcial: construye solo los nodos que se van a leer (tarjetas,
+      datos de contacto) y extrae __NEXT_DATA__ sin construir árbol.
+    """
+    ENGINES = ("html.parser", "lxml")
+
+    NEXT_DATA_PATTERN = re.compile(
+        r'<script[^>]*\bid=["\']?__NEXT_DATA__["\']?[^>]*>(.*?)</script>',
+        re.DOTALL | re.IGNORECASE
+    )
+
+    def __init__(self, engine: str = "html.parser"):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Motor de parseo no soportado: {engine}. Opciones: {self.ENGINES}")
+
+        self.requested_engine = engine
+        # Si lxml no está instalado se usa html.parser para no romper la ejecución
+        self.engine = engine if engine != "lxml" or LXML_AVAILABLE else "html.parser"
+
+    @property
+    def degraded(self) -> bool:
+        """
+        True si el motor solicitado no está disponible y se usa el de respaldo
+        """
+        return self.engine != self.requested_engine
+
+    def parse(self, html: str, only: SoupStrainer | None = None) -> BeautifulSoup:
+        """
+        Construye el árbol completo, o solo los elementos que cumplen `only`
+        """
+        return BeautifulSoup(html, self.engine, parse_only=only)
+
+    def parse_links(self, html: str, href_fragment: str) -> list:
+        """
+        Parsea únicamente los <a> cuyo href contiene el fragmento (tarjetas de resultados)
+        """
+        strainer = SoupStrainer("a", href=lambda href: bool(href) and href_fragment in href)
+        soup = self.parse(html, only=strainer)
+        return soup.find_all("a")
+
+    def parse_by_testid(self, html: str, testids: list[str]) -> BeautifulSoup:
+        """
+        Parsea únicamente los elementos con alguno de los `data-testid` dados
+        """
+        strainer = SoupStrainer(attrs={"data-testid": lambda value: value in testids})
+        return self.parse(html, only=strainer)
+
+    @classmethod
+    def next_data_text(cls, html: str) -> str | None:
+        """
+        Texto crudo del script __NEXT_DATA__, sin construir el DOM
+        """
+        match = cls.NEXT_DATA_PATTERN.search(html)
+        return match.group(1) if match else None
+
+    @classmethod
+    def next_data(cls, html: str) -> dict | None:
+        """
+        JSON de __NEXT_DATA__ ya decodificado, o None si no existe o es inválido
+        """
+        raw = cls.next_data_text(html)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
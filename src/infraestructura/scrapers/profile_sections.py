@@ -0,0 +1,67 @@
+class ProfileSectionIndex:
+    """
+    Índice de secciones del perfil de OCC construido en un solo recorrido del DOM.
+    Mapea cada texto de encabezado buscado al primer <p> que lo contiene y,
+    en el mismo recorrido, localiza la línea "CV: XXXXX - Última actividad ...".
+    Sustituye las búsquedas `soup.find(lambda ...)` independientes por campo,
+    pasando de O(campos × DOM) a O(DOM) por perfil.
+    """
+
+    def __init__(self, headers: dict[str, str], collect_activity: bool = False):
+        # headers: clave del campo -> texto del encabezado (e.g. "salary" -> "Salario deseado")
+        self.headers = headers
+        self.collect_activity = collect_activity
+        self._found: dict = {}
+        self.activity_text: str | None = None
+
+    @classmethod
+    def build(
+        cls, soup, headers: dict[str, str], collect_activity: bool = False
+    ) -> "ProfileSectionIndex":
+        """
+        Recorre una sola vez los <p> del documento (en orden) y se detiene en cuanto
+        encuentra todos los encabezados y la línea de actividad solicitados
+        """
+        index = cls(headers, collect_activity)
+        if not headers and not collect_activity:
+            return index
+
+        pending = dict(headers)
+        for p in soup.find_all("p"):
+            if pending:
+                text = p.get_text()
+                for key, header_text in list(pending.items()):
+                    if header_text in text:
+                        index._found[key] = p
+                        del pending[key]
+
+            if index.collect_activity and index.activity_text is None:
+                index.activity_text = cls._activity_from(p)
+
+            if not pending and (not index.collect_activity or index.activity_text is not None):
+                break
+
+        return index
+
+    @staticmethod
+    def _activity_from(p) -> str | None:
+        """
+        Busca texto "CV: ... - Última actividad ..." o "Actualizado ..."
+        """
+        # Normalizamos el texto (reemplazar saltos de línea por espacios y quitar espacios extra)
+        raw_text = p.get_text(" ", strip=True)
+        clean_text = " ".join(raw_text.split())
+
+        if "CV:" in clean_text and "-" in clean_text:
+            # La estructura es "CV: XXXXX - Texto de fecha"; tomamos la última parte
+            candidate_last_part = clean_text.split("-")[-1].strip()
+            # Validamos que parezca una fecha o texto de actividad (mínimo algo de texto)
+            if len(candidate_last_part) > 2:
+                return candidate_last_part
+        return None
+
+    def header(self, key: str):
+        """
+        Retorna el <p> del encabezado de la sección, o None si no existe
+        """
+        return self._found.get(key)
@@ -1,5 +1,7 @@
 import sys
 import os
+import json
+import time
 import asyncio
 import platform
 import streamlit as st
@@ -13,13 +15,107 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 
 import pandas as pd
 from src.application.services import CandidateSearchService
+from src.domain.cancellation import CancellationToken
+from src.infraestructura.browser.pool import BrowserPool
+from src.infraestructura.persistence.job_queue import SearchJobQueue
 from src.infraestructura.persistence.json_exporter import JsonExporter
 from src.infraestructura.scrapers.occ_scraper import OCCScraper
 from src.infraestructura.scrapers.pandape_scraper import PandapeScraper
 # Agregar los demás scrapers
 
+@st.cache_resource
+def get_browser_pool() -> BrowserPool | None:
+    """
+    Pool de navegadores compartido por todas las sesiones de la app.
+    Se calienta en segundo plano al iniciar para que la primera búsqueda no espere a Chromium.
+    """
+    if os.getenv("BROWSER_POOL", "true").lower() != "true":
+        return None
+    pool = BrowserPool.shared()
+    pool.warm()
+    return pool
+
+@st.cache_resource
+def get_job_queue() -> SearchJobQueue | None:
+    """
+    Cola de búsquedas compartida (SEARCH_JOBS): la UI solo encola y consulta; los procesos
+    `worker.py` ejecutan el scraping fuera del hilo del script de Streamlit
+    """
+    if os.getenv("SEARCH_JOBS", "false").lower() != "true":
+        return None
+    return SearchJobQueue()
+
+STATUS_LABELS = {
+    "queued": "⏳ En cola",
+    "running": "🔄 En ejecución",
+    "done": "✅ Terminada",
+    "failed": "❌ Falló",
+    "cancelled": "⏹ Cancelada"
+}
+
+def show_job(job_queue: SearchJobQueue, job_id: str) -> None:
+    """
+    Estado, avance y resultados de un trabajo; mientras no termina la página se
+    refresca sola y una recarga del navegador no interrumpe la búsqueda
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        st.warning(f"No existe el trabajo {job_id}.")
+        return
+
+    st.markdown(f"### Búsqueda `{job.id}`: {job.keyword} ({job.location or 'Todo México'})")
+    st.write(f"{STATUS_LABELS[job.status]} | fuentes: {', '.join(job.sources)}")
+
+    if not job.finished:
+        sources = job.progress.get("sources", {})
+        for source, progress in sources.items():
+            st.caption(
+                f"{source}: página {progress.get('page', '-')}, "
+                f"{progress.get('total') or 0} candidatos"
+            )
+        st.caption(f"Candidatos recibidos: {job.progress.get('candidates', 0)}")
+        if job.cancel_requested:
+            st.info("Cancelación solicitada; se conservará lo obtenido.")
+        elif st.button("Cancelar búsqueda", key=f"cancel-{job.id}"):
+            job_queue.cancel(job.id)
+        time.sleep(2)
+        st.rerun()
+        return
+
+    if job.error:
+        st.error(job.error)
+    if job.partial:
+        st.warning("⚠️ Resultado parcial: la búsqueda se detuvo por tiempo o cancelación.")
+    if not job.result_file or not os.path.exists(job.result_file):
+        st.info("No se encontraron candidatos con los criterios de búsqueda.")
+        return
+
+    with open(job.result_file, "r", encoding="utf-8") as f:
+        results = json.load(f)
+    st.success(f"✅ Se encontraron {len(results)} candidatos.")
+    df = pd.DataFrame(results)
+    st.dataframe(df, width="stretch")
+    st.download_button(
+        label="📥 Descargar JSON",
+        data=df.to_json(orient="records", indent=4, force_ascii=False),
+        file_name=f"candidatos_{job.keyword.replace(' ', '_')}.json",
+        mime="application/json"
+    )
+
+def cancel_search() -> None:
+    """
+    Cancela la búsqueda en curso de la sesión; los scrapers se detienen en el siguiente
+    punto de control y se conserva lo obtenido
+    """
+    token = st.session_state.get("search_token")
+    if token is not None:
+        token.cancel()
+
 def main():
     st.set_page_config(page_title="Job Scraper", page_icon="🕵️", layout="wide")
+    job_queue = get_job_queue()
+    # Con cola de búsquedas el scraping ocurre en los workers, no hace falta el pool aquí
+    browser_pool = get_browser_pool() if job_queue is None else None
     
     st.title("🕵️ Automatizador de Reclutamiento")
     st.markdown("Herramienta para extración de candidatos de múltiples sitios web.")
@@ -33,6 +129,28 @@ def main():
     st.sidebar.checkbox("Computrabajo", value=False, disabled=True, help="Implementación en progreso")
     st.sidebar.checkbox("Indeed", value=False, disabled=True, help="Implementación en progreso")
 
+    if job_queue is not None:
+        priority = st.sidebar.selectbox("Prioridad", ("Normal", "Alta"))
+        recent = job_queue.list(limit=20)
+        if recent:
+            # Solo al cambiar la selección: una búsqueda recién encolada no se reemplaza
+            # en cada refresco
+            st.sidebar.selectbox(
+                "Búsquedas recientes",
+                [None] + [job.id for job in recent],
+                format_func=lambda job_id: (
+                    "—"
+                    if job_id is None
+                    else next(
+                        f"{job.keyword} · {STATUS_LABELS[job.status]}"
+                        for job in recent
+                        if job.id == job_id
+                    )
+                ),
+                key="recent_job",
+                on_change=lambda: st.session_state.update(job_id=st.session_state["recent_job"])
+            )
+
     st.markdown("### Filtros de Búsqueda")
     location_option = st.radio(
         "Selecciona la ubicación",
@@ -42,7 +160,7 @@ def main():
     
     location_param = None if "Todo México" in location_option else location_option
 
-    col1, col2 = st.columns([1, 3])
+    col1, col2, col3 = st.columns([1, 3, 1])
     
     with col1:
         limit = st.number_input(
@@ -60,33 +178,118 @@ def main():
             placeholder="Ej. Desarrollador Python"
         )
 
-    search_btn = st.button("Buscar Candidatos", type="primary")
+    with col3:
+        budget_minutes = st.number_input(
+            "Tiempo máximo (min)",
+            min_value=0,
+            max_value=240,
+            value=0,
+            step=5,
+            help=(
+                "0 = sin límite. Al vencer se detiene la búsqueda y se muestran "
+                "los candidatos obtenidos."
+            )
+        )
+
+    search_col, cancel_col = st.columns([1, 5])
+    with search_col:
+        search_btn = st.button("Buscar Candidatos", type="primary")
+    if job_queue is None:
+        with cancel_col:
+            # Al pulsarlo Streamlit reinicia el script; el callback cancela antes el token
+            # de la búsqueda
+            st.button("Cancelar búsqueda", on_click=cancel_search)
+
+    if search_btn and keyword and not (use_occ or use_pandape):
+        st.warning("Por favor, selecciona al menos un sitio web.")
+        return
+
+    if job_queue is not None:
+        if search_btn and keyword:
+            sources = [
+                name for name, enabled in (("occ", use_occ), ("pandape", use_pandape)) if enabled
+            ]
+            st.session_state["job_id"] = job_queue.submit(
+                keyword, location_param, limit,
+                sources=sources,
+                priority=10 if priority == "Alta" else 0,
+                time_budget=budget_minutes * 60 or None
+            )
+        if st.session_state.get("job_id"):
+            show_job(job_queue, st.session_state["job_id"])
+        return
 
     if search_btn and keyword:
-        if not (use_occ or use_pandape):
-            st.warning("Por favor, selecciona al menos un sitio web.")
-            return
 
         with st.spinner(f"Ejecutando buscador para '{keyword}' ..."):
             exporter = JsonExporter()
             service = CandidateSearchService(exporter)
 
             if use_occ:
-                service.add_scraper(OCCScraper())
+                service.add_scraper(OCCScraper(browser_pool=browser_pool))
             if use_pandape:
-                service.add_scraper(PandapeScraper())
+                service.add_scraper(PandapeScraper(browser_pool=browser_pool))
             # Agregar más servicios
             
             try:
-                results = service.search_candidates(keyword, location_param, limit)
+                # La tabla se llena conforme los portales entregan candidatos y perfiles
+                status = st.empty()
+                table = st.empty()
+                rows: dict = {}
+                last_render = 0.0
+                finished = None
+
+                token = CancellationToken()
+                st.session_state["search_token"] = token
+
+                for event in service.search_candidates_stream(
+                    keyword, location_param, limit,
+                    time_budget=budget_minutes * 60 or None,
+                    cancel_token=token
+                ):
+                    for identity in event.data.get("removed_identities", []):
+                        rows.pop(identity, None)
+                    for candidate in event.candidates:
+                        rows[
+                            candidate.identity_id
+                            or f"{candidate.source}:{candidate.id or candidate.url}"
+                        ] = candidate.model_dump()
 
-                if results:
-                    st.success(f"✅ Se encontraron {len(results)} candidatos.")
+                    if event.kind == "page_done":
+                        status.info(
+                            f"{event.source}: página {event.data.get('page')} lista "
+                            f"({event.data.get('total')} candidatos)"
+                        )
+                    elif event.kind == "scraper_finished":
+                        partial = (
+                            f" (parcial: {event.data['stop_reason']})"
+                            if event.data.get("partial")
+                            else ""
+                        )
+                        status.info(
+                            f"{event.source}: terminado con {event.data.get('total')} "
+                            f"candidatos{partial}"
+                        )
+                    elif event.kind == "scraper_error":
+                        st.error(f"Error en {event.source}: {event.message}")
+                    elif event.kind == "search_finished":
+                        finished = event
 
-                    df = pd.DataFrame([c.model_dump() for c in results])
-                    st.dataframe(df, width="stretch")
+                    # Redibujar como máximo dos veces por segundo
+                    if rows and (time.monotonic() - last_render > 0.5 or finished):
+                        table.dataframe(pd.DataFrame(list(rows.values())), width="stretch")
+                        last_render = time.monotonic()
+
+                status.empty()
+                if finished and finished.data.get("partial"):
+                    sources = ", ".join(finished.data["partial_sources"])
+                    st.warning(
+                        f"⚠️ Resultado parcial: {sources} se detuvo por tiempo o cancelación."
+                    )
+                if rows:
+                    st.success(f"✅ Se encontraron {len(rows)} candidatos.")
 
-                    json_str = df.to_json(
+                    json_str = pd.DataFrame(list(rows.values())).to_json(
                         orient="records", 
                         indent=4, 
                         force_ascii=False
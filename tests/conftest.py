@@ -0,0 +1,9 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def login_name(monkeypatch):
+    # El Logger registra el usuario del sistema; sin terminal (CI) os.getlogin falla
+    monkeypatch.setattr(os, "getlogin", lambda: "pytest")
@@ -0,0 +1,107 @@
+from src.domain.models import CandidateSchema
+from src.infraestructura.persistence.checkpoint import ExtractionCheckpoint
+
+
+def make_candidate(candidate_id: str, **details) -> CandidateSchema:
+    return CandidateSchema(
+        id=candidate_id,
+        name=f"Candidato {candidate_id}",
+        position="Ejecutivo de ventas",
+        url=f"https://example.com/{candidate_id}",
+        **details
+    )
+
+
+def test_enriched_before_page_survives_resume(tmp_path):
+    # Un worker puede terminar un perfil antes de que su página quede registrada
+    checkpoint = ExtractionCheckpoint(
+        "token", {"keyword": "ventas"}, base_dir=str(tmp_path), flush_every=1
+    )
+    card = make_candidate("a")
+    checkpoint.mark_enriched(make_candidate("a", email="a@example.com", phone="5555555555"))
+    checkpoint.record_page(1, {"a"}, [card])
+
+    loaded = ExtractionCheckpoint.load("token", base_dir=str(tmp_path))
+
+    assert loaded.is_enriched("a")
+    assert loaded.candidates[0].email == "a@example.com"
+    assert loaded.candidates[0].phone == "5555555555"
+
+
+def test_enriched_without_page_is_kept(tmp_path):
+    checkpoint = ExtractionCheckpoint("token", {}, base_dir=str(tmp_path), flush_every=1)
+    checkpoint.record_page(1, {"a"}, [make_candidate("a")])
+    checkpoint.mark_enriched(make_candidate("b", email="b@example.com"))
+
+    loaded = ExtractionCheckpoint.load("token", base_dir=str(tmp_path))
+    loaded.record_page(2, {"a", "b"}, [make_candidate("a"), make_candidate("b")])
+
+    assert [cand.id for cand in loaded.candidates] == ["a", "b"]
+    assert loaded.candidates[1].email == "b@example.com"
+    assert not loaded.is_enriched("a")
+
+
+def test_resume_keeps_progress(tmp_path):
+    checkpoint = ExtractionCheckpoint(
+        "token", {"keyword": "ventas"}, base_dir=str(tmp_path), flush_every=1
+    )
+    checkpoint.record_page(1, {"a"}, [make_candidate("a")])
+    checkpoint.record_page(2, {"a", "b"}, [make_candidate("a"), make_candidate("b")])
+    checkpoint.start_enrichment([make_candidate("a"), make_candidate("b")])
+    checkpoint.mark_enriched(make_candidate("b", email="b@example.com"))
+
+    loaded = ExtractionCheckpoint.load("token", base_dir=str(tmp_path))
+
+    assert loaded.matches({"keyword": "ventas"})
+    assert loaded.status == "enriching"
+    assert loaded.page == 2
+    assert loaded.seen_ids == {"a", "b"}
+    assert loaded.enriched_ids == {"b"}
+    assert loaded.candidates[1].email == "b@example.com"
+
+
+def test_clear_removes_state(tmp_path):
+    checkpoint = ExtractionCheckpoint("token", {}, base_dir=str(tmp_path))
+    checkpoint.record_page(1, {"a"}, [make_candidate("a")])
+    checkpoint.clear()
+
+    assert ExtractionCheckpoint.load("token", base_dir=str(tmp_path)) is None
+
+
+def test_pages_are_appended_to_journal(tmp_path):
+    checkpoint = ExtractionCheckpoint("token", {}, base_dir=str(tmp_path), flush_every=1)
+    candidates = []
+    for page in range(1, 4):
+        candidates.append(make_candidate(str(page)))
+        checkpoint.record_page(page, {cand.id for cand in candidates}, list(candidates))
+
+    # Cada página agrega un registro con solo su candidato nuevo
+    with open(checkpoint.journal_path, encoding="utf-8") as f:
+        lines = f.readlines()
+    assert len(lines) == 3
+    assert '"id": "1"' not in lines[2]
+
+    checkpoint.start_enrichment(candidates)
+    assert not (tmp_path / "token.jsonl").exists()
+    assert [
+        cand.id for cand in ExtractionCheckpoint.load("token", base_dir=str(tmp_path)).candidates
+    ] == ["1", "2", "3"]
+
+
+def test_incomplete_journal_line_is_ignored(tmp_path):
+    checkpoint = ExtractionCheckpoint("token", {}, base_dir=str(tmp_path), flush_every=1)
+    checkpoint.record_page(1, {"a"}, [make_candidate("a")])
+    with open(checkpoint.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "page", "page": 2, "seen_')
+
+    loaded = ExtractionCheckpoint.load("token", base_dir=str(tmp_path))
+
+    assert loaded.page == 1
+    assert [cand.id for cand in loaded.candidates] == ["a"]
+
+    # Lo que se registre al reanudar no se pega a la línea incompleta
+    loaded.record_page(2, {"a", "b"}, [make_candidate("a"), make_candidate("b")])
+    reloaded = ExtractionCheckpoint.load("token", base_dir=str(tmp_path))
+
+    assert reloaded.page == 2
+    assert [cand.id for cand in reloaded.candidates] == ["a", "b"]
@@ -0,0 +1,92 @@
+import pytest
+
+from src.domain.models import CandidateSchema, Experience
+from src.infraestructura.persistence.identity_index import CandidateIdentityIndex, IdentityMerger
+
+SKILLS = ["Ventas", "Negociación", "CRM", "Prospección", "Excel", "Atención a clientes"]
+EXPERIENCE = [
+    Experience(
+        position="Ejecutivo de ventas",
+        company="Aseguradora del Centro",
+        description="Venta de seguros de vida y gastos médicos a empresas"
+    )
+]
+
+
+def make_candidate(source: str, candidate_id: str, **fields) -> CandidateSchema:
+    data = {
+        "id": candidate_id,
+        "name": "Confidencial",
+        "position": "Ejecutivo de ventas",
+        "url": f"https://{source}.example.com/{candidate_id}",
+        "source": source,
+        "skills": SKILLS,
+        "experience": EXPERIENCE,
+        **fields
+    }
+    return CandidateSchema(**data)
+
+
+@pytest.fixture
+def index(tmp_path):
+    return CandidateIdentityIndex(path=str(tmp_path / "identities.sqlite3"))
+
+
+def test_same_email_across_sources_merges(index):
+    first_id, _ = index.add(make_candidate("occ", "1", name="Ana López", email="Ana@example.com"))
+    second_id, record = index.add(
+        make_candidate("pandape", "9", email="ana+cv@example.com", phone="55 1234 5678")
+    )
+
+    assert first_id == second_id
+    assert record.name == "Ana López"
+    assert record.phone == "55 1234 5678"
+    assert record.provenance["phone"] == "pandape:9"
+    assert record.sources == ["occ:1", "pandape:9"]
+
+
+def test_near_duplicate_with_contact_data_merges(index):
+    first_id, _ = index.add(make_candidate("occ", "1", name="Ana López", email="ana@example.com"))
+    second_id, _ = index.add(make_candidate("pandape", "9", name="Ana López", phone="5512345678"))
+
+    assert first_id == second_id
+    assert index.stats()["near_duplicate"] == 1
+
+
+def test_card_only_near_duplicates_do_not_merge(index):
+    # Dos tarjetas de OCC con el mismo perfil profesional pero sin nombre real ni contacto
+    merger = IdentityMerger(index)
+    merger.add([make_candidate("occ", "1"), make_candidate("occ", "2")])
+
+    assert len(merger) == 2
+    assert index.stats()["near_duplicate"] == 0
+
+
+def test_card_does_not_merge_into_enriched_near_duplicate(index):
+    first_id, _ = index.add(make_candidate("occ", "1", name="Ana López", email="ana@example.com"))
+    second_id, _ = index.add(make_candidate("occ", "2"))
+
+    assert first_id != second_id
+
+
+def test_conflicting_emails_do_not_merge(index):
+    first_id, _ = index.add(make_candidate("occ", "1", name="Ana López", email="ana@example.com"))
+    second_id, _ = index.add(
+        make_candidate("pandape", "9", name="Ana López", email="otra@example.com")
+    )
+
+    assert first_id != second_id
+
+
+def test_resolved_requires_matching_fingerprint(index):
+    card = make_candidate("occ", "1", last_updated="Actualizado hace 2 días")
+    profile = card.model_copy(update={"name": "Ana López", "email": "ana@example.com"})
+
+    index.add(profile)
+    # Registrado sin huella: no se puede saber si el perfil cambió
+    assert index.resolved(card) is None
+    assert index.resolved(card.model_copy(update={"last_updated": None})) is None
+
+    index.add(profile, fingerprint="Actualizado hace 2 días")
+    assert index.resolved(card).email == "ana@example.com"
+    assert index.resolved(card.model_copy(update={"last_updated": "Actualizado hoy"})) is None
@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+from src.infraestructura.persistence.job_queue import SearchJobQueue
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "jobs.sqlite3")
+
+
+@pytest.fixture
+def jobs(db_path):
+    queue = SearchJobQueue(path=db_path)
+    yield queue
+    queue.close()
+
+
+def test_claim_takes_highest_priority_then_oldest(jobs):
+    first = jobs.submit("ventas")
+    urgent = jobs.submit("cobranza", priority=5)
+    second = jobs.submit("soporte")
+
+    claimed = [jobs.claim(f"w{index}", max_running=10).id for index in range(3)]
+
+    assert claimed == [urgent, first, second]
+    assert jobs.claim("w3", max_running=10) is None
+    job = jobs.get(urgent)
+    assert job.status == "running" and job.worker == "w0" and job.started_at is not None
+
+
+def test_claim_respects_global_and_portal_limits(jobs):
+    jobs.submit("ventas", sources=["occ"])
+    jobs.submit("cobranza", sources=["occ"])
+    pandape = jobs.submit("soporte", sources=["pandape"])
+
+    assert jobs.claim("w1", max_running=2, portal_limits={"occ": 1}).keyword == "ventas"
+    # El segundo trabajo de OCC excede el límite del portal: se salta al de Pandapé
+    assert jobs.claim("w2", max_running=2, portal_limits={"occ": 1}).id == pandape
+    assert jobs.claim("w3", max_running=3, portal_limits={"occ": 1}) is None
+    assert jobs.claim("w3", max_running=2) is None
+
+
+def test_finish_records_the_outcome(jobs):
+    done_id = jobs.submit("ventas")
+    failed_id = jobs.submit("cobranza")
+    jobs.claim("w1", max_running=2)
+    jobs.claim("w2", max_running=2)
+
+    jobs.finish(done_id, "done", total=42, result_file="data/candidates_ventas.json", partial=True)
+    jobs.finish(failed_id, "failed", error="portal caído")
+
+    done, failed = jobs.get(done_id), jobs.get(failed_id)
+    assert (done.status, done.total, done.partial) == ("done", 42, True)
+    assert (failed.status, failed.error) == ("failed", "portal caído")
+    assert done.finished_at is not None
+    # Los trabajos terminados liberan el cupo
+    jobs.submit("soporte")
+    assert jobs.claim("w3", max_running=1).keyword == "soporte"
+
+
+def test_cancel_queued_and_running_jobs(jobs):
+    running = jobs.submit("ventas")
+    queued = jobs.submit("cobranza")
+    jobs.claim("w1", max_running=1)
+
+    jobs.cancel(queued)
+    jobs.cancel(running)
+
+    assert jobs.get(queued).status == "cancelled"
+    assert jobs.get(running).status == "running"
+    assert jobs.heartbeat(running, {"page": 3}) is True
+    assert jobs.get(running).progress == {"page": 3}
+
+
+def test_stale_running_job_is_requeued_and_claimed_again(jobs):
+    job_id = jobs.submit("ventas")
+    jobs.claim("dead-worker", max_running=1)
+
+    assert jobs.requeue_stale(timeout_seconds=3600) == 0
+    assert jobs.requeue_stale(timeout_seconds=-1) == 1
+
+    job = jobs.get(job_id)
+    assert job.status == "queued" and job.worker is None
+    assert jobs.claim("w2", max_running=1).id == job_id
+
+
+def test_stale_job_with_pending_cancel_is_cancelled(jobs):
+    job_id = jobs.submit("ventas")
+    jobs.claim("dead-worker", max_running=1)
+    jobs.cancel(job_id)
+
+    jobs.requeue_stale(timeout_seconds=-1)
+
+    assert jobs.get(job_id).status == "cancelled"
+    assert jobs.claim("w2", max_running=1) is None
+
+
+@pytest.mark.parametrize("n_jobs", [1, 4])
+def test_racing_workers_never_claim_the_same_job(db_path, n_jobs):
+    queue = SearchJobQueue(path=db_path)
+    submitted = {queue.submit(f"busqueda {index}") for index in range(n_jobs)}
+
+    n_workers = 8
+    barrier = threading.Barrier(n_workers)
+    claimed: list = []
+
+    def work(name: str) -> None:
+        # Cada worker con su propia conexión, como procesos separados
+        own = SearchJobQueue(path=db_path)
+        barrier.wait()
+        job = own.claim(name, max_running=n_workers)
+        if job:
+            claimed.append(job.id)
+        own.close()
+
+    threads = [threading.Thread(target=work, args=(f"w{index}",)) for index in range(n_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == sorted(submitted)
+    assert {queue.get(job_id).status for job_id in submitted} == {"running"}
+    queue.close()
@@ -0,0 +1,89 @@
+import json
+import os
+
+import pytest
+
+from src.domain.models import CandidateSchema
+from src.infraestructura.persistence.jsonl_journal_exporter import JsonlJournalExporter
+
+
+def make_candidate(
+    candidate_id: str | None, name: str = "Confidencial", url: str | None = None
+) -> CandidateSchema:
+    return CandidateSchema(
+        id=candidate_id,
+        name=name,
+        position="Ejecutivo de ventas",
+        url=url or f"https://example.com/{candidate_id}"
+    )
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = JsonlJournalExporter(fsync_every=1)
+    journal.open(str(tmp_path / "candidates.json"))
+    yield journal
+    journal.close()
+
+
+def read_output(path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_upsert_is_idempotent(journal):
+    journal.append([make_candidate("a"), make_candidate("b")])
+    enriched = make_candidate("a", name="Ana López")
+    journal.upsert([enriched])
+    journal.upsert([enriched])
+    journal.close()
+
+    records = JsonlJournalExporter.read_journal(journal.filename)
+
+    assert [(r["id"], r["name"]) for r in records] == [("a", "Ana López"), ("b", "Confidencial")]
+
+
+def test_records_without_id_are_keyed_by_url(journal):
+    card = make_candidate(None, url="https://example.com/sin-id")
+    journal.append([card])
+    journal.append([card])
+    journal.upsert([make_candidate(None, name="Ana López", url="https://example.com/sin-id")])
+    journal.close()
+
+    records = JsonlJournalExporter.read_journal(journal.filename)
+
+    assert [r["name"] for r in records] == ["Ana López"]
+
+
+def test_repeated_record_without_id_or_url_is_not_duplicated(journal):
+    journal._write_entries([{"op": "add", "data": {"name": "Ana"}}] * 2)
+    journal.close()
+
+    assert len(JsonlJournalExporter.read_journal(journal.filename)) == 1
+
+
+def test_compact_applies_journal_and_removes_it(journal):
+    journal.append([make_candidate("a"), make_candidate("b"), make_candidate("c")])
+    journal.upsert([make_candidate("b", name="Beto")])
+    journal.remove(["c"])
+    # Caída a mitad de escritura: línea final incompleta
+    journal._file.write('{"op": "add", "data": {"id": "d"')
+
+    count = journal.compact()
+
+    assert count == 2
+    assert [(r["id"], r["name"]) for r in read_output(journal.filename)] == [
+        ("a", "Confidencial"), ("b", "Beto")
+    ]
+    assert not os.path.exists(JsonlJournalExporter.journal_path(journal.filename))
+
+
+def test_compacting_twice_gives_same_output(journal):
+    journal.append([make_candidate("a")])
+    journal.upsert([make_candidate("a", name="Ana López")])
+    journal.compact(remove_journal=False)
+    first = read_output(journal.filename)
+
+    journal.compact()
+
+    assert read_output(journal.filename) == first
@@ -0,0 +1,78 @@
+import contextlib
+
+import pytest
+
+from src.domain.cancellation import CancellationToken
+from src.domain.models import CandidateSchema
+from src.infraestructura.scrapers import occ_scraper
+from src.infraestructura.scrapers.occ_scraper import OCCScraper
+
+
+class FakePage:
+    def goto(self, url):
+        pass
+
+
+class FakeContext:
+    pages = [FakePage()]
+
+    def storage_state(self):
+        return {}
+
+    def new_page(self):
+        return FakePage()
+
+
+class FakeBrowser:
+    def new_context(self, storage_state=None):
+        return FakeContext()
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OCC_SEEN_INDEX", "false")
+    monkeypatch.setenv("IDENTITY_INDEX", "false")
+    monkeypatch.setenv("OCC_PROFILE_CACHE", "false")
+    monkeypatch.setattr(occ_scraper, "sync_playwright", contextlib.nullcontext)
+
+    scraper = OCCScraper(enrich_workers=1, persist_session=False, logout_on_exit=False)
+    monkeypatch.setattr(scraper, "_open_context", lambda p: (FakeContext(), lambda: None))
+    monkeypatch.setattr(scraper, "_acquire_browser", lambda p: (FakeBrowser(), lambda: None))
+    monkeypatch.setattr(scraper, "_attach_context", lambda context: None)
+    monkeypatch.setattr(scraper, "_ensure_session", lambda page: None)
+    monkeypatch.setattr(scraper, "_get_candidate_html", lambda page, url: None)
+    monkeypatch.setattr(
+        scraper, "_collect_cards",
+        lambda page, keyword, location, limit: [
+            CandidateSchema(
+                id=f"{keyword}-1", name="Confidencial", position=keyword,
+                url=f"https://example.com/{keyword}"
+            )
+        ]
+    )
+    return scraper
+
+
+def test_batch_ignores_state_left_by_previous_run(scraper):
+    # Una ejecución anterior cancelada deja su token y su motivo en la instancia reutilizada
+    previous = CancellationToken()
+    previous.cancel()
+    scraper.cancel_token = previous
+    scraper.stop_reason = "cancelled"
+
+    results = scraper.extract_batch(["ventas", "cobranza"])
+
+    assert [cand.id for cand in results[("ventas", None)]] == ["ventas-1"]
+    assert [cand.id for cand in results[("cobranza", None)]] == ["cobranza-1"]
+    assert not scraper.partial
+
+
+def test_batch_honours_cancel_token(scraper):
+    token = CancellationToken()
+    token.cancel()
+
+    results = scraper.extract_batch(["ventas"], cancel_token=token)
+
+    assert results[("ventas", None)] == []
+    assert scraper.stop_reason == "cancelled"
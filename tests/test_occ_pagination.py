@@ -0,0 +1,139 @@
+import contextlib
+import json
+
+import pytest
+
+from src.domain.models import CandidateSchema
+from src.infraestructura.scrapers import occ_scraper
+from src.infraestructura.scrapers.occ_scraper import OCCScraper
+
+
+def cards(page_number):
+    return [
+        CandidateSchema(
+            id=f"p{page_number}-{index}", name="Confidencial", position="Ventas",
+            url=f"https://example.com/p{page_number}-{index}"
+        )
+        for index in range(2)
+    ]
+
+
+class FakePage:
+    url = "https://example.com/resultados"
+
+    def goto(self, url):
+        pass
+
+
+class FakeContext:
+    pages = [FakePage()]
+
+    def storage_state(self):
+        return {}
+
+    def new_page(self):
+        return FakePage()
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OCC_SEEN_INDEX", "false")
+    monkeypatch.setenv("IDENTITY_INDEX", "false")
+    monkeypatch.setenv("OCC_PROFILE_CACHE", "false")
+    monkeypatch.setenv("OCC_CHECKPOINTS", "false")
+    monkeypatch.setenv("OCC_PIPELINE", "false")
+    monkeypatch.setenv("OCC_PAGE_TABS", "3")
+    monkeypatch.setenv("OCC_RESULTS_URL_TEMPLATE", "https://example.com/resultados?q={keyword}&page={page}")
+    monkeypatch.setattr(occ_scraper, "sync_playwright", contextlib.nullcontext)
+
+    scraper = OCCScraper(enrich_workers=1, persist_session=False, logout_on_exit=False)
+    monkeypatch.setattr(scraper, "_open_context", lambda p: (FakeContext(), lambda: None))
+    monkeypatch.setattr(scraper, "_ensure_session", lambda page: None)
+    monkeypatch.setattr(scraper, "_search", lambda page, keyword, location, slugs: None)
+    monkeypatch.setattr(scraper.pacer, "ready", lambda page, *args, **kwargs: True)
+    monkeypatch.setattr(scraper, "_extract_candidates", lambda page: cards(1))
+    monkeypatch.setattr(scraper, "enrich_candidates", lambda page, candidates: candidates)
+    return scraper
+
+
+def fake_fetch(failures):
+    """
+    `_fetch_result_pages` que falla `failures[n]` veces en la página n y registra cada carga.
+    """
+    calls = []
+
+    def fetch(context, tabs, template, page_numbers):
+        calls.append(list(page_numbers))
+        results = []
+        for number in page_numbers:
+            if failures.get(number, 0) > 0:
+                failures[number] -= 1
+                results.append(None)
+            else:
+                results.append(cards(number))
+        return results
+
+    return fetch, calls
+
+
+def test_failed_page_is_retried_once(scraper, monkeypatch):
+    fetch, calls = fake_fetch({3: 1})
+    monkeypatch.setattr(scraper, "_fetch_result_pages", fetch)
+
+    results = scraper.extract("Ventas", limit=250)
+
+    assert calls == [[2, 3, 4], [3], [5]]
+    assert [cand.id for cand in results][::2] == ["p1-0", "p2-0", "p3-0", "p4-0", "p5-0"]
+
+
+def test_page_failing_twice_only_skips_that_page(scraper, monkeypatch):
+    fetch, calls = fake_fetch({3: 2})
+    monkeypatch.setattr(scraper, "_fetch_result_pages", fetch)
+
+    results = scraper.extract("Ventas", limit=250)
+
+    assert calls == [[2, 3, 4], [3], [5]]
+    assert [cand.id for cand in results][::2] == ["p1-0", "p2-0", "p4-0", "p5-0"]
+
+
+def test_error_in_window_resumes_after_processed_pages(scraper, monkeypatch):
+    fetch, calls = fake_fetch({})
+    monkeypatch.setattr(scraper, "_fetch_result_pages", fetch)
+    original = scraper._filter_page
+    failed = []
+
+    def filter_page(candidates, seen_ids, query_key):
+        # La página 3 lanza una sola vez al procesarse
+        if candidates[0].id.startswith("p3-") and not failed:
+            failed.append(True)
+            raise RuntimeError("fallo al procesar")
+        return original(candidates, seen_ids, query_key)
+
+    monkeypatch.setattr(scraper, "_filter_page", filter_page)
+
+    results = scraper.extract("Ventas", limit=250)
+
+    # Solo se pierde la página que lanzó; la 4 se vuelve a cargar en la siguiente ventana
+    assert calls == [[2, 3, 4], [4, 5]]
+    assert [cand.id for cand in results][::2] == ["p1-0", "p2-0", "p4-0", "p5-0"]
+
+
+@pytest.mark.parametrize("export_mode", ["journal", "json"])
+def test_remainder_keeps_known_candidates_in_output_file(scraper, monkeypatch, export_mode):
+    fetch, calls = fake_fetch({})
+    monkeypatch.setattr(scraper, "_fetch_result_pages", fetch)
+    scraper.export_mode = export_mode
+    # 50 candidatos conocidos: la página 1 ya está cubierta
+    known = cards(1) + [
+        CandidateSchema(id=f"k{index}", name="Confidencial", position="Ventas", url=f"https://example.com/k{index}")
+        for index in range(48)
+    ]
+
+    results = scraper.extract_remainder("Ventas", None, 100, known=known)
+
+    assert calls == [[2]]
+    assert [cand.id for cand in results] == ["p2-0", "p2-1"]
+    with open(scraper._output_file("Ventas", None), encoding="utf-8") as f:
+        ids = [record["id"] for record in json.load(f)]
+    assert ids[:2] == ["p1-0", "p1-1"] and ids[-2:] == ["p2-0", "p2-1"] and len(ids) == 52
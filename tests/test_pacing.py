@@ -0,0 +1,141 @@
+import pytest
+
+from src.infraestructura.browser.pacing import AdaptiveRateLimiter, Pacer
+
+URL = "https://www.occ.com.mx/empresas/candidatos/cv/1"
+
+
+class FakeClock:
+    """
+    Reloj manual: `sleep` avanza el tiempo en lugar de esperar
+    """
+    def __init__(self):
+        self.now = 100.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_limiter(clock: FakeClock, **kwargs) -> AdaptiveRateLimiter:
+    options = {
+        "initial_rate": 2.0,
+        "min_rate": 0.25,
+        "max_rate": 3.0,
+        "burst": 2.0,
+        "increase_step": 0.5
+    }
+    return AdaptiveRateLimiter(clock=clock, sleep=clock.sleep, **(options | kwargs))
+
+
+def rate(limiter: AdaptiveRateLimiter) -> float:
+    return limiter.rates()["www.occ.com.mx"]
+
+
+def test_error_halves_the_rate(clock):
+    limiter = make_limiter(clock)
+
+    limiter.record(URL, 0.1, ok=False)
+    assert rate(limiter) == 1.0
+    limiter.record(URL, 0.1, ok=False)
+    assert rate(limiter) == 0.5
+
+
+def test_high_average_latency_halves_the_rate(clock):
+    limiter = make_limiter(clock, target_latency=1.0)
+
+    limiter.record(URL, 3.0)
+
+    assert rate(limiter) == 1.0
+
+
+def test_fast_successes_recover_additively(clock):
+    limiter = make_limiter(clock)
+    limiter.record(URL, 0.1, ok=False)
+
+    limiter.record(URL, 0.1)
+    assert rate(limiter) == 1.5
+    limiter.record(URL, 0.1)
+    assert rate(limiter) == 2.0
+
+
+def test_rate_stays_within_floor_and_ceiling(clock):
+    limiter = make_limiter(clock)
+
+    for _ in range(10):
+        limiter.record(URL, 0.1, ok=False)
+    assert rate(limiter) == 0.25
+
+    for _ in range(20):
+        limiter.record(URL, 0.1)
+    assert rate(limiter) == 3.0
+
+
+def test_bucket_waits_once_the_burst_is_spent(clock):
+    limiter = make_limiter(clock)
+
+    assert limiter.acquire(URL) == 0.0
+    assert limiter.acquire(URL) == 0.0
+    # Sin tokens: a 2 peticiones/s el siguiente llega en 0.5 s
+    assert limiter.acquire(URL) == pytest.approx(0.5)
+    assert clock.slept == [pytest.approx(0.5)]
+    assert limiter.stats.summary()["wait_counts"] == {"rate_limit": 1}
+
+
+def test_bucket_refills_up_to_the_burst(clock):
+    limiter = make_limiter(clock)
+    limiter.acquire(URL)
+    limiter.acquire(URL)
+
+    clock.now += 60  # inactivo mucho tiempo: se acumulan como máximo `burst` tokens
+
+    assert [limiter.acquire(URL) for _ in range(3)] == [0.0, 0.0, pytest.approx(0.5)]
+
+
+def test_domains_have_independent_buckets(clock):
+    limiter = make_limiter(clock)
+    limiter.record(URL, 0.1, ok=False)
+
+    limiter.acquire("https://ats.pandape.com/Company/Dashboard")
+
+    assert limiter.rates() == {"www.occ.com.mx": 1.0, "ats.pandape.com": 2.0}
+
+
+class FakeResponse:
+    def __init__(self, status: int):
+        self.status = status
+
+
+class FakePage:
+    def __init__(self, clock: FakeClock, latency: float, status: int):
+        self.clock = clock
+        self.latency = latency
+        self.status = status
+
+    def goto(self, url, **kwargs):
+        self.clock.now += self.latency
+        return FakeResponse(self.status)
+
+
+@pytest.mark.parametrize("latency, status, expected", [
+    (0.2, 200, 2.5),   # rápida y exitosa: aumento aditivo
+    (0.2, 429, 1.0),   # limitada por el portal: disminución multiplicativa
+    (5.0, 200, 1.0),   # lenta: disminución multiplicativa
+])
+def test_pacer_feeds_latency_and_status_back(clock, latency, status, expected):
+    limiter = make_limiter(clock)
+    pacer = Pacer(limiter)
+
+    response = pacer.goto(FakePage(clock, latency, status), URL)
+
+    assert response.status == status
+    assert rate(limiter) == expected
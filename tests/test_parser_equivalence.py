@@ -0,0 +1,109 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from benchmarks.bench_profile_sections import build_profile_html
+from benchmarks.occ_standin.synthetic import SyntheticSite
+from src.domain.models import CandidateSchema, Experience
+from src.infraestructura.scrapers.occ_scraper import OCCScraper
+from src.infraestructura.scrapers.parser_backend import LXML_AVAILABLE
+
+# Campos que el parseo original no llenaba en las tarjetas
+CARD_FIELDS_ADDED = {"last_updated", "source"}
+
+
+def baseline_cards(html: str) -> list[CandidateSchema]:
+    """
+    Parseo de tarjetas anterior al backend: árbol completo con html.parser y selector CSS
+    """
+    candidates = []
+    for card in BeautifulSoup(html, "html.parser").select("a[href*='/empresas/candidatos/cv/']"):
+        href = card.get("href", "")
+        content_col = card.select_one("div > div:nth-of-type(2)")
+        title_tag = content_col.find("p")
+        location = None
+        loc_icon = content_col.select_one("svg.atomic__location")
+        if loc_icon and loc_icon.find_next_sibling("p"):
+            location = loc_icon.find_next_sibling("p").get_text(strip=True)
+        experience = [
+            Experience(position=" - ".join(p.get_text(strip=True) for p in block.find_all("p")))
+            for block in content_col.find_all("div", recursive=False)[2:]
+            if block.find_all("p")
+        ]
+        education = experience.pop().position if experience else None
+        candidates.append(CandidateSchema(
+            id=card.get("id", "").split("|")[-1],
+            name="Confidencial",
+            position=title_tag.get_text(strip=True) if title_tag else "Sin título",
+            url=f"https://www.occ.com.mx{href}" if href.startswith("/") else href,
+            location=location,
+            company=None,
+            skills=[],
+            experience=experience,
+            education=education
+        ))
+    return candidates
+
+
+ENGINES = ["html.parser"] + (["lxml"] if LXML_AVAILABLE else [])
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("OCC_BASE_URL", raising=False)
+    monkeypatch.setenv("OCC_SEEN_INDEX", "false")
+    monkeypatch.setenv("IDENTITY_INDEX", "false")
+    monkeypatch.setenv("OCC_PROFILE_CACHE", "false")
+
+
+@pytest.fixture
+def site():
+    return SyntheticSite(results_per_query=60)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_cards_match_baseline_except_activity(site, engine):
+    html, count = site.results("Ventas", "CDMX", 50, 1)
+    scraper = OCCScraper(parser_engine=engine, persist_session=False)
+
+    cards = scraper._parse_cards(html)
+    expected = baseline_cards(html)
+
+    assert len(cards) == len(expected) == count
+    for card, old in zip(cards, expected):
+        assert card.model_dump(exclude=CARD_FIELDS_ADDED) == old.model_dump(
+            exclude=CARD_FIELDS_ADDED
+        )
+        # Diferencia intencional: la tarjeta ahora conserva su indicador de actividad
+        assert old.last_updated is None
+        assert card.last_updated.startswith("Actualizado hace")
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("html", [
+    SyntheticSite().profile("10000042"),
+    build_profile_html(20),
+], ids=["next_data", "dom_fallback"])
+def test_partial_profile_parse_matches_full_tree(engine, html, monkeypatch):
+    scraper = OCCScraper(parser_engine=engine, persist_session=False)
+    partial = scraper._parse_candidate_html(html)
+
+    # Forzar el árbol completo para los nodos de contacto, como antes del parseo parcial
+    monkeypatch.setattr(
+        scraper.parser, "parse_by_testid", lambda content, testids: scraper.parser.parse(content)
+    )
+    full = scraper._parse_candidate_html(html)
+
+    assert partial == full
+    assert partial["name"] and partial["experience"]
+
+
+def test_engines_agree_on_profiles():
+    if not LXML_AVAILABLE:
+        pytest.skip("lxml no está instalado")
+    html = build_profile_html(20)
+
+    lxml_scraper = OCCScraper(parser_engine="lxml", persist_session=False)
+    stdlib_scraper = OCCScraper(parser_engine="html.parser", persist_session=False)
+
+    assert lxml_scraper._parse_candidate_html(html) == stdlib_scraper._parse_candidate_html(html)
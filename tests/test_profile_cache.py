@@ -0,0 +1,68 @@
+import pytest
+
+from src.domain.models import CandidateSchema
+from src.infraestructura.persistence.profile_cache import ProfileCache
+from src.infraestructura.scrapers.occ_scraper import OCCScraper
+
+PROFILE_HTML = """
+<html><body>
+<script id="__NEXT_DATA__" type="application/json">
+{"props": {"initialState": {"resume": {"resume": {
+    "name": "Ana", "surname": "López", "jobTitle": "Ventas"
+}}}}}
+</script>
+<p data-testid="contact-email__data-cv">ana@example.com</p>
+</body></html>
+"""
+
+# Muro de login: sin __NEXT_DATA__, sin data-testid de contacto ni encabezados del perfil
+LOGIN_WALL_HTML = "<html><body><form><input name='user'></form></body></html>"
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OCC_SEEN_INDEX", "false")
+    monkeypatch.setenv("IDENTITY_INDEX", "false")
+    cache = ProfileCache(path=str(tmp_path / "profiles.sqlite3"))
+    return OCCScraper(profile_cache=cache, persist_session=False)
+
+
+def make_card(candidate_id: str) -> CandidateSchema:
+    return CandidateSchema(
+        id=candidate_id,
+        name="Confidencial",
+        position="Ejecutivo de ventas",
+        url=f"https://example.com/{candidate_id}",
+        last_updated="Actualizado hace 2 días"
+    )
+
+
+def test_enriched_profile_is_cached(scraper, monkeypatch):
+    monkeypatch.setattr(scraper, "_get_candidate_html", lambda page, url: PROFILE_HTML)
+
+    enriched = scraper._enrich_one(None, make_card("a"))
+
+    assert enriched.email == "ana@example.com"
+    cached = scraper.profile_cache.get("a", "Actualizado hace 2 días")
+    assert cached["name"] == "Ana López"
+
+
+def test_empty_parse_is_not_cached(scraper, monkeypatch):
+    monkeypatch.setattr(scraper, "_get_candidate_html", lambda page, url: LOGIN_WALL_HTML)
+
+    card = make_card("a")
+    assert scraper._enrich_one(None, card) == card
+    assert scraper.profile_cache.get("a", "Actualizado hace 2 días") is None
+
+
+def test_cache_entry_expires_and_is_invalidated_by_activity(tmp_path):
+    cache = ProfileCache(path=str(tmp_path / "profiles.sqlite3"), ttl_seconds=60)
+    cache.put("a", {"name": "Ana", "experience": []}, "Actualizado hace 2 días")
+
+    assert cache.get("a", "Actualizado hace 1 día") is None
+    assert cache.stats()["invalidated"] == 1
+
+    expired = ProfileCache(path=str(tmp_path / "other.sqlite3"), ttl_seconds=0)
+    expired.put("b", {"name": "Beto", "experience": []})
+    assert expired.get("b") is None
@@ -0,0 +1,155 @@
+import threading
+
+import pytest
+
+from src.application import services
+from src.application.services import CandidateSearchService
+from src.domain.interfaces import BaseScraper
+from src.domain.models import CandidateSchema
+from src.infraestructura.persistence.search_cache import SearchResultCache
+
+
+def make_candidates(prefix: str, count: int) -> list[CandidateSchema]:
+    return [
+        CandidateSchema(
+            id=f"{prefix}-{index}", name="Confidencial", position="Ventas",
+            url=f"https://example.com/{prefix}-{index}"
+        )
+        for index in range(count)
+    ]
+
+
+class FakeScraper(BaseScraper):
+    SOURCE = "fake"
+
+    def __init__(self, prefix: str = "run", fail: bool = False, stop_reason: str | None = None):
+        self.prefix = prefix
+        self.fail = fail
+        self.run_stop_reason = stop_reason
+        self.calls = 0
+
+    def extract(self, keyword, location=None, limit=100, time_budget=None, cancel_token=None):
+        self._begin_run(time_budget, cancel_token)
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("portal caído")
+        self.stop_reason = self.run_stop_reason
+        return make_candidates(self.prefix, limit)
+
+    def _login(self, page):
+        pass
+
+    def _logout(self, page):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_identity_index(monkeypatch):
+    monkeypatch.setenv("IDENTITY_INDEX", "false")
+    monkeypatch.setattr(SearchResultCache, "_refreshing", set())
+
+
+def make_service(
+    tmp_path, scraper: FakeScraper, ttl_seconds: float = 3600
+) -> CandidateSearchService:
+    cache = SearchResultCache(path=str(tmp_path / "searches.sqlite3"), ttl_seconds=ttl_seconds)
+    service = CandidateSearchService(exporter=None, search_cache=cache)
+    service.add_scraper(scraper)
+    return service
+
+
+def wait_for_refreshes() -> None:
+    for thread in threading.enumerate():
+        if thread.name.startswith("cache-refresh-"):
+            thread.join(timeout=5)
+
+
+def test_fresh_entry_skips_the_scraper(tmp_path):
+    scraper = FakeScraper()
+    service = make_service(tmp_path, scraper)
+    service.search_cache.put("fake", "Ventas", None, 5, make_candidates("cached", 5))
+
+    results = service._cached_extract(scraper, "ventas", None, 5, None)
+
+    assert [cand.id for cand in results] == [f"cached-{index}" for index in range(5)]
+    assert scraper.calls == 0
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(tmp_path, monkeypatch):
+    scraper = FakeScraper()
+    service = make_service(tmp_path, scraper, ttl_seconds=0)
+    service.search_cache.put("fake", "Ventas", None, 5, make_candidates("cached", 5))
+    refresher = FakeScraper(prefix="refreshed")
+    monkeypatch.setattr(services, "create_scraper", lambda source, pool=None: refresher)
+
+    results = service._cached_extract(scraper, "Ventas", None, 5, None)
+    wait_for_refreshes()
+
+    assert results[0].id == "cached-0"
+    assert scraper.calls == 0 and refresher.calls == 1
+    entry = service.search_cache.get("fake", "Ventas", None, 5)
+    assert entry.candidates[0].id == "refreshed-0"
+    assert not service.search_cache._refreshing
+
+
+@pytest.mark.parametrize("outcome", [{"fail": True}, {"stop_reason": "deadline"}])
+def test_failed_or_partial_refresh_keeps_the_stale_entry(tmp_path, monkeypatch, outcome):
+    service = make_service(tmp_path, FakeScraper(), ttl_seconds=0)
+    service.search_cache.put("fake", "Ventas", None, 5, make_candidates("cached", 5))
+    refresher = FakeScraper(**outcome)
+    monkeypatch.setattr(services, "create_scraper", lambda source, pool=None: refresher)
+
+    service._cached_extract(service.scrapers[0], "Ventas", None, 5, None)
+    wait_for_refreshes()
+
+    assert service.search_cache.get("fake", "Ventas", None, 5).candidates[0].id == "cached-0"
+    # El refresco fallido libera la reserva: la siguiente búsqueda lo vuelve a intentar
+    assert not service.search_cache._refreshing
+
+
+@pytest.mark.parametrize("stop_reason", [None, "deadline"])
+def test_miss_stores_only_complete_runs(tmp_path, stop_reason):
+    scraper = FakeScraper(stop_reason=stop_reason)
+    service = make_service(tmp_path, scraper)
+
+    results = service._cached_extract(scraper, "Ventas", None, 5, None)
+
+    assert len(results) == 5
+    stored = service.search_cache.get("fake", "Ventas", None, 5)
+    assert (stored is not None) == (stop_reason is None)
+
+
+def test_refreshes_are_deduplicated_and_capped(tmp_path):
+    cache = SearchResultCache(path=str(tmp_path / "searches.sqlite3"), max_refreshes=2)
+
+    assert cache.begin_refresh("fake", "Ventas", None)
+    assert not cache.begin_refresh("fake", "ventas ", None)
+    assert cache.begin_refresh("fake", "Cobranza", None)
+    assert not cache.begin_refresh("fake", "Soporte", None)
+
+    cache.end_refresh("fake", "Ventas", None)
+    assert cache.begin_refresh("fake", "Soporte", None)
+
+
+def test_refresh_thread_is_daemon(tmp_path, monkeypatch):
+    service = make_service(tmp_path, FakeScraper(), ttl_seconds=0)
+    service.search_cache.put("fake", "Ventas", None, 5, make_candidates("cached", 5))
+    started, release = threading.Event(), threading.Event()
+    threads = []
+
+    class SlowScraper(FakeScraper):
+        def extract(self, *args, **kwargs):
+            threads.append(threading.current_thread())
+            started.set()
+            release.wait(5)
+            return super().extract(*args, **kwargs)
+
+    monkeypatch.setattr(services, "create_scraper", lambda source, pool=None: SlowScraper())
+
+    service._cached_extract(service.scrapers[0], "Ventas", None, 5, None)
+    try:
+        assert started.wait(5)
+        assert threads[0].daemon
+    finally:
+        release.set()
+        wait_for_refreshes()
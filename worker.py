@@ -0,0 +1,58 @@
+import argparse
+import os
+import sys
+import threading
+
+# Agregar el directorio raíz del proyecto al sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.application.worker import SearchWorker
+from src.infraestructura.browser.pool import BrowserPool
+from src.infraestructura.persistence.job_queue import SearchJobQueue
+from src.infraestructura.persistence.json_exporter import JsonExporter
+from src.infraestructura.scrapers.factory import create_scraper
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker de la cola de búsquedas")
+    parser.add_argument(
+        "--concurrency", type=int,
+        help="Trabajos simultáneos en este proceso (JOBS_WORKER_CONCURRENCY)"
+    )
+    parser.add_argument(
+        "--max-running", type=int,
+        help="Trabajos en ejecución entre todos los workers (JOBS_MAX_RUNNING)"
+    )
+    parser.add_argument(
+        "--portal-limits",
+        help="Trabajos simultáneos por portal, e.g. occ=2,pandape=1 (JOBS_PORTAL_LIMITS)"
+    )
+    args = parser.parse_args()
+
+    # Un pool de navegadores calientes por proceso worker, compartido por sus trabajos
+    browser_pool = None
+    if os.getenv("BROWSER_POOL", "true").lower() == "true":
+        browser_pool = BrowserPool.shared()
+        browser_pool.warm()
+
+    worker = SearchWorker(
+        SearchJobQueue(),
+        lambda source: create_scraper(source, browser_pool=browser_pool),
+        JsonExporter(),
+        concurrency=args.concurrency,
+        max_running=args.max_running,
+        portal_limits=(
+            SearchWorker.parse_portal_limits(args.portal_limits) if args.portal_limits else None
+        )
+    )
+
+    stop = threading.Event()
+    try:
+        worker.run_forever(stop)
+    except KeyboardInterrupt:
+        # Los trabajos en curso se cancelan y guardan su resultado parcial
+        print("\nDeteniendo el worker...")
+        stop.set()
+
+if __name__ == "__main__":
+    main()